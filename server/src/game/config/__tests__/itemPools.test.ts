@@ -0,0 +1,53 @@
+import { describe, expect, it } from 'vitest';
+import { ITEMS_MAP } from '../items.js';
+import { BAZAAR_ITEMS_MAP } from '../bazaar_items.js';
+import { ITEM_POOLS, buildItemPoolTable, itemPoolKey, pickFromItemPoolTable, selectItemPools } from '../itemPools.js';
+
+const ALL_ITEMS_MAP = new Map([...ITEMS_MAP, ...BAZAAR_ITEMS_MAP]);
+
+describe('ITEM_POOLS', () => {
+  it('groups every item exactly once under its (hero, tier, hasImage) key', () => {
+    const seen = new Set<string>();
+    for (const pool of ITEM_POOLS.values()) {
+      for (const id of pool.ids) {
+        const cfg = ALL_ITEMS_MAP.get(id)!;
+        expect(itemPoolKey(cfg.sourceHero, cfg.baseTier, !!cfg.image)).toBe(pool.key);
+        expect(seen.has(id)).toBe(false);
+        seen.add(id);
+      }
+    }
+    expect(seen.size).toBe(ALL_ITEMS_MAP.size);
+  });
+
+  it('selects neutral plus hero pools only', () => {
+    const pools = selectItemPools('vanessa', ['bronze'], true);
+    expect(pools.length).toBeGreaterThan(0);
+    for (const pool of pools) {
+      expect(['', 'vanessa']).toContain(pool.sourceHero);
+      expect(pool.tier).toBe('bronze');
+      expect(pool.hasImage).toBe(true);
+    }
+  });
+});
+
+describe('pickFromItemPoolTable', () => {
+  const pool = (key: string, tier: string, ids: string[]) => ({ key, sourceHero: '', tier, hasImage: true, ids });
+
+  it('maps the random value onto cumulative weights', () => {
+    const table = buildItemPoolTable(
+      [pool('|bronze|1', 'bronze', ['a', 'b']), pool('|gold|1', 'gold', ['c'])],
+      p => (p.tier === 'bronze' ? 1 : 2),
+    );
+    expect(table.total).toBe(4);
+    expect(pickFromItemPoolTable(table, 0)).toBe('a');
+    expect(pickFromItemPoolTable(table, 0.3)).toBe('b');
+    expect(pickFromItemPoolTable(table, 0.5)).toBe('c');
+    expect(pickFromItemPoolTable(table, 0.999)).toBe('c');
+  });
+
+  it('skips zero-weight pools and returns undefined for an empty table', () => {
+    const table = buildItemPoolTable([pool('|legendary|1', 'legendary', ['x'])], () => 0);
+    expect(table.size).toBe(0);
+    expect(pickFromItemPoolTable(table)).toBeUndefined();
+  });
+});
@@ -24627,3 +24627,1064 @@ export const BAZAAR_ITEMS: ItemConfig[] = [
 ];
 
 export const BAZAAR_ITEMS_MAP = new Map(BAZAAR_ITEMS.map(i => [i.itemId, i]));
+
+// 预计算的商店池：key = `${sourceHero ?? ''}|${baseTier}|${hasImage ? 1 : 0}`
+export const BAZAAR_ITEM_POOLS: Readonly<Record<string, readonly string[]>> = Object.freeze({
+  'dooley|bronze|0': Object.freeze([
+    '炫光_led',
+  ]),
+  'dooley|bronze|1': Object.freeze([
+    '微波戴夫',
+    '铁甲犰狳',
+    '齿轮',
+    '炭火科尔',
+    '等离子手雷',
+    '电动砂光机',
+    '布胶带',
+    '克里斯军刀',
+    '机械绿马蜂',
+    '炸弹小队',
+    '墙莱士',
+    '机械红焰萤',
+    '脉冲步枪',
+    '通讯卫星',
+    '哈姆锤特',
+    '特斯拉线圈',
+    '信号弹',
+    '焊接头盔',
+    '电容器',
+    '机甲鼹鼠',
+    '防爆门',
+    '病毒',
+    '焊接枪',
+    '加密货币',
+    '尖刺铁丝网',
+    '悬浮垫',
+    '铜蛇艾德',
+    '灯泡',
+    '激光手枪',
+    '感流盾',
+    '时空穿梭机',
+    '机能棒',
+    '内存卡',
+    '恐龙小锯',
+    '急救艾登',
+    '微马赫小赛车',
+    '冲锋枪',
+    '燧石',
+    '弱点探测器',
+    '电弧轰击枪',
+    '电池',
+    '火箭发射器',
+    '砖友',
+    '电钻',
+    'gpu',
+    '爪臂',
+    '利爪劳伦斯',
+  ]),
+  'dooley|diamond|1': Object.freeze([
+    '恐龙鞍',
+  ]),
+  'dooley|gold|1': Object.freeze([
+    '冰霜9000',
+    '金属废料',
+    '液氮锤',
+    '贝拉机弩',
+    '赛博保安',
+    '氮气罐',
+    '坦奇甲龙',
+    '反物质舱',
+    '妈妈暴龙',
+    '动能加农炮',
+    '手锯',
+    '特里翼龙',
+    '不稳定重力井',
+    '发射台',
+    '火焰喷射枪',
+    '叉车',
+    '战斗核心',
+    '光纤',
+    '掩体',
+    '等离子步枪',
+    '太阳能农场',
+    '多尔王主机',
+    '派对浮艇',
+    '推土比尔',
+    '愤怒气球机器人',
+    '冰能球',
+    '轨道炮',
+    '空调皮埃尔',
+    '起重机',
+    '充能站',
+    '时流屏障',
+    '冷却风扇',
+  ]),
+  'dooley|silver|0': Object.freeze([
+    '断路器_dj',
+  ]),
+  'dooley|silver|1': Object.freeze([
+    '武装核心',
+    '饮水沃特',
+    '发射核心',
+    '防御矩阵',
+    '暴击核心',
+    '主板',
+    '机械黄螳螂',
+    '艾普西隆射线',
+    '欧米伽射线',
+    '全能核心',
+    '原始核心',
+    '雷达模块',
+    '大红按钮',
+    '恐龙伪装',
+    '装甲核心',
+    'z剑',
+    '塔架',
+    '竞速卡尔',
+    '螺旋帽',
+    '巨魔龙',
+    '引燃核心',
+    '岛弹小姐',
+    '机械蓝甲虫',
+    '力场',
+    '监控摄像头',
+    '气球机器人',
+    '节拍器',
+    '热能长枪',
+    '原子钟',
+    '化学蜗牛',
+    '等容冷冻枪',
+    '悬浮科技',
+    '推进器',
+    '显示屏蜥蜴',
+    'z护盾',
+    '冷却剂',
+    '伙伴核心',
+    '阿尔法射线',
+    '液压机',
+    '结构蓝图',
+    '杜利的围巾',
+    '粗陋工具',
+    '焊炬',
+    '遥控装置',
+    '伽马射线',
+    '贝塔射线',
+    '湮灭核心',
+    '小黛暴龙',
+    '机械黑蜘蛛',
+    '焰碳体',
+    '透镜',
+  ]),
+  'jules|bronze|0': Object.freeze([
+    '米饭',
+  ]),
+  'jules|bronze|1': Object.freeze([
+    '巴努叶',
+    '黄油',
+    '饼干',
+    '烤串',
+    '陈年佳酿',
+    '黑胡椒',
+    '生日蛋糕',
+    '制备工作台',
+    '制面机',
+    '擀面杖',
+    '咖啡',
+    '草莓',
+    '火焰辣椒',
+    '烤土豆',
+    '烤肉叉',
+    '煎锅',
+    '方便面',
+    '三德刀',
+    '南瓜',
+    '海鲜钳',
+    '华丽菜刀',
+    '筷子',
+    '吐司机',
+    '饼干造型模具',
+    '漏筛',
+    '蛋',
+    '提篮',
+    '蓝莓派',
+    '锅铲',
+    '料理槌',
+    '松饼',
+    '意大利面',
+    '磨刀器',
+    '厨师帽',
+    '围裙',
+    '野行混合粮',
+    '电饭煲',
+    '刀具组',
+    '辣酱',
+    '劳劳菜',
+    '雪葩',
+    '蜂巢蜜',
+    '微波炉',
+    '醒酒器',
+    '乌鲁刀',
+  ]),
+  'jules|diamond|1': Object.freeze([
+    '烤箱',
+    '储粮柜',
+  ]),
+  'jules|gold|1': Object.freeze([
+    '餐车',
+    '泡泡糖地板',
+    '姜饼小屋',
+    '糕点车',
+    '巨龙肉排',
+    '上菜托盘',
+    '冷库',
+    '丰饶之角',
+    '烧烤架',
+    '盛宴',
+    '巨型炒锅',
+    '农贸集市',
+    '蔬菜种植园',
+    '迷你冰箱',
+    '冰箱',
+    '煮蛋器',
+    '沙滩伞',
+    '洗碗机',
+    '巨型三明治',
+  ]),
+  'jules|silver|1': Object.freeze([
+    '加热箱',
+    '金币巧克力',
+    '榨汁机',
+    '草药剪刀',
+    '食谱书',
+    '万能酱料',
+    '冷藏箱',
+    '厨房秤',
+    '蛋糕糊',
+    '打蛋器',
+    '劳雷尔堡垒',
+    '巨型菜刀',
+    '巨型棒棒糖',
+    '肉锤',
+    '轻食波奇碗',
+    '厨师机',
+    '幸运饼干',
+    '冰块',
+    '挂件组',
+    '鱼子酱',
+    '面包刀',
+    '热带野宴',
+    '冰天鹅',
+    '虹吸茶壶',
+    '腌辣椒',
+    '披萨',
+    '冰沙',
+    '卷饼',
+    '咖喱',
+    '榴莲',
+    '天外来蒜',
+    '寿司船',
+    '食盐',
+    '伊姆',
+    '切菜板',
+    '调料架',
+    '面包',
+    '披萨切刀',
+    '刨丝器',
+    '火龙瓜',
+    '什锦饭',
+    '番红花',
+    '老鼠夹',
+    '开瓶器',
+    '烤箱手套',
+    '阿扎坎乱炖',
+    '奶酪轮',
+    '搅拌机',
+    '劳雷尔的最爱',
+  ]),
+  'mak|bronze|1': Object.freeze([
+    '翡翠',
+    '黑曜石碎片',
+    '毒液',
+    '空白石碑',
+    '红宝石',
+    '嗅盐',
+    '硫磺',
+    '昏睡药水',
+    '没药',
+    '颠茄',
+    '研钵与研杵',
+    '毒蜥',
+    '真菌孢子',
+    '瓶装闪电',
+    '剑杖',
+    '猫头鹰奥利',
+    '香炉',
+    '火焰药水',
+    '水蛭',
+    '蜡烛',
+    '煅烧釜',
+    '塔兹迪亚匕首',
+    '折射棱镜',
+    '彩虹药水',
+    '云精灵',
+    '毒芹',
+    '地刺陷阱',
+    '魔法石',
+    '魔法飞毯',
+    '倒刺利爪',
+    '再生药水',
+    '拆信刀',
+    '熏香',
+    '和平铸箱',
+    '笔与墨',
+    '生命导体',
+    '黑玫瑰',
+    '曲颈甑',
+    '时间之砂',
+    '腐朽圣像',
+    '毒液注射',
+    '萤火虫',
+    '永恒火炬',
+    '炼金梨缶',
+    '离子闪电',
+    '飞蛾粉末',
+    '产药药水',
+    '鳄鱼眼泪',
+    '蛇怪之牙',
+    '贪婪渡鸦',
+    '剧毒药水',
+  ]),
+  'mak|diamond|1': Object.freeze([
+    '摆锤',
+  ]),
+  'mak|gold|1': Object.freeze([
+    '驼鹿角杖',
+    '空惧巨龙',
+    '酸液槽',
+    '冰霜之怖',
+    '勿忘死亡',
+    '罂粟花田',
+    '实验体阿尔法',
+    '火爪',
+    '活力药水',
+    '恶臭蘑菇',
+    '炼金炉',
+    '实验室',
+    '瓶装爆炸',
+    '瘟疫长柄刀',
+    '提纯阳光',
+    '大气采样仪',
+    '符文之刃',
+    '仪式匕首',
+    '镜子',
+    '魂戒',
+    '黑冰',
+    '日光矛',
+    '沸腾烧瓶',
+    '马格努斯的股骨',
+    '天平',
+    '药瓶发射器',
+    '秘密配方',
+    '空灵灰烬',
+  ]),
+  'mak|silver|1': Object.freeze([
+    '琥珀',
+    '光学强化',
+    '毒伞菇',
+    '挎包',
+    '无敌药水',
+    '箭背野猪',
+    '彩虹法杖',
+    '缩小药水',
+    '衔尾蛇雕像',
+    '蜘蛛连枷',
+    '坩埚',
+    '黏液链枷',
+    '筛盘',
+    '符文药水',
+    '巨龙吐息',
+    '飞行药水',
+    '奥秘之书',
+    '冰爪',
+    '无限药水',
+    '力量药水',
+    '蓝宝石',
+    '采掘工具',
+    '重力之石',
+    '先祖墓',
+    '雪花玻璃球',
+    '寒霜图腾',
+    '瓶装龙卷风',
+    '药房',
+    '符文巨斧',
+    '马克显微镜',
+    '沙漏',
+    '蕨叶蜘蛛',
+    '肾上腺素调节服',
+    '符文匕首',
+    '快速注射系统',
+    '耳环',
+    '蛇首手杖',
+    '油灯',
+    '注能护腕',
+    '冰霜烈焰',
+    '能量药水',
+    '符文双射弓',
+    '投掷捕兽网',
+    '药水蒸馏厂',
+    '百足鼬',
+    '魂石',
+    '地窖',
+    '霜冻药水',
+  ]),
+  'pygmalien|bronze|0': Object.freeze([
+    '黄色小圆猪_右',
+    '黄色小圆猪_邻',
+    '传家宝',
+    '橙色小圆猪_l',
+    '绿色小圆猪_左',
+    '红色小圆猪_左',
+    '蓝色小圆猪_右',
+    '蓝色小圆猪_邻',
+    '绿色小圆猪_邻',
+    '绿色小圆猪_右',
+    '黄色小圆猪_左',
+    '蓝色小圆猪_左',
+    '红色小圆猪_右',
+    '橙色小圆猪_r',
+    '橙色小圆猪_a',
+  ]),
+  'pygmalien|bronze|1': Object.freeze([
+    '回旋镖',
+    '獠牙头盔',
+    '高级橙色小圆猪',
+    '蒸汽汤勺',
+    '草叉',
+    '猪猪存钱罐',
+    '高尔夫球杆',
+    '木桨',
+    '阿特拉斯之石',
+    '链枷',
+    '曲柄杖',
+    '弹珠',
+    '辣椒喷雾',
+    '自动取款机',
+    '廓尔喀刀',
+    '壶铃',
+    '绷带',
+    '小圆猪发射器',
+    '毛坯房',
+    '高级黄色小圆猪',
+    '高级红色小圆猪',
+    '黄铜拳套',
+    '长袍',
+    '甘卓琴',
+    '乌瓦希瓦利鸟',
+    '丝绸围巾',
+    '高级绿色小圆猪',
+    '豪华桑拿炉',
+    '帝王之刃',
+    '公文包',
+    '摇钱树',
+    '果篮',
+    '收银机',
+    '铁腕战士',
+    '高级小圆猪',
+    '棘刺盾',
+    '拳台之王臂铠',
+    '短柄斧',
+    '展品柜',
+    '弹弓',
+    '火柴盒',
+    '小圆猪守卫',
+    '滚烫石块',
+    '双头刀',
+    '多肉植物',
+    '狗',
+  ]),
+  'pygmalien|diamond|1': Object.freeze([
+    '铁蒺藜',
+    '已打烊标牌',
+    '竞技场',
+    '香料',
+  ]),
+  'pygmalien|gold|1': Object.freeze([
+    '风车磨坊',
+    '算盘',
+    '双头巨锤',
+    '猪猪洗衣房',
+    '摩空大楼',
+    '蜂巢',
+    '纺织品',
+    '广告牌',
+    '双峰驼兽',
+    '地下商街',
+    '私享温泉',
+    '贾巴利战鼓',
+    '小圆猪板',
+    '狮首手杖',
+    '悠悠球',
+    '自力更升靴',
+    '巨龙牙',
+    '留声机',
+    '风暴猪猪电玩馆',
+    '钥匙串',
+    '寒冰滑道',
+    '彩绘玻璃窗',
+    '要塞',
+    '秒表',
+    '营业中标牌',
+    '28小时健身',
+    '贾巴利匕首',
+    '耶塔里亚大棒',
+    '摩天大楼',
+  ]),
+  'pygmalien|silver|0': Object.freeze([
+    'vip_通行证',
+  ]),
+  'pygmalien|silver|1': Object.freeze([
+    '展示柜',
+    '皮格健身房',
+    '木槌',
+    '冰屋',
+    '冷冻间',
+    '桑拿',
+    '茶具',
+    '景观楼',
+    '柠檬水摊',
+    '赞助服饰',
+    '饭团机',
+    '模型船',
+    '速通游戏机',
+    '单片眼镜',
+    '磨刀砂轮',
+    '当铺',
+    '葡萄园',
+    '直播设备',
+    '贾巴利反曲弓',
+    '烧钱炉',
+    '吊床',
+    '超能绿汁机',
+    '负能阻断目镜',
+    '水晶盆景',
+    '冰淇淋车',
+    '口香糖球贩售机',
+    '投矛器',
+    '工装短裤',
+    '大师之作',
+    '猪疗膏',
+    '金疗术',
+    '华丽巫师帽',
+    '极光穹顶',
+    '激光安防系统',
+    '企鹅占卜机',
+    '机动雪橇',
+    '陷阱装置',
+    '财源炮',
+  ]),
+  'stelle|bronze|1': Object.freeze([
+    '卡拉飞艇',
+    '扑翼机',
+    '飞鼠翼装',
+    '裁纸刀',
+    '火焰喷气无人机',
+    '陀螺瞄准镜',
+    '蒸汽清洗机',
+    '氧气面罩',
+    '安保无人机',
+    '护目镜',
+    '风筝',
+    '自由落体模拟器',
+    '引导灯',
+    '燃烧炸弹',
+    '爆炸机器人',
+    '飞镖',
+    '定向无人机',
+    '喷气背包',
+    '工具箱',
+    '纸飞机',
+    '气压步枪',
+    '角磨无人机',
+    '喷焊枪',
+    '气球引擎',
+    '鸡农炮',
+    '投送无人机',
+    '回收机器人',
+    '熔火弹发射器',
+    '火箭无人机',
+    '发条圆盘',
+    '望远镜',
+    '纸风车',
+    '精密卡尺',
+    '系绳',
+    '太阳能无人机',
+    '航空护目镜',
+    '空中炮塔',
+    '飞行单车',
+  ]),
+  'stelle|gold|1': Object.freeze([
+    '雷达穹顶',
+    '熔岩压路机',
+    '实验车库',
+    '炸裂旅程',
+    '维修无人机',
+    '湮灭漩涡',
+    '发射塔',
+    '天际舰',
+    '鲨鱼导弹',
+    '磁力护盾',
+    '抓取工具',
+    '悬挂滑翔翼',
+    '湮灭火炮',
+    '匕翼',
+    '聚光灯',
+    '避雷针',
+    '锤子',
+    '星辉凤蝶飞艇',
+    '扳手',
+    '破坏铁球',
+    '大块头',
+    '斯黛尔的工坊',
+    '机库',
+    '太空激光',
+    '漩涡加农炮',
+    '零件选择机器人',
+  ]),
+  'stelle|silver|1': Object.freeze([
+    '紧急弹射按钮',
+    '降落伞',
+    '冲撞气球',
+    '强化飞碟',
+    '防风外套',
+    '天气机',
+    '瑞士军刀',
+    '作战无人机',
+    '飞行员之翼',
+    '弹跳棒',
+    '钟形帽',
+    '尼可乐',
+    '压力热炉',
+    '飞行拖船',
+    '爆竹',
+    '海拔计',
+    '云端油轮',
+    '蒸汽喷管',
+    '风速仪',
+    '制图桌',
+    '作战气球',
+    '拆卸场',
+    '平衡车',
+    '液压钳',
+    '天空之锚',
+    '沙袋',
+    '西瓜虫车',
+    '警报喇叭',
+    '私人喷气机',
+    '闪电蝴蝶',
+    '寒冰炸弹',
+    '抛光机',
+    '中继无人机',
+    '消防水管',
+    '氧气罐',
+    '探寻探测器',
+    '天文台',
+    '铆钉枪',
+    '摇杆',
+    '氢气罐',
+    '螺旋桨',
+    '鸟笼',
+    '加特林机枪',
+    '机上餐点',
+    '闪光弹',
+    '信号枪',
+  ]),
+  'vanessa|bronze|1': Object.freeze([
+    '温馨海湾',
+    '湿件战服',
+    '弯刀',
+    '迷你弯刀',
+    '流星索',
+    '步枪',
+    '珍珠',
+    '拍立蚌',
+    '三花',
+    '珊瑚',
+    '雪怪蟹',
+    '食人鱼',
+    '鹦鹉皮特',
+    '宠物石',
+    '珊瑚护甲',
+    '武士刀',
+    '龙涎香',
+    '手斧',
+    '救生圈',
+    '刺刀',
+    '抓钩',
+    '星图',
+    '燃烧响炮',
+    '皮皮虾',
+    '手雷',
+    '沙滩充气球',
+    '淬锋钢',
+    '靴里剑',
+    '打火机',
+    '海底热泉',
+    '绵鳚',
+    '赛博铁尺',
+    '毒须鲶',
+    '迷幻蝠鲼',
+    '水母',
+    '火炮',
+    '鲨齿爪',
+    '火药角',
+    '葡萄弹',
+    '左轮手枪',
+    '手里剑',
+    '双管霰弹枪',
+    '水草',
+    '海螺壳',
+    '弹簧刀',
+    '渔网',
+    '鱼饵',
+    '独角鲸',
+    '狼筅',
+    '鳐鲨',
+    '木桶',
+  ]),
+  'vanessa|diamond|1': Object.freeze([
+    '雷筒',
+  ]),
+  'vanessa|gold|1': Object.freeze([
+    '火炮阵列',
+    '枪套',
+    '绊索',
+    '火药桶',
+    '巨龟托图加',
+    '刺刀手枪',
+    '海狗沙龙',
+    '电鳗',
+    '大坝',
+    '弩炮',
+    '冰山',
+    '投掷飞刀',
+    '灯塔',
+    '狙击步枪',
+    '钢琴',
+    '沉眠元初体',
+    '船锚',
+    '滚石',
+    '热带岛屿',
+    '吹箭枪',
+    '潜行滑翔机',
+    '划艇',
+  ]),
+  'vanessa|silver|0': Object.freeze([
+    '集成式_hud',
+  ]),
+  'vanessa|silver|1': Object.freeze([
+    '套娃',
+    '鱼雷',
+    '旗舰',
+    '连发步枪',
+    '带刃悬浮板',
+    '海影宝驹',
+    '码头缆索',
+    '标枪',
+    '十手',
+    '定制准镜',
+    '烙刀',
+    '锁镰',
+    '填弹杆',
+    '火枪',
+    '船长舱',
+    '通缉海报',
+    '龟壳',
+    '蔻森娜纹章',
+    '潜水头盔',
+    '仇恨水蛭',
+    '烽火',
+    '盐钳海盗',
+    '河豚',
+    '伪装',
+    '港口',
+    '元素深水炸弹',
+    '吸血章鱼',
+    '烈酒杯',
+    '锁匣',
+    '蝶剑',
+    '潜水配重',
+    '藏刃匕首',
+    '飞镖发射器',
+    '深海弯刀',
+    '小冰镐',
+    '潜艇',
+    '星盘',
+    '水车',
+    '深潜器',
+    '抛石机',
+    '风暴瓶',
+    '船舵',
+    '牌桌',
+    '橘利安',
+    '大钢弩',
+    '鱼叉',
+    '燃烧子弹',
+    '恶鬼面具',
+    '消音器',
+    '幽渊鮟鱇',
+    '理查森先生',
+  ]),
+  '|bronze|0': Object.freeze([
+    '皂沫中士',
+    '舞火大师',
+    '恶蚊',
+    '虚空巨像',
+    '美食家巧克力',
+    '幽灵辣椒',
+    '驾驶督导',
+    '毒蛇',
+    '赏金猎人',
+    '云顶海军上将',
+    '蛮猪战士',
+    '精致决斗士',
+    '椰子蟹',
+    '阿莱帕坦提乌斯',
+    '耶丹',
+    '腹语者',
+    '霜猴勇士',
+    '载体',
+    '门卫机甲',
+    '巨蚊',
+    '改装小队',
+    '寒霜查尔斯',
+    '废土领主',
+    '绿洲守护神',
+    '变异烘焙师',
+    '魔古洛斯',
+    '基石亡灵',
+    '流浪岛屿',
+    '飞车暴徒',
+    '地狱使者',
+    '动物饲养员',
+    '载宝海龟',
+    '锅炉斗士',
+    '马力亚纳斯王子',
+    '月之主',
+    '怪奇以太匠',
+    '吹箭枪陷阱',
+    '焰风勇士',
+    '觉醒街区',
+    '獠牙英格狼',
+    '铁蒺藜陷阱',
+    '放贷鲨',
+    '戈尔贡贵妇',
+    '产品演示员',
+    '武器平台',
+    '凯沃斯指挥官',
+    '贪婪窃贼',
+    '怨念和服',
+    '虚空魔像',
+    '柯玛兹',
+    '领班',
+    '垃圾镇镇长',
+    '地狱飞艇',
+    '地狱空艇',
+    '哈库维火箭兵',
+    '糖果蛇丽基特',
+    '流浪暗礁',
+    '血礁奇兵',
+    '阿肯领主',
+    '沃卡斯打手',
+    '云顶军官',
+    '暴徒',
+    '碧心守护神',
+    '哈洛老大',
+    '滚石陷阱',
+    '八臂达维',
+    '旅行代理人',
+    '三明治艺术家',
+    '巨龙',
+    '拟形怪',
+    '水晶培养室',
+    '凯沃斯雄蜂',
+    '初学学徒',
+    '火灵',
+    '地狱乡巴佬',
+    '庞大实验体',
+    '亚罕典籍',
+    '地产大亨',
+    '阿海克萨',
+    '辣火狂徒',
+    '觉醒元初体',
+    '剑齿虎',
+    '改造地狱乡巴佬',
+    '宇宙鹏鸟',
+    '老炖',
+    '炼金大师',
+    '荒原旋舞者',
+    '红色小圆猪邻',
+    '巫妖',
+    '神话典守',
+    '暴走破碎机',
+    '毒蛇暴君',
+    '垃圾泰坦',
+    '基石泣妖',
+    '菲罗斯汗',
+    '黑牛先生',
+    '焚毁机器人',
+    '垃圾魔像',
+    '快乐杰克南瓜',
+    '辉耀海盗',
+    '恐怖弗尔姆',
+    '街头玩家',
+    '发条爷爷',
+    '附属部队士兵',
+    '阴谋论者',
+    '蕉宝',
+    '漩涡博士',
+    '地狱大魔神',
+    '血礁船长',
+    '英格恐狼',
+    '退休人员',
+    '霜猴霸王',
+    '虚空骑士',
+    '精英决斗者',
+    '神庙圣物匣',
+  ]),
+  '|bronze|1': Object.freeze([
+    '毒刺',
+    '红色口香糖球',
+    '利爪',
+    '机甲暴龙',
+    '提取物',
+    '姜饼人',
+    '蓝蕉',
+    '腺体',
+    '废品场维修机器人',
+    '神秘水晶',
+    '火箭靴',
+    '简易路障',
+    '举重手套',
+    '多尔王',
+    '黄色口香糖球',
+    '金块',
+    '观光缆车',
+    '兽皮',
+    '岩浆核心',
+    '蓝色口香糖球',
+    '虫翅',
+    '糖果锁甲',
+    '大理石鳞甲',
+    '哈库维发射器',
+    '裂盾刀',
+    '獠牙',
+    '火蜥幼兽',
+    '发条刀',
+    '磨刀石',
+    '轻步靴',
+    '废品场长枪',
+    '废料',
+    '废品场大棒',
+    '超级糖浆',
+    '肉干',
+    '临时避难所',
+    '古董剑',
+    '护膝',
+    '柑橘',
+    '绿色口香糖球',
+    '铅块',
+    '椰子',
+    '临时钝器',
+    '尖刺圆盾',
+    '驯化蜘蛛',
+    '温泉',
+    '放大镜',
+    '共振水晶',
+    '催化剂',
+    '符文手斧',
+    '冰冻钝器',
+    '松露',
+    '余烬',
+    '巧克力棒',
+  ]),
+  '|diamond|1': Object.freeze([
+    '雪花',
+    '焰形剑',
+    '虚空护盾',
+    '银河翻译器',
+    '虚空干扰器',
+    '月光宝珠',
+    '汤哞冲锋枪',
+    '回声水晶',
+    '锡箔帽',
+  ]),
+  '|gold|1': Object.freeze([
+    '魔杖',
+    '复制器',
+    '曲速引擎',
+    '翻译水晶',
+    '远古标本',
+    '生体融合臂',
+    '羽毛',
+    '分解射线',
+    '凡躯之缚',
+    '以太能量导体',
+    '虚空射线',
+    '学习水晶',
+  ]),
+  '|legendary|1': Object.freeze([
+    '巨龙心',
+    '泰迪熊',
+    '焰嚎守卫',
+    '巨像之眼',
+    '日蚀号',
+    '街区之魂',
+    '上将徽章',
+    '奇点',
+    '玛伊托恩祭坛',
+    '炎蜷宝石',
+    '暗黑秘石引擎',
+    '神庙探险券',
+    '万剑之王',
+    '灵能扩散器',
+    '镰刀',
+    '坠落地点探险券',
+    '地狱巨剑',
+    '冰护守卫',
+    '红包',
+    '坦提乌斯运输舰',
+    '暗黑秘石聚能器',
+    '章鱼',
+    '毒刺守卫',
+    '霜绝祭坛',
+    '死灵书',
+  ]),
+  '|silver|1': Object.freeze([
+    '口器',
+    '寒冰特服',
+    '破冰尖镐',
+    '神经毒素',
+    '灵质',
+    '纳米机器人',
+    '巨龙翼',
+    '太空服',
+    '碾骨爪',
+    '断裂镣铐',
+    '工蜂',
+    '巨龙崽崽',
+    '失落神祇',
+    '仿生手臂',
+    '废品场弹射机',
+    '守护神之壳',
+    '友好玩偶',
+    '血瓶',
+    '牵引光束',
+    '宇宙护符',
+    '鹰之护符',
+    '宇宙炫羽',
+    '被绑架的牛',
+    '火药',
+    '巨型冰棒',
+    '时光指针',
+  ]),
+});
@@ -1,5 +1,10 @@
 export { HEROES } from './heroes.js';
 export { ITEMS, ITEMS_MAP } from './items.js';
-export { BAZAAR_ITEMS, BAZAAR_ITEMS_MAP } from './bazaar_items.js';
+export { BAZAAR_ITEMS, BAZAAR_ITEMS_MAP, BAZAAR_ITEM_POOLS } from './bazaar_items.js';
+export {
+  ITEM_TIERS, ITEM_POOLS, itemPoolKey, selectItemPools,
+  buildItemPoolTable, pickFromItemPoolTable, itemPoolTable,
+  type ItemPool, type ItemPoolTable,
+} from './itemPools.js';
 export { MONSTERS, getMonstersByDifficulty } from './monsters.js';
 export { EVENTS } from './events.js';
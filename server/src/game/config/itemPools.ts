@@ -0,0 +1,126 @@
+import type { Tier } from '@autocard/shared';
+import { ITEMS_MAP } from './items.js';
+import { BAZAAR_ITEMS_MAP, BAZAAR_ITEM_POOLS } from './bazaar_items.js';
+
+/**
+ * 商店池索引
+ * 按 (sourceHero, baseTier, hasImage) 预分组的物品 id 列表，
+ * 抽卡时按 key 取池 + 累积权重二分查找，避免每次全量过滤所有物品。
+ * 大巴扎部分由 tool/convert_card_data.py 预计算，v1 物品在加载时分组一次。
+ */
+
+export const ITEM_TIERS: readonly Tier[] = ['bronze', 'silver', 'gold', 'diamond', 'legendary'];
+
+export interface ItemPool {
+  key: string;
+  sourceHero: string;   // 通用物品为空字符串
+  tier: string;
+  hasImage: boolean;
+  ids: readonly string[];
+}
+
+export interface ItemPoolTable {
+  pools: readonly ItemPool[];
+  cumulative: readonly number[];   // 第 i 个池结束处的累积权重
+  weights: readonly number[];      // 第 i 个池中单个物品的权重
+  total: number;
+  size: number;                    // 物品总数
+}
+
+export function itemPoolKey(sourceHero: string | undefined, tier: string, hasImage: boolean): string {
+  return `${sourceHero ?? ''}|${tier}|${hasImage ? 1 : 0}`;
+}
+
+function buildItemPools(): ReadonlyMap<string, ItemPool> {
+  const grouped = new Map<string, string[]>();
+  for (const [key, ids] of Object.entries(BAZAAR_ITEM_POOLS)) {
+    grouped.set(key, [...ids]);
+  }
+  // 与 ALL_ITEMS_MAP 一致：同 id 以大巴扎数据为准；内部占位物品不进入随机池
+  for (const item of ITEMS_MAP.values()) {
+    if (BAZAAR_ITEMS_MAP.has(item.itemId) || item.itemId.startsWith('__')) continue;
+    const key = itemPoolKey(item.sourceHero, item.baseTier, !!item.image);
+    const ids = grouped.get(key);
+    if (ids) ids.push(item.itemId);
+    else grouped.set(key, [item.itemId]);
+  }
+
+  const pools = new Map<string, ItemPool>();
+  for (const [key, ids] of grouped) {
+    const [sourceHero, tier, hasImage] = key.split('|');
+    pools.set(key, Object.freeze({ key, sourceHero, tier, hasImage: hasImage === '1', ids: Object.freeze(ids) }));
+  }
+  return pools;
+}
+
+export const ITEM_POOLS = buildItemPools();
+
+const POOL_HEROES: readonly string[] = Array.from(new Set(Array.from(ITEM_POOLS.values(), p => p.sourceHero)));
+
+/**
+ * 选出符合条件的池：heroId 为空时不过滤英雄，否则为通用 + 该英雄专属；
+ * imageOnly 为 false 时包含有图与无图物品
+ */
+export function selectItemPools(heroId: string | undefined, tiers: readonly string[], imageOnly: boolean): ItemPool[] {
+  const heroes = heroId ? ['', heroId] : POOL_HEROES;
+  const imageFlags = imageOnly ? [true] : [true, false];
+  const pools: ItemPool[] = [];
+  for (const hero of heroes) {
+    for (const tier of tiers) {
+      for (const hasImage of imageFlags) {
+        const pool = ITEM_POOLS.get(itemPoolKey(hero, tier, hasImage));
+        if (pool && pool.ids.length > 0) pools.push(pool);
+      }
+    }
+  }
+  return pools;
+}
+
+/** 构建累积权重表，weightOf 给出池内单个物品的权重（默认均匀） */
+export function buildItemPoolTable(pools: readonly ItemPool[], weightOf: (pool: ItemPool) => number = () => 1): ItemPoolTable {
+  const kept: ItemPool[] = [];
+  const weights: number[] = [];
+  const cumulative: number[] = [];
+  let total = 0;
+  let size = 0;
+  for (const pool of pools) {
+    const w = weightOf(pool);
+    if (!(w > 0) || pool.ids.length === 0) continue;
+    total += w * pool.ids.length;
+    size += pool.ids.length;
+    kept.push(pool);
+    weights.push(w);
+    cumulative.push(total);
+  }
+  return { pools: kept, weights, cumulative, total, size };
+}
+
+/** 按权重随机取一个物品 id，表为空时返回 undefined */
+export function pickFromItemPoolTable(table: ItemPoolTable, r: number = Math.random()): string | undefined {
+  if (table.total <= 0) return undefined;
+  const x = r * table.total;
+  let lo = 0;
+  let hi = table.cumulative.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (table.cumulative[mid] > x) hi = mid;
+    else lo = mid + 1;
+  }
+  const pool = table.pools[lo];
+  const start = lo > 0 ? table.cumulative[lo - 1] : 0;
+  const idx = Math.floor((x - start) / table.weights[lo]);
+  return pool.ids[Math.min(Math.max(idx, 0), pool.ids.length - 1)];
+}
+
+const uniformTableCache = new Map<string, ItemPoolTable>();
+
+/** 均匀权重的池表（按条件缓存，池数据为静态配置） */
+export function itemPoolTable(heroId: string | undefined, tiers: readonly string[], imageOnly: boolean): ItemPoolTable {
+  const cacheKey = `${heroId ?? '*'}|${tiers.join(',')}|${imageOnly ? 1 : 0}`;
+  let table = uniformTableCache.get(cacheKey);
+  if (!table) {
+    table = buildItemPoolTable(selectItemPools(heroId, tiers, imageOnly));
+    uniformTableCache.set(cacheKey, table);
+  }
+  return table;
+}
@@ -11,12 +11,24 @@ import {
 import { RunModel, type IRun } from '../models/Run.js';
 import { PvpMirrorModel } from '../models/PvpMirror.js';
 import { PvpRecordModel } from '../models/PvpRecord.js';
-import { HEROES, ITEMS_MAP, BAZAAR_ITEMS_MAP, EVENTS, getMonstersByDifficulty } from '../game/config/index.js';
+import {
+  HEROES, ITEMS_MAP, BAZAAR_ITEMS_MAP, EVENTS, getMonstersByDifficulty,
+  ITEM_TIERS, buildItemPoolTable, pickFromItemPoolTable, itemPoolTable,
+  type ItemPoolTable,
+} from '../game/config/index.js';
 
 // 合并基础物品与大巴扎物品，大巴扎优先（bazaar 数据更完整）
 const ALL_ITEMS_MAP = new Map([...ITEMS_MAP, ...BAZAAR_ITEMS_MAP]);
 import { resolvePveBattle, resolveBattle } from '../game/battle.js';
 
+// 商店抽卡表缓存：key = `${heroId}|${level}`，池为静态配置，可长期复用
+interface ShopPoolTables {
+  base: ItemPoolTable;
+  weighted: ItemPoolTable;
+  members: ReadonlySet<string>;
+}
+const SHOP_POOL_CACHE = new Map<string, ShopPoolTables>();
+
 function toRunState(doc: IRun): RunState {
   return {
     id: doc._id!.toString(),
@@ -159,13 +171,11 @@ export class RunService {
       };
     }
 
-    const allItems = Array.from(ALL_ITEMS_MAP.values())
-      .filter(i => i.baseTier === 'bronze' && i.image)
-      .filter(i => !i.sourceHero || i.sourceHero === run.heroId);
-    if (allItems.length === 0) {
+    const giftPool = itemPoolTable(run.heroId, ['bronze'], true);
+    if (giftPool.size === 0) {
       // fallback: 不过滤英雄
-      const fallback = Array.from(ALL_ITEMS_MAP.values()).filter(i => i.baseTier === 'bronze');
-      const giftCfg = fallback[Math.floor(Math.random() * fallback.length)];
+      const fallbackId = pickFromItemPoolTable(itemPoolTable(undefined, ['bronze'], false))!;
+      const giftCfg = ALL_ITEMS_MAP.get(fallbackId)!;
       const freeSlot = this.findFreeSlot(run.stash, giftCfg.size);
       if (freeSlot < 0) throw new Error('储物箱已满，无法领取礼物');
       run.stash.push({
@@ -180,7 +190,7 @@ export class RunService {
       await run.save();
       return { run: toRunState(run), gift: { itemId: giftCfg.itemId } };
     }
-    const giftCfg = allItems[Math.floor(Math.random() * allItems.length)];
+    const giftCfg = ALL_ITEMS_MAP.get(pickFromItemPoolTable(giftPool)!)!;
     const freeSlot = this.findFreeSlot(run.stash, giftCfg.size);
     if (freeSlot < 0) throw new Error('储物箱已满，无法领取礼物');
 
@@ -802,24 +812,36 @@ export class RunService {
     return 0;
   }
 
-  private generateShopItems(level: number, ownedItems?: SlotItem[], heroId?: string): string[] {
-    // 从所有物品池（v1设计 + 大巴扎导入）中选牌
-    // 优先选有图片的物品，保证UI好看
-    const allItems = Array.from(ALL_ITEMS_MAP.values()).filter(i => !i.itemId.startsWith('__'));
+  private shopTiersForLevel(level: number): readonly string[] {
+    if (level < 3) return ['bronze'];
+    if (level < 5) return ['bronze', 'silver'];
+    if (level < 8) return ITEM_TIERS.filter(t => t !== 'legendary');
+    return ITEM_TIERS;
+  }
 
-    // 英雄专属过滤：通用物品 + 当前英雄专属物品
-    const heroFiltered = heroId
-      ? allItems.filter(i => !i.sourceHero || i.sourceHero === heroId)
-      : allItems;
+  private shopPoolTables(level: number, heroId?: string): ShopPoolTables {
+    const cacheKey = `${heroId ?? '*'}|${level}`;
+    const cached = SHOP_POOL_CACHE.get(cacheKey);
+    if (cached) return cached;
 
-    const withImage = heroFiltered.filter(i => i.image);
-    const pool = (withImage.length > 20 ? withImage : heroFiltered).filter(i => {
-      if (level < 3) return i.baseTier === 'bronze';
-      if (level < 5) return i.baseTier === 'bronze' || i.baseTier === 'silver';
-      if (level < 8) return i.baseTier !== 'legendary';
-      return true;
-    });
-    const base = pool.length > 0 ? pool : heroFiltered;
+    // 英雄专属过滤：通用物品 + 当前英雄专属物品；有图物品足够多时只用有图物品
+    const imageOnly = itemPoolTable(heroId, ITEM_TIERS, true).size > 20;
+    const pool = itemPoolTable(heroId, this.shopTiersForLevel(level), imageOnly);
+    const base = pool.size > 0 ? pool : itemPoolTable(heroId, ITEM_TIERS, false);
+
+    const tables: ShopPoolTables = {
+      base,
+      weighted: buildItemPoolTable(base.pools, p => this.tierPickWeight(level, p.tier)),
+      members: new Set(base.pools.flatMap(p => p.ids)),
+    };
+    SHOP_POOL_CACHE.set(cacheKey, tables);
+    return tables;
+  }
+
+  private generateShopItems(level: number, ownedItems?: SlotItem[], heroId?: string): string[] {
+    // 从预计算的商店池（v1设计 + 大巴扎导入）中选牌
+    // 优先选有图片的物品，保证UI好看
+    const { base, weighted, members } = this.shopPoolTables(level, heroId);
 
     // 升级机制：如果玩家已有卡牌，有概率刷出相同卡牌供升级
     // 收集玩家已有卡牌的 itemId（可合并的，即非 legendary）
@@ -833,38 +855,22 @@ export class RunService {
     const pickOne = (): string => {
       // 40% 概率刷出玩家已有的可升级卡牌
       if (ownedItemIds.size > 0 && Math.random() < 0.4) {
-        const upgradeable = base.filter(i => ownedItemIds.has(i.itemId));
+        const upgradeable = Array.from(ownedItemIds).filter(id => members.has(id));
         if (upgradeable.length > 0) {
-          return upgradeable[Math.floor(Math.random() * upgradeable.length)].itemId;
+          return upgradeable[Math.floor(Math.random() * upgradeable.length)];
         }
       }
-      // 正常加权随机
-      const weighted = base
-        .map(i => ({ i, w: this.tierPickWeight(level, i.baseTier) }))
-        .filter(x => x.w > 0);
-      const sum = weighted.reduce((s, x) => s + x.w, 0);
-      let r = Math.random() * (sum || 1);
-      for (const x of weighted) {
-        r -= x.w;
-        if (r <= 0) return x.i.itemId;
-      }
-      return weighted[0]?.i.itemId ?? base[Math.floor(Math.random() * base.length)].itemId;
+      // 正常加权随机：累积权重表上二分查找
+      return pickFromItemPoolTable(weighted) ?? pickFromItemPoolTable(base)!;
     };
     return [pickOne(), pickOne(), pickOne()];
   }
 
   private randomItemByTier(tier: string, heroId?: string): string {
-    const allItems = Array.from(ALL_ITEMS_MAP.values());
-    // 英雄专属过滤
-    const heroFiltered = heroId
-      ? allItems.filter(i => !i.sourceHero || i.sourceHero === heroId)
-      : allItems;
-    const candidates = heroFiltered.filter(i => i.baseTier === tier && i.image);
-    const fallback = heroFiltered.filter(i => i.baseTier === tier);
-    const pool = candidates.length > 0 ? candidates : fallback;
-    return pool.length > 0
-      ? pool[Math.floor(Math.random() * pool.length)].itemId
-      : 'u01_rusty_dagger';
+    // 英雄专属过滤 + 优先有图物品
+    const candidates = itemPoolTable(heroId, [tier], true);
+    const pool = candidates.size > 0 ? candidates : itemPoolTable(heroId, [tier], false);
+    return pickFromItemPoolTable(pool) ?? 'u01_rusty_dagger';
   }
 
   private validatePlacement(container: SlotItem[], size: number, slotIndex: number, ignoreIndex?: number) {
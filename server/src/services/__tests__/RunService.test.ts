@@ -1,5 +1,6 @@
 import { describe, expect, it, vi } from 'vitest';
 import { RunService } from '../RunService.js';
+import { BAZAAR_ITEMS_MAP, ITEMS_MAP } from '../../game/config/index.js';
 
 describe('RunService.handleHourChoice', () => {
   it('does not treat an unknown runtime choice as a free gift', async () => {
@@ -13,3 +14,44 @@ describe('RunService.handleHourChoice', () => {
     expect(getActiveRun).not.toHaveBeenCalled();
   });
 });
+
+describe('RunService shop pools', () => {
+  const ALL_ITEMS_MAP = new Map([...ITEMS_MAP, ...BAZAAR_ITEMS_MAP]);
+  const service = new RunService() as any;
+
+  it('rolls shop items from the level tiers and the hero pools only', () => {
+    const levelTiers: Array<[number, string[]]> = [
+      [1, ['bronze']],
+      [4, ['bronze', 'silver']],
+      [6, ['bronze', 'silver', 'gold', 'diamond']],
+      [9, ['bronze', 'silver', 'gold', 'diamond', 'legendary']],
+    ];
+    for (const [level, tiers] of levelTiers) {
+      for (let roll = 0; roll < 50; roll++) {
+        for (const id of service.generateShopItems(level, undefined, 'vanessa') as string[]) {
+          const cfg = ALL_ITEMS_MAP.get(id)!;
+          expect(tiers).toContain(cfg.baseTier);
+          expect(['', 'vanessa']).toContain(cfg.sourceHero ?? '');
+          expect(cfg.image).toBeTruthy();
+        }
+      }
+    }
+  });
+
+  it('only offers owned cards that are in the shop pool as upgrades', () => {
+    const owned = [{ itemId: 'not_an_item', tier: 'bronze' }];
+    for (let roll = 0; roll < 20; roll++) {
+      for (const id of service.generateShopItems(1, owned, 'vanessa') as string[]) {
+        expect(ALL_ITEMS_MAP.has(id)).toBe(true);
+      }
+    }
+  });
+
+  it('picks tier rewards of the requested tier', () => {
+    for (const tier of ['bronze', 'silver', 'gold', 'diamond', 'legendary']) {
+      const cfg = ALL_ITEMS_MAP.get(service.randomItemByTier(tier, 'dooley'))!;
+      expect(cfg.baseTier).toBe(tier);
+      expect(['', 'dooley']).toContain(cfg.sourceHero ?? '');
+    }
+  });
+});
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+卡牌平衡性分析报告
+把 parse_card_yml.py 的输出载入 NumPy 列式数组（冷却、伤害、各阶成本/售价、
+尺寸与稀有度编码、标签与英雄独热矩阵），向量化计算 DPS 与每格价值分布、
+英雄/稀有度聚合、离群卡牌和稀有度成长曲线，输出 JSON/CSV 摘要
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from convert_card_data import convert_size, convert_tier, get_source_hero, load_cards_from_db
+
+
+# 稀有度编码顺序，同时也是 cost/value 的列顺序
+TIERS = ['bronze', 'silver', 'gold', 'diamond', 'legendary']
+TIER_CODES = {tier: code for code, tier in enumerate(TIERS)}
+
+# 英雄编码顺序，最后一列为通用卡牌
+HEROES = ['vanessa', 'mak', 'jules', 'pygmalien', 'dooley', 'stelle', 'neutral']
+HERO_CODES = {hero: code for code, hero in enumerate(HEROES)}
+
+# 修正 z 分数超过该阈值视为离群（Iglewicz-Hoaglin 建议值）
+OUTLIER_Z = 3.5
+
+HISTOGRAM_BINS = 10
+PERCENTILES = [10, 25, 50, 75, 90]
+
+
+class CardColumns:
+    """卡牌的列式表示，缺失数值为 NaN"""
+
+    def __init__(self, card_data_list: List[Dict[str, Any]]):
+        n = len(card_data_list)
+        nan = float('nan')
+        self.names: List[Optional[str]] = []
+
+        # 先收集为 Python 列表，最后一次性转成数组（逐元素写 ndarray 很慢）
+        cooldown: List[float] = []
+        damage: List[float] = []
+        size: List[int] = []
+        tier: List[int] = []
+        hero: List[int] = []
+        price_rows: List[int] = []
+        price_cols: List[int] = []
+        price_kinds: List[int] = []
+        prices: List[float] = []
+
+        # 稀有度/尺寸的取值很少，按原始值缓存编码
+        tier_cache: Dict[Any, int] = {}
+        size_cache: Dict[tuple, int] = {}
+
+        # 标签独热矩阵按 (行, 列) 坐标一次性填充
+        self.tag_names: List[str] = []
+        tag_codes: Dict[str, int] = {}
+        tag_rows: List[int] = []
+        tag_cols: List[int] = []
+
+        for idx, card in enumerate(card_data_list):
+            tags = card.get('tags') or []
+            self.names.append(card.get('name'))
+
+            value = card.get('cooldown')
+            cooldown.append(value if isinstance(value, (int, float)) else nan)
+            value = card.get('damage')
+            damage.append(value if isinstance(value, (int, float)) else nan)
+
+            for kind, key in enumerate(('cost', 'value')):
+                for price_tier, price in (card.get(key) or {}).items():
+                    code = TIER_CODES.get(price_tier)
+                    if code is not None and isinstance(price, (int, float)):
+                        price_rows.append(idx)
+                        price_cols.append(code)
+                        price_kinds.append(kind)
+                        prices.append(price)
+
+            raw_tier = card.get('tier')
+            code = tier_cache.get(raw_tier)
+            if code is None:
+                code = tier_cache[raw_tier] = TIER_CODES[convert_tier(raw_tier)]
+            tier.append(code)
+
+            types = tuple(card.get('types') or ())
+            code = size_cache.get(types)
+            if code is None:
+                code = size_cache[types] = convert_size(types)
+            size.append(code)
+
+            hero.append(HERO_CODES[get_source_hero(tags) or 'neutral'])
+
+            for tag in tags:
+                code = tag_codes.get(tag)
+                if code is None:
+                    code = tag_codes[tag] = len(self.tag_names)
+                    self.tag_names.append(tag)
+                tag_rows.append(idx)
+                tag_cols.append(code)
+
+        self.cooldown = np.array(cooldown, dtype=np.float64)
+        self.damage = np.array(damage, dtype=np.float64)
+        self.size = np.array(size, dtype=np.int8)
+        self.tier = np.array(tier, dtype=np.int8)
+        self.hero = np.array(hero, dtype=np.int8)
+
+        # cost/value 为 (卡牌, 稀有度) 矩阵
+        price_table = np.full((2, n, len(TIERS)), np.nan)
+        price_table[price_kinds, price_rows, price_cols] = prices
+        self.cost, self.value = price_table
+
+        self.tags = np.zeros((n, len(self.tag_names)), dtype=bool)
+        self.tags[tag_rows, tag_cols] = True
+        self.heroes = self.hero[:, None] == np.arange(len(HEROES))
+
+    @classmethod
+    def from_json(cls, json_path) -> 'CardColumns':
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def dps(self) -> np.ndarray:
+        """每秒伤害，没有伤害或冷却的卡牌为 NaN"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.cooldown > 0, self.damage / self.cooldown, np.nan)
+
+    def base_value(self) -> np.ndarray:
+        """起始稀有度的售价；该阶缺失时取最低一阶已知售价"""
+        at_tier = self.value[np.arange(len(self)), self.tier]
+        known = ~np.isnan(self.value)
+        first = np.where(known.any(axis=1), known.argmax(axis=1), 0)
+        fallback = np.where(known.any(axis=1), self.value[np.arange(len(self)), first], np.nan)
+        return np.where(np.isnan(at_tier), fallback, at_tier)
+
+    def value_per_slot(self) -> np.ndarray:
+        return self.base_value() / self.size
+
+
+def distribution(values: np.ndarray) -> Dict[str, Any]:
+    """数值分布：计数、均值、分位数与等宽直方图（忽略 NaN）"""
+    finite = values[~np.isnan(values)]
+    if not finite.size:
+        return {'count': 0}
+
+    percentiles = np.percentile(finite, PERCENTILES)
+    counts, edges = np.histogram(finite, bins=HISTOGRAM_BINS)
+    return {
+        'count': int(finite.size),
+        'mean': round(float(finite.mean()), 4),
+        'std': round(float(finite.std()), 4),
+        'min': round(float(finite.min()), 4),
+        'max': round(float(finite.max()), 4),
+        'percentiles': {f'p{p}': round(float(v), 4) for p, v in zip(PERCENTILES, percentiles)},
+        'histogram': {'edges': [round(float(e), 4) for e in edges], 'counts': counts.tolist()},
+    }
+
+
+def masked_means(onehot: np.ndarray, values: np.ndarray) -> tuple:
+    """对独热矩阵的每一列求 values 的均值，返回 (均值, 有效计数)"""
+    known = ~np.isnan(values)
+    weights = onehot & known[:, None]
+    counts = weights.sum(axis=0)
+    sums = np.where(known, values, 0.0) @ weights
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan), counts
+
+
+def grouped_stats(group: np.ndarray, n_groups: int, values: np.ndarray) -> tuple:
+    """按整数分组编码聚合 values，返回 (均值, 有效计数)，忽略 NaN"""
+    known = ~np.isnan(values)
+    counts = np.bincount(group[known], minlength=n_groups)
+    sums = np.bincount(group[known], weights=values[known], minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan), counts
+
+
+def _round(value) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def hero_tier_aggregates(columns: CardColumns, metrics: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """每个 (英雄, 稀有度) 组合的卡牌数与各指标均值"""
+    n_groups = len(HEROES) * len(TIERS)
+    group = columns.hero.astype(np.int64) * len(TIERS) + columns.tier
+    card_counts = np.bincount(group, minlength=n_groups)
+    means = {name: grouped_stats(group, n_groups, values)[0] for name, values in metrics.items()}
+
+    rows = []
+    for code in np.flatnonzero(card_counts):
+        row = {'hero': HEROES[code // len(TIERS)], 'tier': TIERS[code % len(TIERS)],
+               'count': int(card_counts[code])}
+        for name, mean in means.items():
+            row[f'{name}_mean'] = _round(mean[code])
+        rows.append(row)
+    return rows
+
+
+def onehot_aggregates(onehot: np.ndarray, labels: List[str],
+                      metrics: Dict[str, np.ndarray], min_count: int = 1) -> List[Dict[str, Any]]:
+    """独热矩阵每一列（英雄/标签）的卡牌数与各指标均值"""
+    card_counts = onehot.sum(axis=0)
+    means = {name: masked_means(onehot, values)[0] for name, values in metrics.items()}
+
+    rows = []
+    for col in np.argsort(-card_counts, kind='stable'):
+        if card_counts[col] < min_count:
+            continue
+        row = {'label': labels[col], 'count': int(card_counts[col])}
+        for name, mean in means.items():
+            row[f'{name}_mean'] = _round(mean[col])
+        rows.append(row)
+    return rows
+
+
+def find_outliers(columns: CardColumns, values: np.ndarray, metric: str, limit: int = 20) -> List[Dict[str, Any]]:
+    """同稀有度内按中位数/MAD 的修正 z 分数找离群卡牌"""
+    known = ~np.isnan(values)
+    z = np.full(len(columns), np.nan)
+    for code in range(len(TIERS)):
+        members = known & (columns.tier == code)
+        if members.sum() < 3:
+            continue
+        sample = values[members]
+        median = np.median(sample)
+        mad = np.median(np.abs(sample - median))
+        if mad == 0:
+            continue
+        z[members] = 0.6745 * (sample - median) / mad
+
+    flagged = np.flatnonzero(np.abs(np.nan_to_num(z)) > OUTLIER_Z)
+    flagged = flagged[np.argsort(-np.abs(z[flagged]), kind='stable')][:limit]
+    return [{
+        'name': columns.names[idx],
+        'hero': HEROES[columns.hero[idx]],
+        'tier': TIERS[columns.tier[idx]],
+        'metric': metric,
+        'value': round(float(values[idx]), 4),
+        'z': round(float(z[idx]), 2),
+    } for idx in flagged]
+
+
+def tier_scaling(columns: CardColumns) -> List[Dict[str, Any]]:
+    """各阶成本/售价均值，以及相邻两阶的中位倍率（只统计两阶都有价格的卡牌）"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cost_ratio = columns.cost[:, 1:] / columns.cost[:, :-1]
+        value_ratio = columns.value[:, 1:] / columns.value[:, :-1]
+
+    curve = []
+    for code, tier in enumerate(TIERS):
+        cost = columns.cost[:, code]
+        value = columns.value[:, code]
+        point = {
+            'tier': tier,
+            'priced_cards': int((~np.isnan(cost)).sum()),
+            'cost_mean': _round(np.nanmean(cost)) if (~np.isnan(cost)).any() else None,
+            'value_mean': _round(np.nanmean(value)) if (~np.isnan(value)).any() else None,
+            'cost_ratio_median': None,
+            'value_ratio_median': None,
+        }
+        if code > 0:
+            for key, ratios in (('cost_ratio_median', cost_ratio[:, code - 1]),
+                                ('value_ratio_median', value_ratio[:, code - 1])):
+                finite = ratios[np.isfinite(ratios)]
+                if finite.size:
+                    point[key] = round(float(np.median(finite)), 4)
+        curve.append(point)
+    return curve
+
+
+def build_report(columns: CardColumns, tag_min_count: int = 5, outlier_limit: int = 20) -> Dict[str, Any]:
+    """生成完整平衡性报告"""
+    dps = columns.dps()
+    value_per_slot = columns.value_per_slot()
+    metrics = {
+        'cooldown': columns.cooldown,
+        'dps': dps,
+        'dps_per_slot': dps / columns.size,
+        'value_per_slot': value_per_slot,
+    }
+
+    return {
+        'cards': len(columns),
+        'distributions': {
+            'dps': distribution(dps),
+            'dps_per_slot': distribution(metrics['dps_per_slot']),
+            'value_per_slot': distribution(value_per_slot),
+        },
+        'by_hero': onehot_aggregates(columns.heroes, HEROES, metrics),
+        'by_hero_tier': hero_tier_aggregates(columns, metrics),
+        'by_tag': onehot_aggregates(columns.tags, columns.tag_names, metrics, tag_min_count),
+        'outliers': (find_outliers(columns, metrics['dps_per_slot'], 'dps_per_slot', outlier_limit)
+                     + find_outliers(columns, value_per_slot, 'value_per_slot', outlier_limit)),
+        'tier_scaling': tier_scaling(columns),
+    }
+
+
+def write_csv(report: Dict[str, Any], csv_path):
+    """把英雄×稀有度聚合表写成CSV"""
+    rows = report['by_hero_tier']
+    if not rows:
+        return
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def synthetic_cards(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """生成与 cards_data.json 同结构的合成卡牌，用于压力测试"""
+    rng = random.Random(seed)
+    heroes = ['Vanessa', 'Mak', 'Jules', 'Pygmalien', 'Dooley', 'Stelle', None]
+    sizes = ['Small', 'Medium', 'Large']
+    tiers = ['Bronze', 'Silver', 'Gold', 'Diamond', 'Legendary']
+    keywords = ['Damage', 'Poison', 'Burn', 'Heal', 'Shield', 'Haste', 'Slow', 'Freeze', 'Charge', 'Weapon']
+
+    cards = []
+    for i in range(count):
+        hero = rng.choice(heroes)
+        size = rng.choice(sizes)
+        tier_code = rng.randrange(4)
+        tags = [f'{tiers[tier_code]}+', 'Item', size] + ([hero] if hero else [])
+        tags += rng.sample(keywords, rng.randint(1, 3))
+        base = rng.randint(1, 4) * (sizes.index(size) + 1)
+        priced = {tier.lower(): base * 2 ** k for k, tier in enumerate(tiers[tier_code:4])}
+        cards.append({
+            'name': f'合成卡牌{i}',
+            'types': [size] + ([hero] if hero else []) + ['Item'],
+            'tier': tiers[tier_code],
+            'cooldown': float(rng.choice([2, 3, 4, 5, 6, 8])) if rng.random() < 0.9 else None,
+            'damage': rng.randint(5, 120) if 'Damage' in tags else None,
+            'tags': tags,
+            'cost': priced,
+            'value': {tier: price // 2 for tier, price in priced.items()},
+        })
+    return cards
+
+
+def print_summary(report: Dict[str, Any]):
+    """打印报告摘要"""
+    print("=" * 60)
+    print("卡牌平衡性分析")
+    print("=" * 60)
+    print(f"总卡牌数: {report['cards']}")
+
+    for name, dist in report['distributions'].items():
+        if dist['count']:
+            p = dist['percentiles']
+            print(f"{name}: n={dist['count']} 均值={dist['mean']} p10={p['p10']} p50={p['p50']} p90={p['p90']}")
+
+    print("\n按英雄:")
+    for row in report['by_hero']:
+        print(f"  {row['label']}: {row['count']} 张, DPS均值={row['dps_mean']}, 每格价值={row['value_per_slot_mean']}")
+
+    print("\n稀有度成长:")
+    for point in report['tier_scaling']:
+        print(f"  {point['tier']}: 成本={point['cost_mean']} 售价={point['value_mean']} "
+              f"成本倍率={point['cost_ratio_median']}")
+
+    print(f"\n离群卡牌: {len(report['outliers'])}")
+    for outlier in report['outliers'][:10]:
+        print(f"  {outlier['name']} ({outlier['hero']}/{outlier['tier']}) "
+              f"{outlier['metric']}={outlier['value']} z={outlier['z']}")
+    print("=" * 60)
+
+
+def main():
+    """主函数"""
+    project_root = Path(__file__).parent.parent
+    default_path = project_root / "tool" / "down_card_db" / "cards_data.json"
+
+    arg_parser = argparse.ArgumentParser(description="卡牌平衡性分析报告")
+    arg_parser.add_argument('cards_data', nargs='?', default=str(default_path), help="cards_data.json 路径")
+    arg_parser.add_argument('--db', help="从SQLite数据库读取卡牌（替代 cards_data.json）")
+    arg_parser.add_argument('--synthetic', type=int, metavar='N', help="改用 N 张合成卡牌（压力测试）")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--json', help="输出JSON报告路径")
+    arg_parser.add_argument('--csv', help="输出英雄×稀有度聚合CSV路径")
+    arg_parser.add_argument('--tag-min-count', type=int, default=5, help="标签聚合的最少卡牌数")
+    arg_parser.add_argument('--outliers', type=int, default=20, help="每个指标最多列出的离群卡牌数")
+    args = arg_parser.parse_args()
+
+    if args.synthetic:
+        card_data_list = synthetic_cards(args.synthetic, args.seed)
+    elif args.db:
+        card_data_list = load_cards_from_db(args.db)
+    else:
+        if not Path(args.cards_data).exists():
+            print(f"错误: 文件不存在 {args.cards_data}")
+            sys.exit(1)
+        with open(args.cards_data, 'r', encoding='utf-8') as f:
+            card_data_list = json.load(f)
+
+    start = time.perf_counter()
+    columns = CardColumns(card_data_list)
+    loaded = time.perf_counter()
+    report = build_report(columns, args.tag_min_count, args.outliers)
+    finished = time.perf_counter()
+
+    print_summary(report)
+    print(f"列式载入: {loaded - start:.3f}s, 分析: {finished - loaded:.3f}s")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"JSON报告: {args.json}")
+    if args.csv:
+        write_csv(report, args.csv)
+        print(f"CSV报告: {args.csv}")
+
+
+if __name__ == "__main__":
+    main()
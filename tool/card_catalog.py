@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+卡牌目录查询模块
+基于 parse_card_yml.py 的输出一次性构建倒排索引与有序数组，
+供平衡性分析、商店池等工具做批量组合查询
+"""
+
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from convert_card_data import convert_size, convert_tier, get_source_hero
+
+
+# 不作为分类的类型词（与 convert_card_data.py 保持一致）
+SIZE_TYPES = ['Small', 'Medium', 'Large', 'Item']
+
+# 支持范围查询的数值字段
+RANGE_FIELDS = ['cooldown', 'damage', 'price']
+
+
+class CardQuery:
+    """可组合的过滤条件，执行时对各倒排表求交集"""
+
+    def __init__(self, catalog: 'CardCatalog'):
+        self.catalog = catalog
+        self.postings: List[frozenset] = []
+
+    def _add(self, posting: Iterable[int]) -> 'CardQuery':
+        self.postings.append(posting if isinstance(posting, frozenset) else frozenset(posting))
+        return self
+
+    def tag(self, *tags: str) -> 'CardQuery':
+        """同时拥有全部给定标签"""
+        for tag in tags:
+            self._add(self.catalog.by_tag.get(tag, ()))
+        return self
+
+    def any_tag(self, *tags: str) -> 'CardQuery':
+        """拥有任一给定标签"""
+        return self._add(self.catalog.union(self.catalog.by_tag, tags))
+
+    def hero(self, *heroes: Optional[str]) -> 'CardQuery':
+        """属于任一给定英雄，None 表示通用卡牌"""
+        return self._add(self.catalog.union(self.catalog.by_hero, heroes))
+
+    def tier(self, *tiers: str) -> 'CardQuery':
+        """属于任一给定稀有度（bronze/silver/...）"""
+        return self._add(self.catalog.union(self.catalog.by_tier, tiers))
+
+    def size(self, *sizes: int) -> 'CardQuery':
+        """占用任一给定格数（1/2/3）"""
+        return self._add(self.catalog.union(self.catalog.by_size, sizes))
+
+    def type(self, *types: str) -> 'CardQuery':
+        """同时拥有全部给定类型"""
+        for card_type in types:
+            self._add(self.catalog.by_type.get(card_type, ()))
+        return self
+
+    def between(self, field: str, min_value: Optional[float] = None,
+                max_value: Optional[float] = None) -> 'CardQuery':
+        """数值字段落在闭区间 [min_value, max_value] 内，缺失值不参与匹配"""
+        return self._add(self.catalog.range(field, min_value, max_value))
+
+    def cooldown(self, min_value: Optional[float] = None, max_value: Optional[float] = None) -> 'CardQuery':
+        return self.between('cooldown', min_value, max_value)
+
+    def damage(self, min_value: Optional[float] = None, max_value: Optional[float] = None) -> 'CardQuery':
+        return self.between('damage', min_value, max_value)
+
+    def price(self, min_value: Optional[float] = None, max_value: Optional[float] = None) -> 'CardQuery':
+        return self.between('price', min_value, max_value)
+
+    def ids(self) -> List[int]:
+        """返回匹配卡牌的下标（升序）"""
+        if not self.postings:
+            return list(range(len(self.catalog.cards)))
+
+        # 从最短的倒排表开始求交，尽早缩小候选集
+        postings = sorted(self.postings, key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result &= posting
+        return sorted(result)
+
+    def cards(self) -> List[Dict[str, Any]]:
+        """返回匹配的卡牌数据"""
+        return [self.catalog.cards[i] for i in self.ids()]
+
+    def names(self) -> List[str]:
+        """返回匹配的卡牌名称"""
+        return [self.catalog.cards[i].get('name') for i in self.ids()]
+
+    def count(self) -> int:
+        return len(self.ids())
+
+
+class CardCatalog:
+    """卡牌目录：倒排索引 + 有序数组"""
+
+    def __init__(self, card_data_list: List[Dict[str, Any]]):
+        self.cards = card_data_list
+
+        # 预先计算的派生属性，避免每次查询重复推导
+        self.heroes: List[Optional[str]] = []
+        self.tiers: List[str] = []
+        self.sizes: List[int] = []
+        self.prices: List[int] = []
+
+        self.by_name: Dict[str, int] = {}
+        self.by_tag: Dict[str, frozenset] = {}
+        self.by_hero: Dict[Optional[str], frozenset] = {}
+        self.by_tier: Dict[str, frozenset] = {}
+        self.by_size: Dict[int, frozenset] = {}
+        self.by_type: Dict[str, frozenset] = {}
+
+        # field -> (有序数值, 对应卡牌下标)
+        self.sorted_values: Dict[str, tuple] = {}
+
+        self._build()
+
+    @classmethod
+    def from_json(cls, json_path) -> 'CardCatalog':
+        """从 cards_data.json 构建目录"""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _build(self):
+        """一次遍历建立全部索引"""
+        postings = {
+            'tag': {}, 'hero': {}, 'tier': {}, 'size': {}, 'type': {},
+        }
+        numeric = {field: [] for field in RANGE_FIELDS}
+
+        for idx, card in enumerate(self.cards):
+            tags = card.get('tags') or []
+            types = card.get('types') or []
+
+            hero = get_source_hero(tags)
+            tier = convert_tier(card.get('tier'))
+            size = convert_size(types)
+            price = (card.get('cost') or {}).get('silver', 3)
+
+            self.heroes.append(hero)
+            self.tiers.append(tier)
+            self.sizes.append(size)
+            self.prices.append(price)
+
+            name = card.get('name')
+            if name and name not in self.by_name:
+                self.by_name[name] = idx
+
+            for tag in set(tags):
+                postings['tag'].setdefault(tag, []).append(idx)
+            for card_type in set(types):
+                postings['type'].setdefault(card_type, []).append(idx)
+            postings['hero'].setdefault(hero, []).append(idx)
+            postings['tier'].setdefault(tier, []).append(idx)
+            postings['size'].setdefault(size, []).append(idx)
+
+            values = {
+                'cooldown': card.get('cooldown'),
+                'damage': card.get('damage'),
+                'price': price,
+            }
+            for field, value in values.items():
+                if isinstance(value, (int, float)):
+                    numeric[field].append((value, idx))
+
+        self.by_tag = {k: frozenset(v) for k, v in postings['tag'].items()}
+        self.by_hero = {k: frozenset(v) for k, v in postings['hero'].items()}
+        self.by_tier = {k: frozenset(v) for k, v in postings['tier'].items()}
+        self.by_size = {k: frozenset(v) for k, v in postings['size'].items()}
+        self.by_type = {k: frozenset(v) for k, v in postings['type'].items()}
+
+        for field, pairs in numeric.items():
+            pairs.sort()
+            self.sorted_values[field] = (
+                [value for value, _ in pairs],
+                [idx for _, idx in pairs],
+            )
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def query(self) -> CardQuery:
+        """创建新的组合查询"""
+        return CardQuery(self)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """按中文名查找卡牌"""
+        idx = self.by_name.get(name)
+        return self.cards[idx] if idx is not None else None
+
+    def union(self, index: Dict[Any, frozenset], keys: Iterable[Any]) -> frozenset:
+        """合并多个键的倒排表"""
+        result = frozenset()
+        for key in keys:
+            result = result | index.get(key, frozenset())
+        return result
+
+    def range(self, field: str, min_value: Optional[float] = None,
+              max_value: Optional[float] = None) -> frozenset:
+        """在有序数组上二分查找闭区间内的卡牌下标"""
+        if field not in self.sorted_values:
+            raise ValueError(f"不支持范围查询的字段: {field}")
+
+        values, indices = self.sorted_values[field]
+        lo = 0 if min_value is None else bisect_left(values, min_value)
+        hi = len(values) if max_value is None else bisect_right(values, max_value)
+        return frozenset(indices[lo:hi])
+
+    def categories(self, idx: int) -> List[str]:
+        """卡牌分类（去掉尺寸与 Item 的类型）"""
+        return [t for t in self.cards[idx].get('types') or [] if t not in SIZE_TYPES]
+
+    def print_summary(self):
+        """打印索引摘要"""
+        print("=" * 60)
+        print("卡牌目录索引摘要")
+        print("=" * 60)
+        print(f"总卡牌数: {len(self.cards)}")
+        print(f"标签数: {len(self.by_tag)}")
+        print(f"类型数: {len(self.by_type)}")
+
+        print("\n按英雄:")
+        for hero, posting in sorted(self.by_hero.items(), key=lambda kv: -len(kv[1])):
+            print(f"  {hero or '通用'}: {len(posting)}")
+
+        print("\n按稀有度:")
+        for tier, posting in sorted(self.by_tier.items(), key=lambda kv: -len(kv[1])):
+            print(f"  {tier}: {len(posting)}")
+
+        print("\n按尺寸:")
+        for size, posting in sorted(self.by_size.items()):
+            print(f"  {size}: {len(posting)}")
+        print("=" * 60)
+
+
+def main():
+    """主函数"""
+    project_root = Path(__file__).parent.parent
+    default_path = project_root / "tool" / "down_card_db" / "cards_data.json"
+    cards_data_path = Path(sys.argv[1]) if len(sys.argv) > 1 else default_path
+
+    if not cards_data_path.exists():
+        print(f"错误: 文件不存在 {cards_data_path}")
+        return
+
+    catalog = CardCatalog.from_json(cards_data_path)
+    catalog.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,19 @@
 从 tool/down_card_db/ 读取数据并整合到游戏项目中
 """
 
+import argparse
 import json
 import os
 import shutil
 import re
+import sys
+import time
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent / "down_card_db"))
+from image_store import file_sha256  # noqa: E402
+from profiling import Profiler, add_profile_arguments  # noqa: E402
+
 
 def sanitize_filename(name):
     """清理文件名中的特殊字符"""
@@ -94,127 +101,140 @@ def convert_port_type(effect, tags, damage):
     return ports
 
 
-def main():
-    """主函数"""
-    print("=" * 60)
-    print("卡牌数据转换工具")
-    print("=" * 60)
+def build_item_pools(items_config):
+    """
+    按 (sourceHero, baseTier, hasImage) 预计算商店池
+    key 格式为 `英雄|稀有度|是否有图`，通用物品的英雄部分为空
+    """
+    # 与 BAZAAR_ITEMS_MAP 一致：同名 itemId 以最后一条为准
+    latest = {}
+    for item in items_config:
+        latest[item['itemId']] = item
 
-    # 路径设置
-    project_root = Path(__file__).parent.parent
-    tool_dir = project_root / "tool"
-    down_card_db_dir = tool_dir / "down_card_db"
-    cards_data_path = down_card_db_dir / "cards_data.json"
-    images_src_dir = down_card_db_dir / "images"
-    images_dest_dir = project_root / "client" / "public" / "assets" / "cards"
+    pools = {}
+    for item_id, item in latest.items():
+        key = f"{item.get('sourceHero') or ''}|{item['baseTier']}|{1 if item.get('image') else 0}"
+        pools.setdefault(key, []).append(item_id)
 
-    # 确保目标目录存在
-    images_dest_dir.mkdir(parents=True, exist_ok=True)
+    return dict(sorted(pools.items()))
 
-    # 读取卡牌数据
-    if not cards_data_path.exists():
-        print(f"错误: 文件不存在 {cards_data_path}")
-        return
 
-    with open(cards_data_path, 'r', encoding='utf-8') as f:
-        card_data_list = json.load(f)
-
-    print(f"\n读取到 {len(card_data_list)} 张卡牌数据\n")
-
-    # 复制图片文件并生成配置
-    items_config = []
-    image_count = 0
-
-    for card_data in card_data_list:
-        name = card_data.get('name', 'Unknown')
-        name_en = card_data.get('name_en')
-        types = card_data.get('types', [])
-        tags = card_data.get('tags', [])
-        tier = card_data.get('tier')
-        cooldown = card_data.get('cooldown', 3)
-        damage = card_data.get('damage')
-        effect = card_data.get('effect', '')
-        cost = card_data.get('cost', {})
-
-        # 生成itemId
-        item_id = re.sub(r'\s+', '_', name.lower())
-        item_id = re.sub(r'[^\w]', '', item_id)
-
-        # 查找图片文件
-        image_filename = None
-        # 尝试可能的图片文件名
-        possible_names = [name]
-        if name_en:
-            possible_names.append(name_en)
-            possible_names.append(name_en.replace(' ', '-'))
-
-        for img_name in possible_names:
-            for ext in ['.webp', '.jpg', '.jpeg', '.png']:
-                src_path = images_src_dir / (sanitize_filename(img_name) + ext)
-                if src_path.exists():
-                    image_filename = sanitize_filename(img_name) + ext
-                    break
-            if image_filename:
-                break
-
-        # 复制图片
-        if image_filename:
-            src_path = images_src_dir / image_filename
-            dest_path = images_dest_dir / image_filename
-            if not dest_path.exists():
-                shutil.copy2(src_path, dest_path)
-            image_count += 1
-
-        # 生成配置
-        size = convert_size(types)
-        base_tier = convert_tier(tier)
-        price = cost.get('silver', 3)  # 默认价格
-        source_hero = get_source_hero(tags)
-
-        # 处理描述
-        description = effect or f"{name} 卡牌"
-        # 清理描述中的英文前缀
-        if ' is a ' in description:
-            description = description.split(' is a ')[0]
-        if '. Its starting tier is' in description:
-            description = description.split('. Its starting tier is')[0]
-
-        # 生成端口
-        ports = convert_port_type(effect, tags, damage)
-
-        # 生成分类标签
-        categories = []
-        for t in types:
-            if t not in ['Small', 'Medium', 'Large', 'Item']:
-                categories.append(t)
-
-        item_config = {
-            'itemId': item_id,
-            'name': name,
-            'nameEn': name_en,
-            'description': description,
-            'size': size,
-            'baseTier': base_tier,
-            'price': price,
-            'cooldown': cooldown if cooldown else 3,
-            'ports': ports,
-            'targetRule': {'kind': 'self'},
-            'tags': tags,
-            'categories': categories,
-        }
-
-        if source_hero:
-            item_config['sourceHero'] = source_hero
-
-        if image_filename:
-            item_config['image'] = f"/assets/cards/{image_filename}"
-
-        items_config.append(item_config)
-        print(f"  ✓ {name} {'(+image)' if image_filename else ''}")
-
-    # 生成 TypeScript 文件
-    output_ts_path = project_root / "server" / "src" / "game" / "config" / "bazaar_items.ts"
+def find_image_filename(name, name_en, images_src_dir):
+    """查找卡牌对应的图片文件名，未找到返回 None"""
+    # 尝试可能的图片文件名
+    possible_names = [name]
+    if name_en:
+        possible_names.append(name_en)
+        possible_names.append(name_en.replace(' ', '-'))
+
+    for img_name in possible_names:
+        for ext in ['.webp', '.jpg', '.jpeg', '.png']:
+            src_path = images_src_dir / (sanitize_filename(img_name) + ext)
+            if src_path.exists():
+                return sanitize_filename(img_name) + ext
+    return None
+
+
+def load_image_hashes(images_src_dir):
+    """
+    读取图片仓库清单（fetch_page.py 写入的 images/manifest.json）
+    返回 文件名 -> SHA-256，没有清单时返回空字典
+    """
+    manifest_path = images_src_dir / "manifest.json"
+    if not manifest_path.exists():
+        return {}
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    return {f"{name}{entry['ext']}": entry['sha256'] for name, entry in manifest.items()}
+
+
+def copy_card_image(image_filename, images_src_dir, images_dest_dir, image_hashes=None):
+    """
+    同步图片到客户端资源目录
+    有清单哈希时按内容比较，内容变化才复制；否则已存在即跳过
+    """
+    src_path = images_src_dir / image_filename
+    dest_path = images_dest_dir / image_filename
+    expected = (image_hashes or {}).get(image_filename)
+
+    if dest_path.exists():
+        if expected is None or os.path.samefile(src_path, dest_path) or file_sha256(dest_path) == expected:
+            return False
+
+    shutil.copy2(src_path, dest_path)
+    return True
+
+
+def convert_card(card_data, images_src_dir, images_dest_dir, image_hashes=None):
+    """将单张卡牌数据转换为游戏物品配置（同时同步图片）"""
+    name = card_data.get('name', 'Unknown')
+    name_en = card_data.get('name_en')
+    types = card_data.get('types', [])
+    tags = card_data.get('tags', [])
+    tier = card_data.get('tier')
+    cooldown = card_data.get('cooldown', 3)
+    damage = card_data.get('damage')
+    effect = card_data.get('effect', '')
+    cost = card_data.get('cost', {})
+
+    # 生成itemId
+    item_id = re.sub(r'\s+', '_', name.lower())
+    item_id = re.sub(r'[^\w]', '', item_id)
+
+    # 查找并复制图片文件
+    image_filename = find_image_filename(name, name_en, images_src_dir)
+    if image_filename:
+        copy_card_image(image_filename, images_src_dir, images_dest_dir, image_hashes)
+
+    # 生成配置
+    size = convert_size(types)
+    base_tier = convert_tier(tier)
+    price = cost.get('silver', 3)  # 默认价格
+    source_hero = get_source_hero(tags)
+
+    # 处理描述
+    description = effect or f"{name} 卡牌"
+    # 清理描述中的英文前缀
+    if ' is a ' in description:
+        description = description.split(' is a ')[0]
+    if '. Its starting tier is' in description:
+        description = description.split('. Its starting tier is')[0]
+
+    # 生成端口
+    ports = convert_port_type(effect, tags, damage)
+
+    # 生成分类标签
+    categories = []
+    for t in types:
+        if t not in ['Small', 'Medium', 'Large', 'Item']:
+            categories.append(t)
+
+    item_config = {
+        'itemId': item_id,
+        'name': name,
+        'nameEn': name_en,
+        'description': description,
+        'size': size,
+        'baseTier': base_tier,
+        'price': price,
+        'cooldown': cooldown if cooldown else 3,
+        'ports': ports,
+        'targetRule': {'kind': 'self'},
+        'tags': tags,
+        'categories': categories,
+    }
+
+    if source_hero:
+        item_config['sourceHero'] = source_hero
+
+    if image_filename:
+        item_config['image'] = f"/assets/cards/{image_filename}"
+
+    return item_config
+
 
+def render_items_ts(items_config):
+    """生成 bazaar_items.ts 文件内容"""
     ts_content = '''import type { ItemConfig } from '@autocard/shared';
 
 // 从 BazaarDB 导入的卡牌数据
@@ -272,16 +292,334 @@ export const BAZAAR_ITEMS: ItemConfig[] = [
 export const BAZAAR_ITEMS_MAP = new Map(BAZAAR_ITEMS.map(i => [i.itemId, i]));
 '''
 
-    with open(output_ts_path, 'w', encoding='utf-8') as f:
-        f.write(ts_content)
+    # 商店池索引：运行时按 key 直接取池，无需全量过滤
+    item_pools = build_item_pools(items_config)
+    ts_content += '''
+// 预计算的商店池：key = `${sourceHero ?? ''}|${baseTier}|${hasImage ? 1 : 0}`
+export const BAZAAR_ITEM_POOLS: Readonly<Record<string, readonly string[]>> = Object.freeze({
+'''
+    for key, item_ids in item_pools.items():
+        ts_content += f"  '{key}': Object.freeze([\n"
+        for item_id in item_ids:
+            ts_content += f"    '{item_id}',\n"
+        ts_content += f"  ]),\n"
+    ts_content += '''});
+'''
+
+    return ts_content
+
+
+def load_cards_from_db(db_path, hero=None, tier=None, tag=None):
+    """从 parse_card_yml.py 生成的SQLite数据库读取卡牌，可按英雄/稀有度/标签过滤"""
+    from card_store import CardStore
+
+    with CardStore(db_path) as store:
+        return store.load_cards(hero=hero, tier=tier, tag=tag)
+
+
+def write_if_changed(path, content):
+    """
+    内容有变化才写文件（避免触发服务端无意义的热重载）
+    先写临时文件再替换，监听方不会读到写了一半的文件
+    """
+    path = Path(path)
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def image_stems(card_data):
+    """find_image_filename 会尝试的图片文件名（不含扩展名）"""
+    name_en = card_data.get('name_en')
+    names = [card_data.get('name', 'Unknown')]
+    if name_en:
+        names += [name_en, name_en.replace(' ', '-')]
+    return {sanitize_filename(name) for name in names}
+
+
+class CardWatcher:
+    """
+    --watch 模式的内存目录：源文件名 -> 卡牌数据 / 物品配置
+    文件变化时只重新解析、转换受影响的卡牌，只重写内容有变化的输出
+    """
+
+    IMAGE_EXTS = ('.webp', '.jpg', '.jpeg', '.png')
+
+    def __init__(self, yml_dir, images_src_dir, images_dest_dir, cards_data_path, output_ts_path,
+                 db_path=None, stream=None, extras=False):
+        from parse_card_yml import CardYMLParser
+
+        self.yml_dir = Path(yml_dir)
+        self.images_src_dir = Path(images_src_dir)
+        self.images_dest_dir = Path(images_dest_dir)
+        self.cards_data_path = Path(cards_data_path)
+        self.output_ts_path = Path(output_ts_path)
+        self.db_path = db_path
+        self.stream = stream
+        self.parser = CardYMLParser(yml_dir=str(self.yml_dir), extract_extras=extras)
+
+        # 插入顺序即输出顺序：记录流在前，YML 在后（与 parse_card_yml.py 一致）
+        self.cards = {}
+        self.items = {}
+        # 由记录流提供的卡牌，对应YML变化时不重新解析
+        self.streamed = set()
+        self.image_hashes = {}
+        # 图片文件名（不含扩展名）-> 可能使用它的源文件
+        self.by_image = {}
+        self.last_cards_json = None
+        self.last_ts = None
+
+    def _index_images(self, source):
+        for stem in image_stems(self.cards[source]):
+            self.by_image.setdefault(stem, set()).add(source)
+
+    def _unindex_images(self, source):
+        for stem in image_stems(self.cards[source]):
+            sources = self.by_image.get(stem)
+            if sources:
+                sources.discard(source)
+
+    def _convert(self, source):
+        self.items[source] = convert_card(self.cards[source], self.images_src_dir,
+                                          self.images_dest_dir, self.image_hashes)
+
+    def load(self):
+        """启动时完整解析一次，之后只做增量更新"""
+        if self.stream:
+            self.parser.load_stream(self.stream)
+            self.streamed = set(self.parser.source_files)
+        self.parser.parse_all_files()
+
+        self.cards = dict(zip(self.parser.source_files, self.parser.cards))
+        self.image_hashes = load_image_hashes(self.images_src_dir)
+        for source in self.cards:
+            self._index_images(source)
+            self._convert(source)
+
+        self.emit(set(self.cards), set(self.cards), set(), full=True)
+
+    def _parse(self, source, changed, removed):
+        """重新解析一个YML；文件已删除时移除卡牌，解析失败时保留旧数据"""
+        if source in self.streamed:
+            return
+        path = self.yml_dir / f'{source}.yml'
+        if not path.exists():
+            if source in self.cards:
+                self._unindex_images(source)
+                del self.cards[source]
+                del self.items[source]
+                removed.add(source)
+            return
+
+        card_data = self.parser.parse_yml_file(path)
+        if not card_data:
+            print(f"  ! {path.name} 解析失败，保留上一次的数据")
+            return
+        if source in self.cards:
+            self._unindex_images(source)
+        self.cards[source] = card_data
+        self._index_images(source)
+        changed.add(source)
+
+    def apply(self, paths):
+        """处理一批文件变化，返回 (重新解析的卡牌, 重新转换的卡牌, 删除的卡牌)"""
+        changed, removed = set(), set()
+        yml_sources, stems = set(), set()
+
+        for path in paths:
+            if path == self.yml_dir:
+                # 事件队列溢出：与磁盘上的文件整体对账
+                yml_sources |= {p.stem for p in self.yml_dir.glob('*.yml')} | set(self.cards)
+            elif path.parent == self.yml_dir and path.suffix == '.yml':
+                yml_sources.add(path.stem)
+            elif path == self.images_src_dir or path.name == 'manifest.json':
+                # 清单变化：找出哈希变了的图片
+                hashes = load_image_hashes(self.images_src_dir)
+                for filename in self.image_hashes.keys() | hashes.keys():
+                    if self.image_hashes.get(filename) != hashes.get(filename):
+                        stems.add(Path(filename).stem)
+                self.image_hashes = hashes
+                if path == self.images_src_dir:
+                    stems |= set(self.by_image)
+            elif path.parent == self.images_src_dir and path.suffix in self.IMAGE_EXTS:
+                stems.add(path.stem)
+                # 清单之外手动替换的图片也按内容同步到客户端
+                if path.exists():
+                    self.image_hashes[path.name] = file_sha256(path)
+                else:
+                    self.image_hashes.pop(path.name, None)
+
+        for source in sorted(yml_sources):
+            self._parse(source, changed, removed)
+
+        reconvert = set(changed)
+        for stem in stems:
+            reconvert |= self.by_image.get(stem, set())
+        reconvert = {source for source in reconvert if source in self.cards}
+        for source in reconvert:
+            self._convert(source)
+
+        return changed, reconvert, removed
+
+    def emit(self, changed, reconverted, removed, full=False):
+        """
+        重新生成输出，只写内容有变化的文件
+        full: 启动时的完整解析，数据库整体同步（删除快照已不存在的卡牌）
+        """
+        written = []
+
+        if changed or removed:
+            cards_json = json.dumps(list(self.cards.values()), ensure_ascii=False, indent=2)
+            if cards_json != self.last_cards_json:
+                if write_if_changed(self.cards_data_path, cards_json):
+                    written.append(self.cards_data_path.name)
+                self.last_cards_json = cards_json
+
+            if self.db_path:
+                from card_store import CardStore
+
+                with CardStore(self.db_path) as store:
+                    if full:
+                        store.replace_all(list(self.cards.values()), list(self.cards))
+                    else:
+                        sources = [source for source in self.cards if source in changed]
+                        store.write_cards([self.cards[source] for source in sources], sources)
+                        if removed:
+                            store.delete_sources(removed)
+                written.append(Path(self.db_path).name)
+
+        if reconverted or removed:
+            ts_content = render_items_ts(list(self.items.values()))
+            if ts_content != self.last_ts:
+                if write_if_changed(self.output_ts_path, ts_content):
+                    written.append(self.output_ts_path.name)
+                self.last_ts = ts_content
+
+        return written
+
+    def run(self, debounce, polling=False):
+        """监听 yml/ 与 images/，每批变化增量更新"""
+        from file_watcher import watch_directories
+
+        start = time.perf_counter()
+        self.load()
+        print(f"\n已加载 {len(self.cards)} 张卡牌（{time.perf_counter() - start:.2f}s），开始监听，Ctrl+C 退出")
+
+        self.yml_dir.mkdir(exist_ok=True)
+        self.images_src_dir.mkdir(exist_ok=True)
+        try:
+            for paths in watch_directories([self.yml_dir, self.images_src_dir], debounce, polling):
+                start = time.perf_counter()
+                changed, reconverted, removed = self.apply(paths)
+                written = self.emit(changed, reconverted, removed)
+                print(f"[{time.strftime('%H:%M:%S')}] {len(paths)} 个文件变化 -> "
+                      f"解析 {len(changed)} 张、转换 {len(reconverted)} 张、删除 {len(removed)} 张卡牌，"
+                      f"写入: {', '.join(written) or '无'}（{time.perf_counter() - start:.3f}s）")
+        except KeyboardInterrupt:
+            print("\n停止监听")
+
+
+# --profile 时单独计时的转换步骤
+PROFILED_STEPS = ['find_image_filename', 'load_image_hashes', 'copy_card_image', 'render_items_ts']
+
+
+def main():
+    """主函数"""
+    arg_parser = argparse.ArgumentParser(description="卡牌数据转换工具")
+    arg_parser.add_argument('--db', help="从SQLite数据库读取卡牌（替代 cards_data.json）")
+    arg_parser.add_argument('--hero', help="读取数据库时只取该英雄的卡牌，例如 vanessa")
+    arg_parser.add_argument('--tier', help="读取数据库时只取该初始稀有度的卡牌，例如 Bronze")
+    arg_parser.add_argument('--tag', help="读取数据库时只取带该标签的卡牌，例如 Weapon")
+    arg_parser.add_argument('--watch', action='store_true',
+                            help="持续监听 yml/ 与 images/，增量重新解析并只重写有变化的输出")
+    arg_parser.add_argument('--debounce', type=float, default=0.2,
+                            help="--watch 时合并连续变化的等待时间（秒）")
+    arg_parser.add_argument('--polling', action='store_true', help="--watch 时用轮询代替 inotify")
+    arg_parser.add_argument('--stream', help="--watch 时合并的记录流（同 parse_card_yml.py --stream）")
+    arg_parser.add_argument('--extras', action='store_true',
+                            help="--watch 时额外提取深度机制与商人池（同 parse_card_yml.py --extras）")
+    add_profile_arguments(arg_parser)
+    args = arg_parser.parse_args()
 
-    print("\n" + "=" * 60)
-    print("转换完成!")
-    print(f"  处理卡牌数: {len(items_config)}")
-    print(f"  复制图片数: {image_count}")
-    print(f"  输出文件: {output_ts_path}")
-    print(f"  图片目录: {images_dest_dir}")
     print("=" * 60)
+    print("卡牌数据转换工具")
+    print("=" * 60)
+
+    # 路径设置
+    project_root = Path(__file__).parent.parent
+    tool_dir = project_root / "tool"
+    down_card_db_dir = tool_dir / "down_card_db"
+    cards_data_path = down_card_db_dir / "cards_data.json"
+    images_src_dir = down_card_db_dir / "images"
+    images_dest_dir = project_root / "client" / "public" / "assets" / "cards"
+
+    output_ts_path = project_root / "server" / "src" / "game" / "config" / "bazaar_items.ts"
+
+    # 确保目标目录存在
+    images_dest_dir.mkdir(parents=True, exist_ok=True)
+
+    if args.watch:
+        # 以 yml/ 为数据源，cards_data.json 与数据库作为输出同步更新
+        watcher = CardWatcher(down_card_db_dir / "yml", images_src_dir, images_dest_dir,
+                              cards_data_path, output_ts_path, db_path=args.db,
+                              stream=args.stream, extras=args.extras)
+        watcher.run(args.debounce, args.polling)
+        return
+
+    # 读取卡牌数据
+    with Profiler.from_args('convert_card_data', args) as profiler:
+        # 图片查找、复制、TS 生成分别计时
+        profiler.instrument(sys.modules[__name__], PROFILED_STEPS)
+
+        with profiler.stage('load'):
+            if args.db:
+                if not Path(args.db).exists():
+                    print(f"错误: 数据库不存在 {args.db}")
+                    return
+                card_data_list = load_cards_from_db(args.db, args.hero, args.tier, args.tag)
+            else:
+                if not cards_data_path.exists():
+                    print(f"错误: 文件不存在 {cards_data_path}")
+                    return
+
+                with open(cards_data_path, 'r', encoding='utf-8') as f:
+                    card_data_list = json.load(f)
+
+        print(f"\n读取到 {len(card_data_list)} 张卡牌数据\n")
+
+        # 复制图片文件并生成配置
+        items_config = []
+        image_count = 0
+
+        with profiler.stage('convert'):
+            image_hashes = load_image_hashes(images_src_dir)
+
+            for card_data in card_data_list:
+                item_config = convert_card(card_data, images_src_dir, images_dest_dir, image_hashes)
+                if item_config.get('image'):
+                    image_count += 1
+                items_config.append(item_config)
+                print(f"  ✓ {item_config['name']} {'(+image)' if item_config.get('image') else ''}")
+
+        # 生成 TypeScript 文件
+        with profiler.stage('emit ts'):
+            ts_content = render_items_ts(items_config)
+
+            with open(output_ts_path, 'w', encoding='utf-8') as f:
+                f.write(ts_content)
+
+        print("\n" + "=" * 60)
+        print("转换完成!")
+        print(f"  处理卡牌数: {len(items_config)}")
+        print(f"  复制图片数: {image_count}")
+        print(f"  商店池数: {len(build_item_pools(items_config))}")
+        print(f"  输出文件: {output_ts_path}")
+        print(f"  图片目录: {images_dest_dir}")
+        print("=" * 60)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Check that --structured records match snapshot parsing.
+
+Runs fetch_page.EXTRACT_CARD_JS under node against a DOM rebuilt from each
+snapshot (bench/snapshot_dom.js) and compares record_to_card() of the result
+with CardYMLParser on the same snapshot, field by field. The fake
+playwright-cli answers eval from hand-written fixture records, so this is
+the only offline run of the extraction JavaScript.
+
+Usage: python bench/check_structured.py [--snapshots yml/] [--cards 20]
+Exits 1 if any card differs.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+import fetch_page  # noqa: E402
+from fixture_server import synthetic_snapshot  # noqa: E402
+from parse_card_yml import CardYMLParser  # noqa: E402
+
+FIELDS = ['name', 'name_en', 'types', 'tier', 'cooldown', 'damage', 'effect', 'tags', 'cost', 'value']
+
+# - role "name" [attr] [attr=value]: inline text; lines without a role are text nodes
+ENTRY_PATTERN = re.compile(
+    r'^( *)- (?:([\w-]+)(?: "((?:[^"\\]|\\.)*)")?((?: \[[^\]]*\])*)(?::(?: (.*))?)?|(.*?))\s*$'
+)
+URL_PATTERN = re.compile(r'^( *)- /url: ?(.*?)\s*$')
+LEVEL_PATTERN = re.compile(r'\[level=(\d+)\]')
+
+
+def unquote(value):
+    """Strip the YAML double quotes playwright puts around numbers and the like"""
+    if value and len(value) >= 2 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return value
+
+
+def snapshot_to_dict(path):
+    """Nested {role, name, text, url, level, children} for snapshot_dom.js, read off the indentation"""
+    root = {'role': 'document', 'name': None, 'text': None, 'url': None, 'level': None, 'children': []}
+    stack = [(-1, root)]
+    for line in path.read_text(encoding='utf-8').splitlines():
+        url = URL_PATTERN.match(line)
+        if url:
+            indent, node = stack[-1]
+            if len(url.group(1)) > indent and node['url'] is None:
+                node['url'] = url.group(2)
+            continue
+        match = ENTRY_PATTERN.match(line)
+        if not match:
+            continue
+        indent, role, name, attrs, text, other = match.groups()
+        if role:
+            level = LEVEL_PATTERN.search(attrs or '')
+            node = {'role': role, 'name': name, 'text': unquote(text) or None, 'url': None,
+                    'level': int(level.group(1)) or None if level else None, 'children': []}
+        else:
+            node = {'role': 'text', 'name': None, 'text': other, 'url': None, 'level': None, 'children': []}
+        while stack[-1][0] >= len(indent):
+            stack.pop()
+        stack[-1][1]['children'].append(node)
+        stack.append((len(indent), node))
+    return root
+
+
+def run_extraction(trees):
+    """EXTRACT_CARD_JS result for each tree, via node"""
+    with tempfile.NamedTemporaryFile('w', suffix='.js', encoding='utf-8', delete=False) as f:
+        f.write(fetch_page.EXTRACT_CARD_JS)
+        js_path = f.name
+    try:
+        result = subprocess.run(
+            ['node', str(BENCH_DIR / 'snapshot_dom.js'), js_path],
+            input=json.dumps(trees, ensure_ascii=False), capture_output=True, text=True, check=True,
+        )
+    finally:
+        Path(js_path).unlink()
+    return [json.loads(record) for record in json.loads(result.stdout)]
+
+
+def load_snapshots(args, workdir):
+    """(card name, snapshot path): recorded snapshots, or synthetic fixture pages"""
+    if args.snapshots:
+        return [(path.stem, path) for path in sorted(Path(args.snapshots).glob('*.yml'))]
+    snapshots = []
+    for index in range(args.cards):
+        name_en, snapshot, _ = synthetic_snapshot(index)
+        path = Path(workdir) / f'{name_en}.yml'
+        path.write_text(snapshot, encoding='utf-8')
+        snapshots.append((name_en, path))
+    return snapshots
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Compare in-browser extraction with snapshot parsing")
+    arg_parser.add_argument('--snapshots', help="Recorded yml/ directory (default: synthetic fixture pages)")
+    arg_parser.add_argument('--cards', type=int, default=20, help="Synthetic pages to check without --snapshots")
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        snapshots = load_snapshots(args, workdir)
+        parser = CardYMLParser(yml_dir=workdir)
+        parsed = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _, path in snapshots:
+                parsed.append(parser.parse_yml_file(path))
+        trees = [snapshot_to_dict(path) for _, path in snapshots]
+
+    records = run_extraction(trees)
+
+    mismatches = 0
+    for (card_name, path), expected, record in zip(snapshots, parsed, records):
+        actual = fetch_page.record_to_card(record, card_name)
+        diffs = [(field, expected.get(field), actual.get(field)) for field in FIELDS
+                 if expected.get(field) != actual.get(field)]
+        if diffs:
+            mismatches += 1
+            print(f"✗ {path.name}")
+            for field, want, got in diffs:
+                print(f"    {field}: parser={want!r} js={got!r}")
+
+    print(f"{len(snapshots) - mismatches}/{len(snapshots)} cards match")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Offline crawl benchmark.
+
+Starts the local fixture server, puts the fake playwright-cli first on PATH and
+crawls N synthetic cards through fetch_page.py in a scratch directory, then
+reports cards/sec, p50/p99 per-card latency and CPU use.
+
+Usage: python bench/crawl_bench.py [--cards 200] [--workers 4] [--mode snapshot|scoped|structured]
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, redirect_stdout
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+
+import fetch_page  # noqa: E402
+
+
+@contextmanager
+def fixture_server(args):
+    """Run fixture_server.py in its own process so its CPU is not counted"""
+    cmd = [
+        sys.executable, str(BENCH_DIR / 'fixture_server.py'),
+        '--cards', str(args.cards),
+        '--latency-ms', str(args.latency_ms),
+        '--jitter-ms', str(args.jitter_ms),
+        '--error-rate', str(args.error_rate),
+        '--image-delay-ms', str(args.image_delay_ms),
+        '--seed', str(args.seed),
+    ]
+    if args.snapshots:
+        cmd += ['--snapshots', str(Path(args.snapshots).resolve())]
+
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    try:
+        line = process.stdout.readline().strip()
+        if not line.startswith('READY '):
+            raise RuntimeError(f'fixture server failed to start: {line!r}')
+        yield line.split(' ', 1)[1]
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[k]
+
+
+def cpu_seconds():
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime, children.ru_utime + children.ru_stime
+
+
+def crawl(links, mode, workers, verbose=False):
+    """Crawl every link with one fake browser session per worker"""
+    latencies = []
+    outcomes = {'ok': 0, 'failed': 0, 'images': 0}
+    lock = threading.Lock()
+    pending = list(enumerate(links))
+    scope = {'with_mechanics': False, 'with_merchants': False} if mode == 'scoped' else None
+
+    def worker(worker_id):
+        session = f'bench_session_{worker_id}'
+        while True:
+            with lock:
+                if not pending:
+                    break
+                _, url = pending.pop(0)
+
+            card_name = fetch_page.extract_name_from_url(url)
+            start = time.perf_counter()
+            if mode == 'structured':
+                ok = fetch_page.process_url_structured(url, session) is not None
+            else:
+                ok = bool(fetch_page.process_url(url, session, scope))
+            elapsed = time.perf_counter() - start
+
+            has_image = any(Path('images').glob(f'{card_name}.*'))
+            with lock:
+                latencies.append(elapsed)
+                outcomes['ok' if ok else 'failed'] += 1
+                outcomes['images'] += int(has_image)
+
+        fetch_page.run_playwright_cli(['close'], session)
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(sys.stdout if verbose else devnull):
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    return latencies, outcomes
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Offline crawl benchmark against a local fixture server")
+    arg_parser.add_argument('--cards', type=int, default=200)
+    arg_parser.add_argument('--workers', type=int, default=4)
+    arg_parser.add_argument('--mode', choices=['snapshot', 'scoped', 'structured'], default='snapshot')
+    arg_parser.add_argument('--latency-ms', type=float, default=50.0)
+    arg_parser.add_argument('--jitter-ms', type=float, default=10.0)
+    arg_parser.add_argument('--error-rate', type=float, default=0.0)
+    arg_parser.add_argument('--image-delay-ms', type=float, default=0.0)
+    arg_parser.add_argument('--lazy-load-wait', type=float, default=0.0,
+                            help="Override fetch_page's post-open wait (seconds)")
+    arg_parser.add_argument('--snapshots', help="Serve recorded snapshots from this yml/ directory")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--json', help="Also write the report to this JSON file")
+    arg_parser.add_argument('--verbose', action='store_true', help="Show fetch_page output")
+    args = arg_parser.parse_args()
+
+    fetch_page.LAZY_LOAD_WAIT_SECONDS = args.lazy_load_wait
+
+    workdir = Path(tempfile.mkdtemp(prefix='crawl_bench_'))
+    original_cwd = os.getcwd()
+    os.environ['PATH'] = f'{BENCH_DIR}{os.pathsep}{os.environ.get("PATH", "")}'
+    os.environ['FAKE_PLAYWRIGHT_STATE'] = str(workdir / 'sessions')
+
+    try:
+        with fixture_server(args) as base_url:
+            import requests
+            links = requests.get(f'{base_url}/links', timeout=10).json()
+
+            os.chdir(workdir)
+            Path('yml').mkdir()
+
+            cpu_self_start, cpu_children_start = cpu_seconds()
+            wall_start = time.perf_counter()
+            latencies, outcomes = crawl(links, args.mode, args.workers, args.verbose)
+            wall = time.perf_counter() - wall_start
+            cpu_self_end, cpu_children_end = cpu_seconds()
+    finally:
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    cpu_self = cpu_self_end - cpu_self_start
+    cpu_children = cpu_children_end - cpu_children_start
+    report = {
+        'mode': args.mode,
+        'cards': len(latencies),
+        'workers': args.workers,
+        'ok': outcomes['ok'],
+        'failed': outcomes['failed'],
+        'images': outcomes['images'],
+        'wall_seconds': round(wall, 3),
+        'cards_per_second': round(len(latencies) / wall, 2) if wall else 0.0,
+        'latency_p50_ms': round(percentile(latencies, 50) * 1000, 1),
+        'latency_p99_ms': round(percentile(latencies, 99) * 1000, 1),
+        'cpu_crawler_seconds': round(cpu_self, 3),
+        'cpu_browser_seconds': round(cpu_children, 3),
+        'cpu_utilization': round((cpu_self + cpu_children) / wall, 3) if wall else 0.0,
+    }
+
+    print(f"{'='*60}")
+    print(f"Crawl benchmark ({args.mode}, {args.workers} workers)")
+    print(f"{'='*60}")
+    print(f"  Cards:        {report['cards']} (ok {report['ok']}, failed {report['failed']}, "
+          f"images {report['images']})")
+    print(f"  Throughput:   {report['cards_per_second']} cards/sec over {report['wall_seconds']}s")
+    print(f"  Latency:      p50 {report['latency_p50_ms']} ms, p99 {report['latency_p99_ms']} ms")
+    print(f"  CPU:          crawler {report['cpu_crawler_seconds']}s, "
+          f"browser stand-in {report['cpu_browser_seconds']}s ({report['cpu_utilization']:.0%} of wall)")
+    print(f"{'='*60}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
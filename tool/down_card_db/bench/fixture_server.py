@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Local bazaardb stand-in for offline crawl benchmarks.
+
+Serves card pages and images with configurable latency, jitter, error rate and
+lazy-image delay. Cards are synthetic by default, or recorded snapshots from a
+yml/ directory (--snapshots), cycled to --cards entries.
+
+Routes:
+  /card/<id>/<name>/zh-CN   card page (latency + errors apply)
+  /images/<id>.webp         card image (latency + errors apply)
+  /fixture/<id>             JSON used by the fake playwright-cli:
+                            {snapshot, record, image, imageDelay}
+  /links                    JSON list of all card URLs
+
+Usage: python fixture_server.py [--port 0] [--cards 100] [--latency-ms 50] ...
+Prints "READY <base_url>" once listening.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote, unquote, urlparse
+
+HEROES = ['Vanessa', 'Mak', 'Jules', 'Pygmalien', 'Dooley', 'Stelle']
+SIZES = ['small', 'medium', 'large']
+TIERS = ['Bronze', 'Silver', 'Gold', 'Diamond']
+
+
+def synthetic_snapshot(index, filler_lines=400):
+    """A full-page accessibility snapshot shaped like a bazaardb card page"""
+    rng = random.Random(index)
+    name = f'合成卡牌{index}'
+    name_en = f'Synthetic-Card-{index}'
+    hero = HEROES[index % len(HEROES)]
+    size = SIZES[index % len(SIZES)]
+    tier = TIERS[index % len(TIERS)]
+    cooldown = rng.choice([2, 3, 4, 5, 6, 8])
+    damage = rng.randint(5, 120)
+    silver = rng.randint(2, 8)
+
+    lines = ['- generic [ref=e1]:']
+    # Navigation and header filler before the card block
+    for i in range(filler_lines // 2):
+        lines.append(f'  - link "Nav {i}" [ref=n{i}] [cursor=pointer]:')
+        lines.append(f'    - /url: /nav/{i}')
+    lines += [
+        '  - main [ref=e2]:',
+        '    - generic [ref=e3]:',
+        f'      - heading "{name}" [level=1] [ref=e4]',
+        f'      - link "{name}" [ref=e5]:',
+        f'        - /url: /card/syn{index:06d}/{name_en}',
+        '      - generic [ref=e6]:',
+        f'        - generic [ref=e7]: "{cooldown}"',
+        '        - generic [ref=e8]: 秒',
+        f'      - text: 造成{damage}伤害，触发时此物品伤害提高',
+        '      - generic [ref=e9]: "+5"',
+        '      - generic [ref=e10]: Tags',
+        f'        - link "{size.capitalize()}" [ref=e11]',
+        f'        - link "{hero}" [ref=e12]',
+        '        - link "Damage" [ref=e13]',
+        '      - generic [ref=e14]: Cost',
+        f'        - text: {silver} » {silver * 2} » {silver * 4} gold',
+        '      - generic [ref=e15]: Value',
+        f'        - text: {silver // 2 or 1} » {silver} » {silver * 2} gold',
+        f'      - paragraph [ref=e16]: {name} is a {size} {hero} item in The Bazaar. '
+        f'Its starting tier is {tier}.',
+    ]
+    # Runs / history tables after the card block
+    for i in range(filler_lines // 2):
+        lines.append(f'  - row "Run {i} {rng.randint(1, 10)} wins" [ref=r{i}]')
+
+    record = {
+        'name': name, 'nameEn': name_en.replace('-', ' '),
+        'size': size, 'category': hero, 'cardType': 'item', 'tier': tier,
+        'cooldown': float(cooldown), 'damage': damage,
+        'effect': f'造成{damage}伤害，触发时此物品伤害提高 +5',
+        'tags': [size.capitalize(), hero, 'Damage'],
+        'cost': {'silver': silver, 'gold': silver * 2, 'diamond': silver * 4},
+        'value': {'silver': silver // 2 or 1, 'gold': silver, 'diamond': silver * 2},
+    }
+    return name_en, '\n'.join(lines) + '\n', record
+
+
+def recorded_cards(snapshot_dir):
+    """Recorded snapshots from a yml/ directory, with records from the parser"""
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from parse_card_yml import CardYMLParser
+
+    parser = CardYMLParser(yml_dir=str(snapshot_dir))
+    cards = []
+    for yml_file in sorted(Path(snapshot_dir).glob('*.yml')):
+        card = parser.parse_yml_file(yml_file)
+        if not card:
+            continue
+        types = card.get('types') or []
+        record = {
+            'name': card['name'], 'nameEn': card.get('name_en'),
+            'size': types[0].lower() if types else None,
+            'category': types[1] if len(types) > 2 else 'neutral',
+            'cardType': types[-1].lower() if types else None,
+            'tier': card.get('tier'), 'cooldown': card.get('cooldown'), 'damage': card.get('damage'),
+            'effect': card.get('effect'), 'tags': card.get('tags'),
+            'cost': card.get('cost'), 'value': card.get('value'),
+        }
+        cards.append((yml_file.stem, yml_file.read_text(encoding='utf-8'), record))
+    return cards
+
+
+class FixtureSite:
+    """The card catalogue and network behaviour served by the fixture server"""
+
+    def __init__(self, cards=100, latency_ms=50.0, jitter_ms=10.0, error_rate=0.0,
+                 image_delay_ms=0.0, image_bytes=20000, snapshot_dir=None, seed=0):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.image_delay = image_delay_ms / 1000
+        self.image_bytes = image_bytes
+        self.rng = random.Random(seed)
+        self.rng_lock = threading.Lock()
+
+        recorded = recorded_cards(snapshot_dir) if snapshot_dir else []
+        self.cards = {}
+        for index in range(cards):
+            if recorded:
+                slug, snapshot, record = recorded[index % len(recorded)]
+            else:
+                slug, snapshot, record = synthetic_snapshot(index)
+            self.cards[f'syn{index:06d}'] = (slug, snapshot, record)
+
+    def card_url(self, base_url, card_id):
+        return f'{base_url}/card/{card_id}/{quote(self.cards[card_id][0])}/zh-CN'
+
+    def delay(self):
+        with self.rng_lock:
+            jitter = self.rng.uniform(-self.jitter, self.jitter)
+        time.sleep(max(0.0, self.latency + jitter))
+
+    def fails(self):
+        with self.rng_lock:
+            return self.rng.random() < self.error_rate
+
+    def image(self, card_id):
+        """Deterministic pseudo-image bytes per card"""
+        seed = hashlib.sha256(card_id.encode()).digest()
+        return (seed * (self.image_bytes // len(seed) + 1))[:self.image_bytes]
+
+
+def make_handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def send_body(self, body, content_type, status=200):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_json(self, value):
+            self.send_body(json.dumps(value, ensure_ascii=False).encode(), 'application/json; charset=utf-8')
+
+        def base_url(self):
+            host, port = self.server.server_address[:2]
+            return f'http://{host}:{port}'
+
+        def do_GET(self):
+            parts = unquote(urlparse(self.path).path).strip('/').split('/')
+
+            if parts == ['links']:
+                return self.send_json([site.card_url(self.base_url(), card_id) for card_id in site.cards])
+
+            if parts[0] == 'fixture' and len(parts) == 2 and parts[1] in site.cards:
+                slug, snapshot, record = site.cards[parts[1]]
+                return self.send_json({
+                    'snapshot': snapshot,
+                    'record': record,
+                    'image': f'{self.base_url()}/images/{parts[1]}.webp',
+                    'imageDelay': site.image_delay,
+                })
+
+            if parts[0] == 'card' and len(parts) >= 2 and parts[1] in site.cards:
+                site.delay()
+                if site.fails():
+                    return self.send_body(b'unavailable', 'text/plain', 503)
+                name = site.cards[parts[1]][2]['name']
+                return self.send_body(f'<html><h1>{name}</h1></html>'.encode(), 'text/html; charset=utf-8')
+
+            if parts[0] == 'images' and len(parts) == 2 and parts[1].endswith('.webp'):
+                card_id = parts[1][:-len('.webp')]
+                if card_id in site.cards:
+                    site.delay()
+                    if site.fails():
+                        return self.send_body(b'unavailable', 'text/plain', 503)
+                    return self.send_body(site.image(card_id), 'image/webp')
+
+            self.send_body(b'not found', 'text/plain', 404)
+
+    return Handler
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Local bazaardb fixture server")
+    arg_parser.add_argument('--host', default='127.0.0.1')
+    arg_parser.add_argument('--port', type=int, default=0, help="0 picks a free port")
+    arg_parser.add_argument('--cards', type=int, default=100)
+    arg_parser.add_argument('--latency-ms', type=float, default=50.0)
+    arg_parser.add_argument('--jitter-ms', type=float, default=10.0)
+    arg_parser.add_argument('--error-rate', type=float, default=0.0)
+    arg_parser.add_argument('--image-delay-ms', type=float, default=0.0, help="Lazy-image delay after open")
+    arg_parser.add_argument('--image-bytes', type=int, default=20000)
+    arg_parser.add_argument('--snapshots', help="Serve recorded snapshots from this yml/ directory")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args()
+
+    site = FixtureSite(
+        cards=args.cards, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, image_delay_ms=args.image_delay_ms,
+        image_bytes=args.image_bytes, snapshot_dir=args.snapshots, seed=args.seed,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(site))
+    server.daemon_threads = True
+    host, port = server.server_address[:2]
+    print(f'READY http://{host}:{port}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
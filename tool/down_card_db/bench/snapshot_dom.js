@@ -0,0 +1,97 @@
+#!/usr/bin/env node
+/*
+ * Minimal DOM rebuilt from accessibility snapshots, so fetch_page's
+ * EXTRACT_CARD_JS can run offline under node (used by check_structured.py).
+ *
+ * Usage: node snapshot_dom.js <extract.js> < trees.json > records.json
+ *
+ * trees.json is a list of snapshot trees ({role, name, text, url, level,
+ * children}); the output is the list of JSON strings the extraction returns.
+ * Only what the extraction touches is modelled: h1/a/div elements, leaf text,
+ * textContent/innerText, children/parentElement, getAttribute and the
+ * selectors "*", "tag" and "tag[attr*=\"value\"]". Anything else matches nothing.
+ */
+
+const fs = require('fs');
+
+class TextNode {
+  constructor(text) { this.text = text; }
+  get textContent() { return this.text; }
+  get innerText() { return this.text; }
+}
+
+class Element {
+  constructor(tagName, attrs = {}) {
+    this.tagName = tagName;
+    this.attrs = attrs;
+    this.childNodes = [];
+    this.parentElement = null;
+  }
+
+  append(node) {
+    this.childNodes.push(node);
+    if (node instanceof Element) node.parentElement = this;
+  }
+
+  get children() { return this.childNodes.filter(n => n instanceof Element); }
+  get textContent() { return this.childNodes.map(n => n.textContent).join(''); }
+  get innerText() { return this.childNodes.map(n => n.innerText).filter(Boolean).join('\n'); }
+  getAttribute(name) { return name in this.attrs ? this.attrs[name] : null; }
+
+  *descendants() {
+    for (const child of this.children) {
+      yield child;
+      yield* child.descendants();
+    }
+  }
+
+  querySelectorAll(selector) { return Array.from(this.descendants()).filter(e => matches(e, selector)); }
+  querySelector(selector) { return this.querySelectorAll(selector)[0] || null; }
+}
+
+function matches(element, selector) {
+  if (selector === '*') return true;
+  const m = selector.match(/^(\w+)(?:\[([\w-]+)\*="([^"]*)"\])?$/);
+  if (!m || element.tagName !== m[1]) return false;
+  return !m[2] || (element.getAttribute(m[2]) || '').includes(m[3]);
+}
+
+function tagFor(node) {
+  if (node.role === 'heading') return `h${node.level || 2}`;
+  if (node.role === 'link') return 'a';
+  return 'div';
+}
+
+function build(node) {
+  if (node.role === 'text') return new TextNode(node.text || '');
+
+  const attrs = {};
+  if (node.url) attrs.href = node.url;
+  if (node.name) attrs['aria-label'] = node.name;
+  const element = new Element(tagFor(node), attrs);
+
+  const children = node.children || [];
+  // "generic: Tags" with children is a label element followed by its siblings
+  if (node.text && children.length) {
+    const label = new Element('span');
+    label.append(new TextNode(node.text));
+    element.append(label);
+  } else if (!children.length && (node.text || node.name)) {
+    element.append(new TextNode(node.text || node.name));
+  }
+  for (const child of children) element.append(build(child));
+  return element;
+}
+
+const extract = eval(`(${fs.readFileSync(process.argv[2], 'utf-8')})`);
+const trees = JSON.parse(fs.readFileSync(0, 'utf-8'));
+const results = trees.map(tree => {
+  const body = build({ role: 'generic', children: tree.children });
+  global.document = {
+    body,
+    querySelector: selector => body.querySelector(selector),
+    querySelectorAll: selector => body.querySelectorAll(selector),
+  };
+  return extract();
+});
+process.stdout.write(JSON.stringify(results));
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+卡牌SQLite存储
+作为解析 → 转换流程的规范中间层：解析结果按批写入带索引的规范化表，
+下游可以按英雄、稀有度、标签按需读取，无需整文件重新加载
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 英雄映射与转换脚本共用
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from convert_card_data import get_source_hero  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY,
+    source_file TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    name_en TEXT,
+    tier TEXT,
+    hero TEXT,
+    types TEXT NOT NULL DEFAULT '[]',
+    cooldown REAL,
+    damage INTEGER,
+    effect TEXT
+);
+CREATE TABLE IF NOT EXISTS card_tags (
+    card_id INTEGER NOT NULL REFERENCES cards(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (card_id, position)
+);
+CREATE TABLE IF NOT EXISTS card_prices (
+    card_id INTEGER NOT NULL REFERENCES cards(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (card_id, kind, tier)
+);
+CREATE TABLE IF NOT EXISTS card_mechanics (
+    card_id INTEGER NOT NULL REFERENCES cards(id) ON DELETE CASCADE,
+    attribute TEXT NOT NULL,
+    tier TEXT NOT NULL,
+    value TEXT,
+    PRIMARY KEY (card_id, attribute, tier)
+);
+CREATE TABLE IF NOT EXISTS card_merchants (
+    card_id INTEGER NOT NULL REFERENCES cards(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    merchant TEXT NOT NULL,
+    PRIMARY KEY (card_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_cards_name ON cards(name);
+CREATE INDEX IF NOT EXISTS idx_cards_hero ON cards(hero);
+CREATE INDEX IF NOT EXISTS idx_card_tags_tag ON card_tags(tag, card_id);
+CREATE INDEX IF NOT EXISTS idx_card_merchants_merchant ON card_merchants(merchant);
+"""
+
+
+class CardStore:
+    """卡牌SQLite存储（WAL模式）"""
+
+    def __init__(self, db_path: str = "cards.db"):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'CardStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write_cards(self, cards: Sequence[Dict[str, Any]], source_files: Sequence[str]) -> int:
+        """
+        批量写入卡牌，按源文件名覆盖旧记录（支持局部重新生成）
+
+        Args:
+            cards: 解析得到的卡牌字典列表
+            source_files: 与 cards 一一对应的YML文件名（不含扩展名）
+
+        Returns:
+            写入的卡牌数
+        """
+        if len(cards) != len(source_files):
+            raise ValueError("cards 与 source_files 数量不一致")
+        if not cards:
+            return 0
+
+        with self.conn:
+            # UPSERT 保留已有卡牌的 id（即原有顺序），子表记录整体重建
+            self.conn.executemany(
+                "INSERT INTO cards (source_file, name, name_en, tier, hero, types, cooldown, damage, effect) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(source_file) DO UPDATE SET name = excluded.name, name_en = excluded.name_en, "
+                "tier = excluded.tier, hero = excluded.hero, types = excluded.types, "
+                "cooldown = excluded.cooldown, damage = excluded.damage, effect = excluded.effect",
+                [
+                    (
+                        source,
+                        card.get('name') or source,
+                        card.get('name_en'),
+                        card.get('tier'),
+                        get_source_hero(card.get('tags') or []),
+                        json.dumps(card.get('types') or [], ensure_ascii=False),
+                        card.get('cooldown'),
+                        card.get('damage'),
+                        card.get('effect'),
+                    )
+                    for card, source in zip(cards, source_files)
+                ],
+            )
+
+            ids = self._ids_for_sources(source_files)
+            stale = [(card_id,) for card_id in ids.values()]
+            for table in ('card_tags', 'card_prices', 'card_mechanics', 'card_merchants'):
+                self.conn.executemany(f"DELETE FROM {table} WHERE card_id = ?", stale)
+
+            tag_rows: List[Tuple] = []
+            price_rows: List[Tuple] = []
+            mechanic_rows: List[Tuple] = []
+            merchant_rows: List[Tuple] = []
+            for card, source in zip(cards, source_files):
+                card_id = ids[source]
+                for position, tag in enumerate(card.get('tags') or []):
+                    tag_rows.append((card_id, position, tag))
+                for kind in ('cost', 'value'):
+                    for tier, amount in (card.get(kind) or {}).items():
+                        price_rows.append((card_id, kind, tier, amount))
+                base = (card.get('deep_mechanics') or {}).get('base') or {}
+                for attribute, tier_values in base.items():
+                    for tier, value in tier_values.items():
+                        mechanic_rows.append((card_id, attribute, tier, json.dumps(value, ensure_ascii=False)))
+                for position, merchant in enumerate(card.get('merchants') or []):
+                    merchant_rows.append((card_id, position, merchant))
+
+            self.conn.executemany("INSERT INTO card_tags VALUES (?, ?, ?)", tag_rows)
+            self.conn.executemany("INSERT INTO card_prices VALUES (?, ?, ?, ?)", price_rows)
+            self.conn.executemany("INSERT INTO card_mechanics VALUES (?, ?, ?, ?)", mechanic_rows)
+            self.conn.executemany("INSERT INTO card_merchants VALUES (?, ?, ?)", merchant_rows)
+
+        return len(cards)
+
+    def delete_sources(self, source_files: Iterable[str]) -> int:
+        """删除指定源文件对应的卡牌"""
+        with self.conn:
+            cursor = self.conn.executemany(
+                "DELETE FROM cards WHERE source_file = ?",
+                [(source,) for source in source_files],
+            )
+        return cursor.rowcount
+
+    def prune(self, keep_sources: Iterable[str]) -> int:
+        """删除不在 keep_sources 中的卡牌（其快照已不存在）"""
+        keep = set(keep_sources)
+        stale = [row['source_file'] for row in self.conn.execute("SELECT source_file FROM cards")
+                 if row['source_file'] not in keep]
+        return self.delete_sources(stale) if stale else 0
+
+    def replace_all(self, cards: Sequence[Dict[str, Any]], source_files: Sequence[str]) -> Tuple[int, int]:
+        """
+        完整解析后的同步：写入全部卡牌，并删除本次没有出现的源文件
+
+        Returns:
+            (写入的卡牌数, 删除的卡牌数)
+        """
+        written = self.write_cards(cards, source_files)
+        return written, self.prune(source_files)
+
+    def _ids_for_sources(self, source_files: Sequence[str]) -> Dict[str, int]:
+        ids = {}
+        # 分批查询，避免超过SQLite参数个数上限
+        batch_size = 500
+        for start in range(0, len(source_files), batch_size):
+            batch = list(source_files[start:start + batch_size])
+            placeholders = ','.join('?' * len(batch))
+            for row in self.conn.execute(
+                f"SELECT id, source_file FROM cards WHERE source_file IN ({placeholders})", batch
+            ):
+                ids[row['source_file']] = row['id']
+        return ids
+
+    def load_cards(self, hero: Optional[str] = None, tier: Optional[str] = None,
+                   tag: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        按条件读取卡牌（参数绑定，条件之间为 AND），返回与 cards_data.json 相同结构的字典列表
+
+        Args:
+            hero: 英雄名，例如 "vanessa"（不区分大小写）
+            tier: 初始稀有度，例如 "Bronze"（不区分大小写）
+            tag: 必须包含的标签，例如 "Weapon"
+
+        Returns:
+            卡牌字典列表（按写入顺序）
+        """
+        clauses, params = [], []
+        if hero:
+            clauses.append("c.hero = ?")
+            params.append(hero.lower())
+        if tier:
+            clauses.append("c.tier = ? COLLATE NOCASE")
+            params.append(tier)
+        if tag:
+            clauses.append("c.id IN (SELECT card_id FROM card_tags WHERE tag = ?)")
+            params.append(tag)
+
+        sql = "SELECT c.* FROM cards c"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY c.id"
+
+        rows = self.conn.execute(sql, params).fetchall()
+        if not rows:
+            return []
+
+        cards: Dict[int, Dict[str, Any]] = {}
+        for row in rows:
+            card = {
+                'name': row['name'],
+                'name_en': row['name_en'],
+                'types': json.loads(row['types']),
+                'cooldown': row['cooldown'],
+                'damage': row['damage'],
+                'effect': row['effect'],
+                'tags': [],
+                'cost': {},
+                'value': {},
+            }
+            if row['tier'] is not None:
+                card['tier'] = row['tier']
+            cards[row['id']] = card
+
+        self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS selected_ids (id INTEGER PRIMARY KEY)")
+        with self.conn:
+            self.conn.execute("DELETE FROM selected_ids")
+            self.conn.executemany("INSERT INTO selected_ids VALUES (?)", [(card_id,) for card_id in cards])
+
+        for row in self.conn.execute(
+            "SELECT card_id, tag FROM card_tags WHERE card_id IN (SELECT id FROM selected_ids) "
+            "ORDER BY card_id, position"
+        ):
+            cards[row['card_id']]['tags'].append(row['tag'])
+
+        for row in self.conn.execute(
+            "SELECT card_id, kind, tier, amount FROM card_prices WHERE card_id IN (SELECT id FROM selected_ids) "
+            "ORDER BY card_id, rowid"
+        ):
+            cards[row['card_id']][row['kind']][row['tier']] = row['amount']
+
+        for row in self.conn.execute(
+            "SELECT card_id, attribute, tier, value FROM card_mechanics "
+            "WHERE card_id IN (SELECT id FROM selected_ids) ORDER BY card_id, rowid"
+        ):
+            base = cards[row['card_id']].setdefault('deep_mechanics', {'base': {}})['base']
+            base.setdefault(row['attribute'], {})[row['tier']] = json.loads(row['value'])
+
+        for row in self.conn.execute(
+            "SELECT card_id, merchant FROM card_merchants WHERE card_id IN (SELECT id FROM selected_ids) "
+            "ORDER BY card_id, position"
+        ):
+            cards[row['card_id']].setdefault('merchants', []).append(row['merchant'])
+
+        return list(cards.values())
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
@@ -1,20 +1,34 @@
 #!/usr/bin/env python3
 """
 Script to fetch a webpage, save snapshot as YAML, and download images from specific div
-Usage: python fetch_page.py <url>
+Usage: python fetch_page.py [--scoped] [--with-mechanics] [--with-merchants]
+       python fetch_page.py --structured [--audit-snapshot]
+       python fetch_page.py [--limit N] [--budget MINUTES] [--min-age HOURS]
+       python fetch_page.py --rescope <yml_dir>
 """
 
+import argparse
+import signal
 import sys
 import subprocess
+import threading
+import time
 import json
 import os
 import requests
 import re
 import yaml
-import base64
 from pathlib import Path
 from urllib.parse import urljoin, urlparse, unquote
 
+from image_store import ImageStore
+from parse_card_yml import CardYMLParser
+from profiling import Profiler, add_profile_arguments
+from recrawl_scheduler import MIN_RECRAWL_AGE_HOURS, STATE_FILE, RecrawlScheduler, card_fingerprint
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from convert_card_data import get_source_hero  # noqa: E402
+
 
 def extract_name_from_url(url):
     """Extract card name from URL for filename"""
@@ -42,15 +56,300 @@ def extract_name_from_url(url):
     return "page"
 
 
-def run_playwright_cli(args, session='default'):
-    """Run playwright-cli command and return output"""
+# First line of a scoped snapshot; the parser uses it to drop full-page line windows
+SCOPED_HEADER = '# scoped-snapshot'
+
+# Anchor of the card-info region and the markers its subtree must contain,
+# strictest first
+CARD_INFO_ANCHOR = re.compile(r'heading "[^"]+" \[level=1\]')
+CARD_INFO_MARKERS = [
+    [re.compile(r'generic \[ref=[^\]]+\].*Tags'), re.compile(r' is a (small|medium|large) ')],
+    [re.compile(r'generic \[ref=[^\]]+\].*Tags')],
+]
+MECHANICS_ANCHOR = re.compile(r'heading .*Deep Mechanics')
+MERCHANTS_ANCHOR = re.compile(r'Merchant Pools')
+
+
+def line_indent(line):
+    return len(line) - len(line.lstrip())
+
+
+def subtree_end(lines, start):
+    """Index just past the subtree rooted at lines[start]"""
+    indent = line_indent(lines[start])
+    end = start + 1
+    while end < len(lines) and (not lines[end].strip() or line_indent(lines[end]) > indent):
+        end += 1
+    return end
+
+
+def ancestors(lines, index):
+    """Indices of the enclosing nodes of lines[index], nearest first"""
+    indent = line_indent(lines[index])
+    for i in range(index - 1, -1, -1):
+        if lines[i].strip() and line_indent(lines[i]) < indent:
+            indent = line_indent(lines[i])
+            yield i
+
+
+def find_anchor(lines, pattern, start=0):
+    for i in range(start, len(lines)):
+        if pattern.search(lines[i]):
+            return i
+    return None
+
+
+def enclosing_region(lines, anchor, markers):
+    """Smallest ancestor subtree of the anchor that contains every marker"""
+    for root in ancestors(lines, anchor):
+        end = subtree_end(lines, root)
+        if all(any(m.search(line) for line in lines[root:end]) for m in markers):
+            return root, end
+    return None
+
+
+def section_region(lines, anchor):
+    """The anchor's parent subtree (heading plus its sibling content)"""
+    parent = next(ancestors(lines, anchor), None)
+    if parent is None:
+        return anchor, subtree_end(lines, anchor)
+    return parent, subtree_end(lines, parent)
+
+
+def scope_snapshot(lines, with_mechanics=False, with_merchants=False):
+    """
+    Cut a full-page snapshot down to the card-detail subtree, plus the
+    deep-mechanics and merchant subtrees when requested.
+    Returns the scoped lines, or None if the card-info region is not found.
+    """
+    anchor = find_anchor(lines, CARD_INFO_ANCHOR)
+    if anchor is None:
+        return None
+
+    card_region = None
+    for markers in CARD_INFO_MARKERS:
+        card_region = enclosing_region(lines, anchor, markers)
+        if card_region:
+            break
+    if not card_region:
+        return None
+
+    regions = [('card-info', card_region)]
+    if with_mechanics:
+        mechanics = find_anchor(lines, MECHANICS_ANCHOR)
+        if mechanics is not None:
+            regions.append(('deep-mechanics', section_region(lines, mechanics)))
+    if with_merchants:
+        merchants = find_anchor(lines, MERCHANTS_ANCHOR)
+        if merchants is not None:
+            regions.append(('merchants', section_region(lines, merchants)))
+
+    scoped = [f"{SCOPED_HEADER}: {', '.join(name for name, _ in regions)}\n"]
+    covered_end = -1
+    for _, (start, end) in sorted(regions, key=lambda r: r[1][0]):
+        # Skip regions already contained in an earlier one
+        start = max(start, covered_end)
+        if start < end:
+            scoped.extend(lines[start:end])
+            covered_end = end
+    return scoped
+
+
+def scope_snapshot_file(input_file, output_file, with_mechanics=False, with_merchants=False):
+    """Scope a saved full-page snapshot; returns False if it could not be scoped"""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+
+    if lines and lines[0].startswith(SCOPED_HEADER):
+        scoped = lines
+    else:
+        scoped = scope_snapshot(lines, with_mechanics, with_merchants)
+        if scoped is None:
+            return False
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.writelines(scoped)
+    return True
+
+
+# Per-command timeouts (seconds); a command that runs longer is killed and retried
+COMMAND_TIMEOUTS = {'open': 60, 'snapshot': 60, 'eval': 30, 'close': 20}
+DEFAULT_COMMAND_TIMEOUT = 60
+COMMAND_RETRIES = 1
+TIMEOUT_RETURNCODE = 124
+
+# Restart the browser session after this many pages or above this RSS
+RECYCLE_AFTER_PAGES = 200
+MAX_BROWSER_RSS_MB = 2048
+
+# Sessions with a command that timed out on every attempt
+_hung_sessions = set()
+_hung_lock = threading.Lock()
+
+
+def kill_process_tree(process):
+    """Kill a command started with start_new_session=True and reap it"""
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+    process.communicate()
+
+
+def run_playwright_cli(args, session='default', timeout=None):
+    """Run playwright-cli command and return output, killing and retrying it on timeout"""
     cmd = ['playwright-cli', f'-s={session}'] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    return result.stdout, result.stderr, result.returncode
+    if timeout is None:
+        timeout = COMMAND_TIMEOUTS.get(args[0] if args else '', DEFAULT_COMMAND_TIMEOUT)
+
+    for attempt in range(1, COMMAND_RETRIES + 2):
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                   text=True, start_new_session=True)
+        try:
+            stdout, stderr = process.communicate(timeout=timeout)
+            return stdout, stderr, process.returncode
+        except subprocess.TimeoutExpired:
+            kill_process_tree(process)
+            print(f"⚠ playwright-cli {args[0] if args else ''} timed out after {timeout}s (attempt {attempt})")
+
+    with _hung_lock:
+        _hung_sessions.add(session)
+    return '', f'timed out after {timeout}s', TIMEOUT_RETURNCODE
+
+
+def session_processes(session):
+    """
+    PIDs of the processes whose command line names the session, plus all of
+    their descendants (browser, renderers). Linux only; None elsewhere.
+    """
+    proc = Path('/proc')
+    if not proc.is_dir():
+        return None
 
+    pattern = re.compile(rf'(?<![\w-]){re.escape(session)}(?![\w-])')
+    parents = {}
+    children = {}
+    seeds = []
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            cmdline = (entry / 'cmdline').read_bytes().replace(b'\0', b' ').decode('utf-8', 'replace')
+            ppid = int((entry / 'stat').read_text().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        pid = int(entry.name)
+        parents[pid] = ppid
+        children.setdefault(ppid, []).append(pid)
+        if pattern.search(cmdline):
+            seeds.append(pid)
+
+    # Never count (or kill) this crawler or the shell that started it
+    own = set()
+    pid = os.getpid()
+    while pid and pid not in own:
+        own.add(pid)
+        pid = parents.get(pid)
+    seeds = [pid for pid in seeds if pid not in own]
+
+    pids = set()
+    pending = list(seeds)
+    while pending:
+        pid = pending.pop()
+        if pid not in pids:
+            pids.add(pid)
+            pending.extend(children.get(pid, ()))
+    return pids
+
+
+def session_rss_mb(session):
+    """Resident memory of a session's processes in MB, or None if unknown"""
+    pids = session_processes(session)
+    if not pids:
+        return None
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/statm') as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, ValueError, IndexError):
+            continue
+    return total / 1024 / 1024
+
+
+class SessionWatchdog:
+    """
+    Keeps one playwright-cli session usable across a long crawl: recycles it
+    after max_pages pages, when its RSS exceeds max_rss_mb or after a command
+    hung, and restarts it and retries once when a failed page left it dead.
+    """
+
+    def __init__(self, session, max_pages=RECYCLE_AFTER_PAGES, max_rss_mb=MAX_BROWSER_RSS_MB):
+        self.session = session
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.pages = 0
+        self.restarts = 0
+
+    def recycle_reason(self):
+        with _hung_lock:
+            if self.session in _hung_sessions:
+                _hung_sessions.discard(self.session)
+                return 'a command hung'
+        if self.max_pages and self.pages >= self.max_pages:
+            return f'{self.pages} pages loaded'
+        if self.max_rss_mb:
+            rss = session_rss_mb(self.session)
+            if rss is not None and rss > self.max_rss_mb:
+                return f'browser RSS {rss:.0f} MB'
+        return None
 
-def save_snapshot(url, session='default', output_file='page.yml'):
-    """Open URL with playwright-cli and save snapshot as YAML"""
+    def is_healthy(self):
+        stdout, _, returncode = run_playwright_cli(['eval', '() => document.readyState'], self.session)
+        return returncode == 0 and bool(stdout.strip())
+
+    def restart(self, reason):
+        print(f"↻ Restarting browser session {self.session} ({reason})")
+        _, _, returncode = run_playwright_cli(['close'], self.session)
+        if returncode != 0:
+            # close failed or hung: make sure nothing of the old browser survives
+            for pid in session_processes(self.session) or ():
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except (ProcessLookupError, PermissionError):
+                    pass
+        with _hung_lock:
+            _hung_sessions.discard(self.session)
+        self.pages = 0
+        self.restarts += 1
+
+    def run(self, fetch, *args):
+        """Call fetch(*args) for one page, restarting the session around it as needed"""
+        reason = self.recycle_reason()
+        if reason:
+            self.restart(reason)
+
+        # fetch returns a falsy value only on failure (process_url: False)
+        result = fetch(*args)
+        self.pages += 1
+        if not result and not self.is_healthy():
+            self.restart('health check failed')
+            result = fetch(*args)
+            self.pages += 1
+        return result
+
+
+# Seconds to wait after open for lazy-loaded images
+LAZY_LOAD_WAIT_SECONDS = 3
+
+
+def open_page(url, session='default'):
+    """Open URL with playwright-cli and wait for lazy-loaded images"""
     print(f"Opening URL: {url}")
 
     # Open the URL
@@ -62,12 +361,31 @@ def save_snapshot(url, session='default', output_file='page.yml'):
 
     # Wait for lazy load images to load
     print(f"Waiting for images to load...")
-    import time
-    time.sleep(3)  # Wait 3 seconds for lazy load
+    time.sleep(LAZY_LOAD_WAIT_SECONDS)
+    return True
+
+
+def save_snapshot(url, session='default', output_file='page.yml', scope=None, opened=False):
+    """
+    Open URL with playwright-cli and save snapshot as YAML.
+    scope: optional dict with with_mechanics/with_merchants; when given only
+    the card-detail subtrees are kept (falls back to the full page).
+    opened: the page is already loaded in this session
+    """
+    if not opened and not open_page(url, session):
+        return False
 
     # Take a snapshot with custom filename
     print(f"Taking snapshot...")
-    stdout, stderr, returncode = run_playwright_cli(['snapshot', f'--filename={output_file}'], session)
+    snapshot_file = f'{output_file}.full' if scope is not None else output_file
+    stdout, stderr, returncode = run_playwright_cli(['snapshot', f'--filename={snapshot_file}'], session)
+
+    if scope is not None and returncode == 0 and os.path.exists(snapshot_file):
+        if not scope_snapshot_file(snapshot_file, output_file, **scope):
+            print(f"⚠ Card-info region not found, keeping full snapshot")
+            os.replace(snapshot_file, output_file)
+        else:
+            os.remove(snapshot_file)
 
     if returncode == 0 and os.path.exists(output_file):
         file_size = os.path.getsize(output_file)
@@ -105,42 +423,195 @@ def get_image_url(session='default'):
     return None
 
 
+# Streamed records from --structured mode, one JSON object per line
+STREAM_FILE = 'cards_stream.jsonl'
+_stream_lock = threading.Lock()
+
+# One DOM pass returning every basic field of the card page as a JSON string.
+# Ports the rules of CardYMLParser.extract_basic_info (effect keywords, number
+# lines after the effect, the damage fallbacks). The parser walks
+# accessibility nodes and this walks innerText lines, so markup that splits
+# or merges lines differently can still disagree; bench/check_structured.py
+# compares both on real pages.
+EXTRACT_CARD_JS = r'''() => {
+  const text = el => ((el && el.textContent) || '').trim();
+  const h1 = document.querySelector('h1');
+  const name = text(h1);
+  const isLabel = (el, label) => el.children.length === 0 && text(el) === label;
+  const hasLabel = (el, label) => Array.from(el.querySelectorAll('*')).some(e => isLabel(e, label));
+  let root = h1 ? h1.parentElement : document.body;
+  while (root && root !== document.body && !hasLabel(root, 'Tags')) root = root.parentElement;
+  root = root || document.body;
+  const labelBlock = label => {
+    const el = Array.from(root.querySelectorAll('*')).find(e => isLabel(e, label));
+    return el ? el.parentElement : null;
+  };
+  const goldTiers = label => {
+    const m = text(labelBlock(label)).match(/(\d+)\s*»\s*(\d+)\s*»\s*(\d+)\s*gold/);
+    return m ? { silver: +m[1], gold: +m[2], diamond: +m[3] } : {};
+  };
+  const tagsBlock = labelBlock('Tags');
+  const tags = tagsBlock
+    ? [...new Set(Array.from(tagsBlock.querySelectorAll('a')).map(text))]
+        .filter(t => t && !['Tags', 'Cost', 'Value'].includes(t))
+    : [];
+  let nameEn = null;
+  for (const a of document.querySelectorAll('a[href*="/card/"]')) {
+    if (text(a) !== name && a.getAttribute('aria-label') !== `See details for ${name}`) continue;
+    const m = (a.getAttribute('href') || '').match(/\/card\/[a-z0-9]+\/([A-Za-z0-9\-]+)/);
+    if (m) { nameEn = m[1].replace(/-/g, ' '); break; }
+  }
+  const page = document.body.innerText;
+  const escaped = name.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+  const info = name ? page.match(new RegExp(escaped + ' is a (small|medium|large) ([\\w\\s]+) (item|skill)')) : null;
+  const tier = page.match(/starting tier is (\w+)/);
+  const rootText = root.innerText || '';
+  const rootLines = rootText.split('\n').map(l => l.trim()).filter(Boolean);
+  const cooldown = rootText.match(/(\d+\.?\d*)\s*秒/);
+  let damage = null;
+  for (const line of rootLines) {
+    if (!line.includes('伤害')) continue;
+    damage = line.match(/造成(\d+)伤害/) || line.match(/(\d+)\s*伤害/) || line.match(/Damage.*?(\d+)/);
+    if (damage) break;
+  }
+  const effectLines = [];
+  for (const line of rootLines) {
+    if (line.includes('Tags') && effectLines.length) break;
+    if (line === name || line.includes('秒') || ['Info', 'Types', 'Tags', 'Cost', 'Value'].includes(line)) continue;
+    if (/[\u4e01-\u9ffe]/.test(line) || /damage|when|trigger|gain|add/.test(line.toLowerCase())) {
+      effectLines.push(line);
+    } else if (effectLines.length && /^[+\-]?\d+$/.test(line)) {
+      effectLines.push(line);
+    }
+  }
+  const img = Array.from(document.querySelectorAll('div._aN.undefined img[src]'))
+    .map(i => i.src).filter(src => src.startsWith('http'))[0] || null;
+  return JSON.stringify({
+    name, nameEn,
+    size: info ? info[1] : null, category: info ? info[2].trim() : null, cardType: info ? info[3] : null,
+    tier: tier ? tier[1] : null,
+    cooldown: cooldown ? parseFloat(cooldown[1]) : null,
+    damage: damage ? parseInt(damage[1], 10) : null,
+    effect: effectLines.join(' ') || null,
+    tags, cost: goldTiers('Cost'), value: goldTiers('Value'), image: img,
+  });
+}'''
+
+
+def parse_eval_json(stdout):
+    """Find the JSON object in playwright-cli eval output (possibly string-encoded)"""
+    for line in stdout.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            value = json.loads(line)
+            if isinstance(value, str):
+                value = json.loads(value)
+        except ValueError:
+            continue
+        if isinstance(value, dict):
+            return value
+    return None
+
+
+def record_to_card(record, card_name):
+    """Normalize an in-browser record into the cards_data.json shape"""
+    card = {
+        'name': record.get('name') or card_name,
+        'name_en': record.get('nameEn'),
+        'types': [],
+        'cooldown': float(record['cooldown']) if record.get('cooldown') is not None else None,
+        'damage': record.get('damage'),
+        'effect': record.get('effect'),
+        'tags': record.get('tags') or [],
+        'cost': record.get('cost') or {},
+        'value': record.get('value') or {},
+    }
+    if record.get('size'):
+        card['types'].append(record['size'].capitalize())
+        category = record.get('category')
+        if category and category != 'neutral':
+            card['types'].append(category.capitalize())
+        card['types'].append(record['cardType'].capitalize())
+    if record.get('tier'):
+        card['tier'] = record['tier']
+    return card
+
+
+def extract_card_record(session='default'):
+    """Run one DOM eval on the open page and return (card fields, image URL)"""
+    print(f"\nExtracting card fields in browser...")
+    stdout, stderr, returncode = run_playwright_cli(['eval', EXTRACT_CARD_JS], session)
+
+    record = parse_eval_json(stdout) if returncode == 0 else None
+    if not record or not record.get('name'):
+        print(f"✗ Structured extraction failed")
+        print(f"Output: {stdout[:200]}")
+        return None
+    return record
+
+
+def load_stream_records(stream_file=STREAM_FILE):
+    """Source name -> card already in the record stream (the last record of a card wins)"""
+    records = {}
+    if os.path.exists(stream_file):
+        with open(stream_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record.pop('source_file', None)] = record
+    return records
+
+
+def load_stream_sources(stream_file=STREAM_FILE):
+    """Source names already present in the record stream"""
+    return set(load_stream_records(stream_file))
+
+
+def append_stream_record(card, source_file, stream_file=STREAM_FILE):
+    """Append one card to the record stream (safe across worker threads)"""
+    line = json.dumps({'source_file': source_file, **card}, ensure_ascii=False)
+    with _stream_lock:
+        with open(stream_file, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+
+
+_image_stores = {}
+_image_stores_lock = threading.Lock()
+
+
+def get_image_store(output_dir='images'):
+    """Shared content-addressed store for an image directory"""
+    with _image_stores_lock:
+        store = _image_stores.get(output_dir)
+        if store is None:
+            store = _image_stores[output_dir] = ImageStore(output_dir)
+        return store
+
+
 def save_image(img_data, output_dir='images', base_filename='image'):
-    """Save image data to local directory (supports both URL and base64)"""
+    """Save image data to the content-addressed store (supports both URL and base64)"""
     # Create output directory if it doesn't exist
     Path(output_dir).mkdir(exist_ok=True)
+    store = get_image_store(output_dir)
 
     try:
         if img_data.startswith('data:'):
             # Handle base64 encoded image
+            # Format: data:image/webp;base64,<data>, decoded in chunks
             print(f"\nProcessing base64 encoded image...")
 
-            # Extract base64 data
-            # Format: data:image/webp;base64,<data>
-            match = re.match(r'data:image/(\w+);base64,(.+)', img_data)
-            if match:
-                img_format = match.group(1)
-                base64_data = match.group(2)
-
-                # Create filename with correct extension
-                filename = f'{base_filename}.{img_format}'
-                output_path = os.path.join(output_dir, filename)
-
-                print(f"Saving to: {output_path}")
-
-                # Decode and save
-                img_bytes = base64.b64decode(base64_data)
-                with open(output_path, 'wb') as f:
-                    f.write(img_bytes)
-
-                print(f"✓ Base64 image saved successfully")
-                print(f"  File size: {len(img_bytes)} bytes")
-                print(f"  Format: {img_format}")
-                return output_path
-            else:
+            result = store.put_data_uri(base_filename, img_data)
+            if not result:
                 print(f"✗ Invalid base64 image format")
                 return None
 
+            output_path, sha256, written = result
+            print(f"✓ Base64 image {'saved' if written else 'unchanged'}: {output_path}")
+            print(f"  SHA-256: {sha256}")
+            return output_path
+
         elif img_data.startswith('http'):
             # Handle URL - detect extension from URL
             parsed_url = urlparse(img_data)
@@ -151,9 +622,7 @@ def save_image(img_data, output_dir='images', base_filename='image'):
             if not ext or ext not in ['.webp', '.jpg', '.jpeg', '.png', '.gif']:
                 ext = '.jpg'  # default extension
 
-            filename = f'{base_filename}{ext}'
-            output_path = os.path.join(output_dir, filename)
-            return download_image_from_url(img_data, output_path)
+            return download_image_from_url(img_data, store, base_filename, ext)
 
         else:
             print(f"✗ Unknown image data format")
@@ -164,28 +633,51 @@ def save_image(img_data, output_dir='images', base_filename='image'):
         return None
 
 
-def download_image_from_url(img_url, output_path):
-    """Download image from URL"""
+def download_image_from_url(img_url, store, base_filename, ext):
+    """Stream an image from URL into the store, skipping unchanged art"""
     print(f"\nDownloading image from: {img_url}")
-    print(f"Saving to: {output_path}")
 
-    try:
-        response = requests.get(img_url, timeout=30)
-        response.raise_for_status()
-
-        with open(output_path, 'wb') as f:
-            f.write(response.content)
+    # Revalidate with the server when this exact URL was stored before
+    headers = {}
+    previous = store.entry(base_filename)
+    readable = Path(store.root) / f'{base_filename}{ext}'
+    if previous and previous.get('url') == img_url and previous.get('ext') == ext and readable.exists():
+        if previous.get('etag'):
+            headers['If-None-Match'] = previous['etag']
+        if previous.get('last_modified'):
+            headers['If-Modified-Since'] = previous['last_modified']
 
-        print(f"✓ Image downloaded successfully")
-        print(f"  File size: {len(response.content)} bytes")
+    try:
+        with requests.get(img_url, timeout=30, stream=True, headers=headers) as response:
+            if response.status_code == 304:
+                print(f"✓ Image unchanged (not modified): {readable}")
+                return str(readable)
+            response.raise_for_status()
+
+            meta = {'url': img_url}
+            if response.headers.get('ETag'):
+                meta['etag'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                meta['last_modified'] = response.headers['Last-Modified']
+
+            output_path, sha256, written = store.put_stream(
+                base_filename, response.iter_content(chunk_size=64 * 1024), ext, **meta
+            )
+
+        print(f"✓ Image {'downloaded' if written else 'unchanged'}: {output_path}")
+        print(f"  SHA-256: {sha256}")
         return output_path
     except Exception as e:
         print(f"✗ Failed to download image: {e}")
         return None
 
 
-def process_url(url, session='fetch_page_session'):
-    """Process a single URL"""
+def process_url(url, session='fetch_page_session', scope=None, refetch=False):
+    """
+    Process a single URL (refetch: overwrite an existing snapshot).
+    Returns True on success, False on failure; a card without an image
+    succeeds as long as its snapshot was saved.
+    """
     # Add /zh-CN suffix to URL if not already present
     if not url.endswith('/zh-CN'):
         url = url.rstrip('/') + '/zh-CN'
@@ -199,13 +691,14 @@ def process_url(url, session='fetch_page_session'):
 
     # Check if yml file already exists
     yaml_file = f'yml/{card_name}.yml'
-    if os.path.exists(yaml_file):
+    if os.path.exists(yaml_file) and not refetch:
         print(f"✓ YAML file already exists, skipping: {yaml_file}")
         return True
 
     try:
         # Step 1: Save page snapshot as YAML
-        if not save_snapshot(url, session, yaml_file):
+        snapshot_saved = save_snapshot(url, session, yaml_file, scope)
+        if not snapshot_saved:
             print("\nWarning: Failed to save snapshot, but continuing...")
 
         # Step 2: Extract image URL from DOM
@@ -213,6 +706,7 @@ def process_url(url, session='fetch_page_session'):
 
         if not img_data:
             print("\n⚠ No image found to download")
+            return snapshot_saved
         else:
             # Step 3: Save the image (handles both URL and base64)
             output_path = save_image(img_data, base_filename=card_name)
@@ -232,7 +726,76 @@ def process_url(url, session='fetch_page_session'):
         return False
 
 
-def main():
+def process_url_structured(url, session='fetch_page_session', audit_snapshot=False, stream_file=STREAM_FILE):
+    """
+    Process a single URL with one in-browser extraction instead of a snapshot.
+    Returns the card dict (also appended to the record stream), or None.
+    """
+    if not url.endswith('/zh-CN'):
+        url = url.rstrip('/') + '/zh-CN'
+
+    card_name = extract_name_from_url(url)
+
+    print(f"\nStarting structured extraction for URL: {url}")
+    print(f"Card name: {card_name}")
+    print("=" * 60)
+
+    try:
+        if not open_page(url, session):
+            return None
+
+        # Optional audit artifact: the snapshot is no longer parsed
+        if audit_snapshot:
+            save_snapshot(url, session, f'yml/{card_name}.yml', opened=True)
+
+        record = extract_card_record(session)
+        if not record:
+            return None
+
+        card = record_to_card(record, card_name)
+        append_stream_record(card, card_name, stream_file)
+
+        if record.get('image'):
+            output_path = save_image(record['image'], base_filename=card_name)
+            if not output_path:
+                print("\n✗ Failed to save image")
+        else:
+            print("\n⚠ No image found to download")
+
+        print(f"✓ Extracted: {card['name']} ({len(card['tags'])} tags)")
+        return card
+
+    except Exception as e:
+        print(f"\n✗ Error processing {url}: {e}")
+        return None
+
+
+def rescope_directory(yml_dir, with_mechanics=False, with_merchants=False):
+    """Scope every saved full-page snapshot in a directory in place"""
+    scoped_count = 0
+    before = after = 0
+    for yml_file in sorted(Path(yml_dir).glob('*.yml')):
+        before += yml_file.stat().st_size
+        if scope_snapshot_file(yml_file, yml_file, with_mechanics, with_merchants):
+            scoped_count += 1
+        else:
+            print(f"⚠ Card-info region not found: {yml_file}")
+        after += yml_file.stat().st_size
+
+    print(f"✓ Scoped {scoped_count} snapshots in {yml_dir}")
+    print(f"  Size: {before} -> {after} bytes")
+
+
+def snapshot_signals(yml_file):
+    """(fingerprint, hero) of a saved snapshot, from the same card fields structured mode records"""
+    card = CardYMLParser().parse_yml_file(Path(yml_file))
+    if not card:
+        return None, None
+    return card_fingerprint(card), get_source_hero(card.get('tags') or [])
+
+
+def fetch_links(args, scope=None):
+    """Fetch card_links.json in recrawl-priority order, within the link limit and time budget"""
     # Read card links from JSON file
     links_file = 'card_links.json'
 
@@ -243,52 +806,126 @@ def main():
     with open(links_file, 'r', encoding='utf-8') as f:
         card_links = json.load(f)
 
-    # Limit to first 3 links for testing
-    test_limit = 1000
-    card_links = card_links[:test_limit]
+    streamed = load_stream_sources() if args.structured else set()
+
+    def known_fetch_time(card_name):
+        # Cards crawled before crawl_state.json existed: age of what is on disk
+        yaml_file = f'yml/{card_name}.yml'
+        if os.path.exists(yaml_file):
+            return os.path.getmtime(yaml_file)
+        if card_name in streamed:
+            return os.path.getmtime(STREAM_FILE)
+        return None
+
+    scheduler = RecrawlScheduler.load(
+        args.state_file, card_links,
+        limit=args.limit or None,
+        budget_seconds=args.budget * 60 if args.budget else None,
+        min_age_hours=args.min_age,
+        source_name=extract_name_from_url,
+        known_fetch_time=known_fetch_time,
+    )
 
     print(f"Loaded {len(card_links)} URLs from {links_file}")
-    print(f"Processing first {test_limit} URLs for testing...\n")
+    print(f"Due for (re)crawl: {scheduler.total}, not due yet: {len(card_links) - scheduler.total}")
+    print(f"Limit: {args.limit or 'none'}, time budget: {f'{args.budget} min' if args.budget else 'none'}\n")
 
     session = 'fetch_page_session'
+    watchdog = SessionWatchdog(session, args.recycle_pages, args.max_browser_rss)
     success_count = 0
-    skip_count = 0
     fail_count = 0
 
     try:
-        for i, url in enumerate(card_links, 1):
+        for i, url in enumerate(scheduler, 1):
+            card_name = extract_name_from_url(url)
             print(f"\n{'='*80}")
-            print(f"Processing {i}/{len(card_links)}: {url}")
+            print(f"Processing {i}/{scheduler.total}: {url}")
             print(f"{'='*80}")
 
-            card_name = extract_name_from_url(url)
-            yaml_file = f'yml/{card_name}.yml'
-
-            if os.path.exists(yaml_file):
-                print(f"✓ Skipping (already exists): {yaml_file}")
-                skip_count += 1
-                continue
-
-            result = process_url(url, session)
-            if result:
+            if args.structured:
+                card = watchdog.run(process_url_structured, url, session, args.audit_snapshot)
+                ok = card is not None
+                fingerprint = card_fingerprint(card) if ok else None
+                hero = get_source_hero(card['tags']) if ok else None
+            else:
+                # Success means a fresh snapshot replaced whatever was on disk
+                yaml_file = f'yml/{card_name}.yml'
+                before = os.path.getmtime(yaml_file) if os.path.exists(yaml_file) else None
+                watchdog.run(process_url, url, session, scope, True)
+                ok = os.path.exists(yaml_file) and os.path.getmtime(yaml_file) != before
+                fingerprint, hero = snapshot_signals(yaml_file) if ok else (None, None)
+
+            scheduler.record(url, ok, fingerprint, hero)
+            if ok:
                 success_count += 1
             else:
                 fail_count += 1
 
+        summary = scheduler.summary()
         print(f"\n{'='*80}")
         print("Batch processing completed!")
-        print(f"  Total: {len(card_links)}")
+        print(f"  Due: {summary['due']}")
+        print(f"  Fetched: {summary['handed_out']} (avg {summary['avg_card_seconds']}s/card)")
         print(f"  Success: {success_count}")
-        print(f"  Skipped: {skip_count}")
         print(f"  Failed: {fail_count}")
+        print(f"  Left for next run: {summary['left']}")
+        print(f"  Session restarts: {watchdog.restarts}")
         print(f"{'='*80}")
 
     finally:
+        # Outcomes recorded since the last periodic save
+        scheduler.save()
         # Clean up: close the browser session
         print("\nClosing browser session...")
         run_playwright_cli(['close'], session)
         print("✓ Browser closed")
 
 
+# Functions timed individually under --profile
+PROFILED_STEPS = [
+    'run_playwright_cli', 'open_page', 'save_snapshot', 'get_image_url',
+    'save_image', 'extract_card_record', 'append_stream_record',
+]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Fetch card pages and images from bazaardb")
+    arg_parser.add_argument('--scoped', action='store_true', help="Only keep the card-detail subtree of each snapshot")
+    arg_parser.add_argument('--with-mechanics', action='store_true', help="Keep the Deep Mechanics subtree when scoping")
+    arg_parser.add_argument('--with-merchants', action='store_true', help="Keep the Merchant Pools subtree when scoping")
+    arg_parser.add_argument('--structured', action='store_true',
+                            help=f"Extract card fields in the browser and stream them to {STREAM_FILE}")
+    arg_parser.add_argument('--audit-snapshot', action='store_true',
+                            help="With --structured, also save the YAML snapshot as an audit artifact")
+    arg_parser.add_argument('--rescope', metavar='YML_DIR', help="Scope already saved snapshots in place and exit")
+    arg_parser.add_argument('--recycle-pages', type=int, default=RECYCLE_AFTER_PAGES, metavar='N',
+                            help="Restart the browser session every N pages (0: never)")
+    arg_parser.add_argument('--max-browser-rss', type=int, default=MAX_BROWSER_RSS_MB, metavar='MB',
+                            help="Restart the browser session when its RSS exceeds MB (0: never)")
+    arg_parser.add_argument('--limit', type=int, default=1000, metavar='N',
+                            help="Fetch at most N cards this run, highest priority first (0: no limit)")
+    arg_parser.add_argument('--budget', type=float, metavar='MINUTES',
+                            help="Stop starting new cards once this much crawl time is used")
+    arg_parser.add_argument('--min-age', type=float, default=MIN_RECRAWL_AGE_HOURS, metavar='HOURS',
+                            help="Do not recrawl cards fetched less than HOURS ago")
+    arg_parser.add_argument('--state-file', default=STATE_FILE,
+                            help="Per-card fetch history used for scheduling")
+    add_profile_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    scope = None
+    if args.scoped or args.rescope:
+        scope = {'with_mechanics': args.with_mechanics, 'with_merchants': args.with_merchants}
+
+    with Profiler.from_args('fetch_page', args) as profiler:
+        profiler.instrument(sys.modules[__name__], PROFILED_STEPS)
+        if args.rescope:
+            with profiler.stage('rescope'):
+                rescope_directory(args.rescope, **scope)
+        else:
+            with profiler.stage('crawl'):
+                fetch_links(args, scope)
+
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Debounced directory watching for --watch modes.
+
+On Linux changes come from inotify (through ctypes, no extra dependency);
+elsewhere the directories are polled by mtime and size. Either way a burst of
+events (an editor's save, a crawler writing many snapshots) is delivered as
+one batch once the directories have been quiet for the debounce interval.
+
+    for changed in watch_directories([Path('yml'), Path('images')]):
+        ...  # set of Paths; a file that no longer exists was deleted
+
+Only the top level of each directory is watched. If the kernel event queue
+overflows, the batch contains the directory itself, meaning "rescan it".
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+# inotify(7) event masks
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+DEFAULT_DEBOUNCE_SECONDS = 0.2
+# A steady stream of events still flushes a batch this often
+MAX_BATCH_DELAY_SECONDS = 2.0
+POLL_INTERVAL_SECONDS = 0.25
+
+
+def is_ignored(name):
+    """Editor swap/backup files and in-progress temp files"""
+    return name.startswith('.') or name.endswith(('~', '.tmp', '.part', '.swp'))
+
+
+class InotifySource:
+    """inotify watches on a set of directories"""
+
+    def __init__(self, directories):
+        libc_name = ctypes.util.find_library('c')
+        if not libc_name:
+            raise OSError('libc not found')
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, 'inotify_init1'):
+            raise OSError('inotify not available')
+
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self.directories = {}
+        for directory in directories:
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK)
+            if wd < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+            self.directories[wd] = Path(directory)
+
+    def close(self):
+        os.close(self.fd)
+
+    def wait(self, timeout):
+        """Changed paths, or an empty set if nothing happened within timeout (None = forever)"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                changed.update(self.directories.values())
+                continue
+            directory = self.directories.get(wd)
+            if directory is None or mask & IN_ISDIR or not name:
+                continue
+            name = os.fsdecode(name)
+            if not is_ignored(name):
+                changed.add(directory / name)
+        return changed
+
+
+class PollingSource:
+    """Fallback for platforms without inotify: compare (mtime, size) listings"""
+
+    def __init__(self, directories, interval=POLL_INTERVAL_SECONDS):
+        self.directories = [Path(d) for d in directories]
+        self.interval = interval
+        self.listing = self._scan()
+
+    def close(self):
+        pass
+
+    def _scan(self):
+        listing = {}
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if is_ignored(entry.name) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                listing[directory / entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return listing
+
+    def wait(self, timeout):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+
+            listing = self._scan()
+            changed = {path for path in listing.keys() | self.listing.keys()
+                       if listing.get(path) != self.listing.get(path)}
+            self.listing = listing
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+
+def open_source(directories, polling=False):
+    """inotify when available, polling otherwise"""
+    if not polling:
+        try:
+            return InotifySource(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingSource(directories)
+
+
+def watch_directories(directories, debounce=DEFAULT_DEBOUNCE_SECONDS, polling=False):
+    """Yield debounced batches of changed paths forever"""
+    source = open_source(directories, polling)
+    print(f"Watching {', '.join(str(d) for d in directories)} "
+          f"({'inotify' if isinstance(source, InotifySource) else 'polling'})")
+    try:
+        while True:
+            changed = source.wait(None)
+            if not changed:
+                continue
+            first_event = time.monotonic()
+            while time.monotonic() - first_event < MAX_BATCH_DELAY_SECONDS:
+                more = source.wait(debounce)
+                if not more:
+                    break
+                changed |= more
+            yield changed
+    finally:
+        source.close()
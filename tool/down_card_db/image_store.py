@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Content-addressed image store.
+
+Image bytes are hashed while they stream in and stored once under their
+SHA-256 (images/objects/ab/abcdef....webp). The human-readable
+images/<card_name>.<ext> is a hardlink (or symlink) to that object, and
+images/manifest.json maps card name -> hash so re-downloads of unchanged art
+are no-ops and downstream sync can compare hashes instead of copying.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+
+MANIFEST_FILE = 'manifest.json'
+OBJECTS_DIR = 'objects'
+
+# Base64 characters decoded per step; must be a multiple of 4
+BASE64_CHUNK = 64 * 1024
+
+DATA_URI_HEADER = re.compile(r'data:image/(\w+);base64,')
+
+
+def file_sha256(path, chunk_size=64 * 1024):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_base64_chunks(data, start=0, chunk_size=BASE64_CHUNK):
+    """Decode base64 text from data[start:] in bounded chunks"""
+    pending = ''
+    for offset in range(start, len(data), chunk_size):
+        pending += ''.join(data[offset:offset + chunk_size].split())
+        usable = len(pending) - len(pending) % 4
+        if usable:
+            yield base64.b64decode(pending[:usable])
+            pending = pending[usable:]
+    if pending:
+        # Tolerate missing padding at the very end
+        yield base64.b64decode(pending + '=' * (-len(pending) % 4))
+
+
+class ImageStore:
+    """Stores each distinct image once and links readable names to it"""
+
+    def __init__(self, root='images'):
+        self.root = Path(root)
+        self.objects_dir = self.root / OBJECTS_DIR
+        self.manifest_path = self.root / MANIFEST_FILE
+        self._lock = threading.Lock()
+        self.manifest = self._load_manifest()
+        # Readable file name -> sha256, kept in step with the manifest so
+        # readers (pipeline.py's convert stage) never reread manifest.json
+        self.hashes = {f"{name}{entry['ext']}": entry['sha256'] for name, entry in self.manifest.items()}
+
+    def _load_manifest(self):
+        if self.manifest_path.exists():
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def _save_manifest(self):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def object_path(self, sha256, ext):
+        return self.objects_dir / sha256[:2] / f'{sha256}{ext}'
+
+    def entry(self, name):
+        """Manifest entry for a card name, or None"""
+        return self.manifest.get(name)
+
+    def put_stream(self, name, chunks, ext, **meta):
+        """
+        Store an image from an iterable of byte chunks under a readable name.
+        Returns (readable path, sha256, whether new bytes were written).
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.objects_dir, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                for chunk in chunks:
+                    if chunk:
+                        digest.update(chunk)
+                        size += len(chunk)
+                        f.write(chunk)
+
+            sha256 = digest.hexdigest()
+            object_path = self.object_path(sha256, ext)
+            written = not object_path.exists()
+            if written:
+                object_path.parent.mkdir(exist_ok=True)
+                os.replace(tmp_path, object_path)
+            else:
+                os.remove(tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        readable = self.root / f'{name}{ext}'
+        with self._lock:
+            previous = self.manifest.get(name)
+            if previous and previous.get('ext') != ext:
+                stale = self.root / f"{name}{previous['ext']}"
+                if stale.is_symlink() or stale.exists():
+                    stale.unlink()
+                self.hashes.pop(stale.name, None)
+            self._link(object_path, readable)
+            self.manifest[name] = {'sha256': sha256, 'ext': ext, 'size': size, **meta}
+            self.hashes[readable.name] = sha256
+            self._save_manifest()
+
+        return str(readable), sha256, written
+
+    def put_data_uri(self, name, data_uri):
+        """Store a data:image/<fmt>;base64,... URI without decoding it all at once"""
+        match = DATA_URI_HEADER.match(data_uri)
+        if not match:
+            return None
+        ext = f'.{match.group(1)}'
+        return self.put_stream(name, iter_base64_chunks(data_uri, match.end()), ext)
+
+    def _link(self, object_path, readable):
+        """Point the readable name at the object: hardlink, then symlink, then copy"""
+        if readable.exists() and not readable.is_symlink():
+            try:
+                if os.path.samefile(readable, object_path):
+                    return
+            except OSError:
+                pass
+        if readable.is_symlink() or readable.exists():
+            readable.unlink()
+        try:
+            os.link(object_path, readable)
+        except OSError:
+            try:
+                os.symlink(os.path.relpath(object_path, readable.parent), readable)
+            except OSError:
+                shutil.copy2(object_path, readable)
+
+    def stats(self):
+        """Counts of names, distinct objects and bytes stored"""
+        objects = list(self.objects_dir.glob('*/*')) if self.objects_dir.exists() else []
+        return {
+            'names': len(self.manifest),
+            'objects': len(objects),
+            'bytes': sum(p.stat().st_size for p in objects),
+        }
@@ -9,16 +9,32 @@
 import os
 import re
 import json
+import argparse
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+from profiling import Profiler, add_profile_arguments
+
+
+DESCRIPTION_PATTERN = re.compile(r' is a (small|medium|large) ')
+
+
+def line_indent(line: str) -> int:
+    return len(line) - len(line.lstrip(' '))
 
 
 class CardYMLParser:
     """卡牌YML解析器"""
 
-    def __init__(self, yml_dir: str = "yml"):
+    def __init__(self, yml_dir: str = "yml", extract_extras: bool = False):
         self.yml_dir = Path(yml_dir)
+        self.scoped = False
+        # 整页快照中卡牌详情所在的行号区间 [lo, hi)，找不到时为 None
+        self.region: Optional[Tuple[int, int]] = None
+        self.extract_extras = extract_extras
         self.cards = []
+        # 与 cards 一一对应的源文件名，用于按文件覆盖数据库记录
+        self.source_files = []
 
     def parse_yml_file(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -36,13 +52,19 @@ class CardYMLParser:
             with open(file_path, 'r', encoding='utf-8') as f:
                 self.lines = f.readlines()
                 self.content = ''.join(self.lines)
+            # 局部快照（fetch_page.py --scoped）只含卡牌详情，不再需要整页行号窗口
+            self.scoped = bool(self.lines) and self.lines[0].startswith('# scoped-snapshot')
+            self.region = None if self.scoped else self.find_card_region()
         except Exception as e:
             print(f"  ✗ 读取文件失败: {e}")
             return {}
 
         try:
-            # 只提取基本信息
             card_data = self.extract_basic_info(file_path)
+            # 可选：深度机制与商人池
+            if self.extract_extras:
+                card_data['deep_mechanics'] = self.extract_deep_mechanics()
+                card_data['merchants'] = self.extract_merchants()
             print(f"  ✓ 成功解析")
 
         except Exception as e:
@@ -53,6 +75,40 @@ class CardYMLParser:
 
         return card_data
 
+    def find_card_region(self) -> Optional[Tuple[int, int]]:
+        """
+        卡牌详情区域：一级标题外层、同时包含 Tags 和类型描述的最小缩进块，
+        返回行号区间；导航很长时固定行号窗口会错过卡牌，用它代替
+        """
+        lines = self.lines
+        heading = next((i for i, line in enumerate(lines) if 'heading' in line and '[level=1]' in line), None)
+        if heading is None:
+            return None
+
+        fallback = None
+        start, indent = heading, line_indent(lines[heading])
+        while indent > 0:
+            # 向上找缩进更浅的父节点，块结束于下一个缩进不深于它的行
+            start = next((j for j in range(start - 1, -1, -1) if line_indent(lines[j]) < indent), None)
+            if start is None:
+                break
+            indent = line_indent(lines[start])
+            end = next((j for j in range(heading + 1, len(lines)) if line_indent(lines[j]) <= indent), len(lines))
+            block = lines[start:end]
+            if any('Tags' in line for line in block):
+                if any(DESCRIPTION_PATTERN.search(line) for line in block):
+                    return start, end
+                fallback = fallback or (start, end)
+        return fallback
+
+    def in_window(self, i: int, lo: int, hi: int) -> bool:
+        """整页快照限定在卡牌区域内（找不到时用行号窗口），局部快照不限制"""
+        if self.scoped:
+            return True
+        if self.region:
+            return self.region[0] <= i < self.region[1]
+        return lo < i < hi
+
     def extract_basic_info(self, file_path: Path) -> Dict[str, Any]:
         """提取基本卡牌信息"""
         card_info = {
@@ -75,7 +131,7 @@ class CardYMLParser:
                     card_info['name'] = match.group(1)
                     break
             # 备用方案：面包屑导航
-            if 100 < i < 150 and 'generic [ref=' in line and ']: ' in line:
+            if not self.scoped and 100 < i < 150 and 'generic [ref=' in line and ']: ' in line:
                 match = re.search(r'\]: (.+)', line)
                 if match:
                     text = match.group(1).strip()
@@ -117,7 +173,7 @@ class CardYMLParser:
 
         # 提取冷却时间 - 查找"秒"
         for i, line in enumerate(self.lines):
-            if '秒' in line and i < 300:
+            if '秒' in line and self.in_window(i, -1, 300):
                 for j in range(max(0, i - 3), i + 1):
                     match = re.search(r'"(\d+\.?\d*)"', self.lines[j])
                     if match:
@@ -128,7 +184,7 @@ class CardYMLParser:
 
         # 提取伤害值
         for i, line in enumerate(self.lines):
-            if '伤害' in line and i < 300:
+            if '伤害' in line and self.in_window(i, -1, 300):
                 match = re.search(r'造成(\d+)伤害', line)
                 if not match:
                     match = re.search(r'(\d+)\s*伤害', line)
@@ -142,7 +198,7 @@ class CardYMLParser:
         effect_parts = []
         in_effect_section = False
         for i, line in enumerate(self.lines):
-            if 100 < i < 250:
+            if self.in_window(i, 100, 250):
                 if 'text:' in line and 'heading' not in line and 'link' not in line:
                     match = re.search(r'text: (.+)', line)
                     if match:
@@ -305,17 +361,46 @@ class CardYMLParser:
         except (ValueError, AttributeError):
             return value
 
+    def load_stream(self, stream_file: str = "cards_stream.jsonl") -> int:
+        """
+        读取 fetch_page.py --structured 在浏览器内提取的卡牌记录，
+        这些卡牌不再需要解析YML快照
+
+        Returns:
+            读取的记录数
+        """
+        stream_path = Path(stream_file)
+        if not stream_path.exists():
+            print(f"警告: 记录流文件 {stream_path} 不存在")
+            return 0
+
+        # 同一卡牌多次抓取时以最后一条为准
+        records = {}
+        with open(stream_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record.pop('source_file')] = record
+
+        for source_file, card in records.items():
+            self.cards.append(card)
+            self.source_files.append(source_file)
+
+        print(f"\n从记录流读取 {len(records)} 张卡牌: {stream_path}")
+        return len(records)
+
     def parse_all_files(self) -> List[Dict[str, Any]]:
-        """解析YML目录下的所有文件"""
+        """解析YML目录下的所有文件（已有结构化记录的卡牌跳过）"""
         if not self.yml_dir.exists():
             print(f"错误: 目录 {self.yml_dir} 不存在")
-            return []
+            return self.cards
 
-        yml_files = list(self.yml_dir.glob("*.yml"))
+        streamed = set(self.source_files)
+        yml_files = [f for f in self.yml_dir.glob("*.yml") if f.stem not in streamed]
 
         if not yml_files:
             print(f"警告: 在 {self.yml_dir} 中没有找到YML文件")
-            return []
+            return self.cards
 
         print(f"\n找到 {len(yml_files)} 个YML文件")
         print("-" * 60)
@@ -324,6 +409,7 @@ class CardYMLParser:
             card_info = self.parse_yml_file(yml_file)
             if card_info:
                 self.cards.append(card_info)
+                self.source_files.append(yml_file.stem)
 
         return self.cards
 
@@ -350,6 +436,28 @@ class CardYMLParser:
         except Exception as e:
             print(f"导出JSON文件时出错: {e}")
 
+    def export_to_sqlite(self, db_file: str = "cards.db"):
+        """批量写入SQLite数据库（WAL模式），按源文件覆盖已有记录"""
+        if not self.cards:
+            print("警告: 没有卡牌数据可导出")
+            return
+
+        from card_store import CardStore
+
+        try:
+            # 完整解析：快照已删除的卡牌也从数据库移除，与 cards_data.json 保持一致
+            with CardStore(db_file) as store:
+                written, removed = store.replace_all(self.cards, self.source_files)
+                total = store.count()
+
+            print(f"\n成功写入 {written} 张卡牌到数据库: {Path(db_file).absolute()}")
+            if removed:
+                print(f"删除已不存在的卡牌: {removed}")
+            print(f"数据库总卡牌数: {total}")
+
+        except Exception as e:
+            print(f"写入数据库时出错: {e}")
+
     def print_summary(self):
         """打印解析结果摘要"""
         if not self.cards:
@@ -389,26 +497,47 @@ class CardYMLParser:
 
 def main():
     """主函数"""
+    arg_parser = argparse.ArgumentParser(description="游戏卡牌YML深度解析工具")
+    arg_parser.add_argument('--db', help="同时写入SQLite数据库（例如 cards.db）")
+    arg_parser.add_argument('--stream', help="合并 fetch_page.py --structured 输出的记录流（例如 cards_stream.jsonl）")
+    arg_parser.add_argument('--extras', action='store_true', help="额外提取深度机制与商人池")
+    add_profile_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
     print("=" * 60)
     print("游戏卡牌YML深度解析工具")
     print("=" * 60)
 
     # 创建解析器实例
-    parser = CardYMLParser(yml_dir="yml")
-
-    # 解析所有YML文件
-    cards = parser.parse_all_files()
-
-    if cards:
-        # 打印摘要
-        parser.print_summary()
-
-        # 导出为JSON
-        parser.export_to_json(output_file="cards_data.json", indent=2)
-
-        print("\n✓ 解析完成!")
-    else:
-        print("\n✗ 没有解析到任何卡牌数据")
+    parser = CardYMLParser(yml_dir="yml", extract_extras=args.extras)
+
+    with Profiler.from_args('parse_card_yml', args) as profiler:
+        # 分别统计每个 extract_* 方法的耗时
+        profiler.instrument(parser, ['parse_yml_file'])
+        profiler.instrument_prefix(parser, 'extract_')
+
+        # 先合并结构化记录，再解析其余YML文件
+        if args.stream:
+            with profiler.stage('load stream'):
+                parser.load_stream(args.stream)
+        with profiler.stage('parse'):
+            cards = parser.parse_all_files()
+
+        if cards:
+            # 打印摘要
+            parser.print_summary()
+
+            # 导出为JSON
+            with profiler.stage('export json'):
+                parser.export_to_json(output_file="cards_data.json", indent=2)
+
+            if args.db:
+                with profiler.stage('export sqlite'):
+                    parser.export_to_sqlite(args.db)
+
+            print("\n✓ 解析完成!")
+        else:
+            print("\n✗ 没有解析到任何卡牌数据")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Streaming fetch -> parse -> convert orchestrator.
+
+Links the three batch tools with bounded queues: a card is parsed as soon as
+its snapshot lands and converted as soon as it is parsed. Each stage has its
+own worker count. cards_data.json and bazaar_items.ts are written once at the
+end, in card_links.json order.
+
+With --structured the fetch stage extracts card fields in the browser and its
+records skip the parse stage.
+
+Usage: python pipeline.py [--fetch-workers N] [--parse-workers N] [--convert-workers N]
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+
+from fetch_page import (
+    MAX_BROWSER_RSS_MB, RECYCLE_AFTER_PAGES, SessionWatchdog, extract_name_from_url, get_image_store,
+    load_stream_records, process_url, process_url_structured, run_playwright_cli,
+)
+from parse_card_yml import CardYMLParser
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from convert_card_data import build_item_pools, convert_card, render_items_ts  # noqa: E402
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class Stage:
+    """A pool of worker threads reading from one bounded queue and writing to the next"""
+
+    def __init__(self, name, handler, workers, in_queue, out_queue):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.processed = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+        self._threads = []
+
+    def start(self):
+        for worker_id in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, args=(worker_id,), name=f'{self.name}-{worker_id}', daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self, worker_id):
+        while True:
+            item = self.in_queue.get()
+            if item is _DONE:
+                break
+
+            start = time.perf_counter()
+            try:
+                result = self.handler(worker_id, item)
+            except Exception as e:
+                print(f"✗ [{self.name}] {e}")
+                result = None
+
+            with self._lock:
+                self.busy_seconds += time.perf_counter() - start
+                if result is None:
+                    self.failed += 1
+                else:
+                    self.processed += 1
+
+            if result is not None:
+                self.out_queue.put(result)
+
+    def close_downstream(self, downstream_workers):
+        """Wait for all workers, then tell every downstream worker to stop"""
+        try:
+            self.join()
+        finally:
+            for _ in range(downstream_workers):
+                self.out_queue.put(_DONE)
+
+
+class Pipeline:
+    """fetch -> parse -> convert with bounded queues between stages"""
+
+    def __init__(self, links, fetch_workers=1, parse_workers=2, convert_workers=2,
+                 queue_size=32, extract_extras=False, skip_fetch=False, scope=None,
+                 structured=False, audit_snapshot=False, recycle_pages=RECYCLE_AFTER_PAGES,
+                 max_browser_rss=MAX_BROWSER_RSS_MB):
+        self.links = links
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.convert_workers = convert_workers
+        self.extract_extras = extract_extras
+        self.skip_fetch = skip_fetch
+        self.scope = scope
+        self.structured = structured
+        self.audit_snapshot = audit_snapshot
+        # Structured mode writes no snapshot unless audited: cards already in
+        # the record stream are what a finished fetch looks like
+        self.streamed = load_stream_records() if structured else {}
+
+        project_root = Path(__file__).parent.parent.parent
+        self.yml_dir = Path('yml')
+        self.images_src_dir = Path('images').absolute()
+        self.images_dest_dir = project_root / "client" / "public" / "assets" / "cards"
+        self.output_ts_path = project_root / "server" / "src" / "game" / "config" / "bazaar_items.ts"
+        # Same store instance save_image() writes through
+        self.image_store = get_image_store()
+
+        self.url_queue = queue.Queue(maxsize=queue_size)
+        self.yml_queue = queue.Queue(maxsize=queue_size)
+        self.card_queue = queue.Queue(maxsize=queue_size)
+        self.item_queue = queue.Queue(maxsize=queue_size)
+
+        # One browser session and watchdog per fetch worker
+        self._watchdogs = [
+            SessionWatchdog(self.session_name(worker_id), recycle_pages, max_browser_rss)
+            for worker_id in range(fetch_workers)
+        ]
+
+        # One parser per worker: CardYMLParser keeps the current file on self
+        self._parsers = [
+            CardYMLParser(yml_dir=str(self.yml_dir), extract_extras=extract_extras)
+            for _ in range(parse_workers)
+        ]
+
+        self.fetch_stage = Stage('fetch', self._fetch, fetch_workers, self.url_queue, self.yml_queue)
+        self.parse_stage = Stage('parse', self._parse, parse_workers, self.yml_queue, self.card_queue)
+        self.convert_stage = Stage('convert', self._convert, convert_workers, self.card_queue, self.item_queue)
+
+        self.cards = []
+        self.source_files = []
+        self.items_config = []
+        self._errors = []
+
+    @staticmethod
+    def session_name(worker_id):
+        return f'pipeline_session_{worker_id}'
+
+    def _fetch(self, worker_id, job):
+        index, url = job
+        card_name = extract_name_from_url(url)
+        if self.structured:
+            card = self.streamed.get(card_name)
+            if card is None and not self.skip_fetch:
+                watchdog = self._watchdogs[worker_id]
+                card = watchdog.run(process_url_structured, url, watchdog.session, self.audit_snapshot)
+                return (index, card_name, card) if card else None
+            if card is not None:
+                return index, card_name, card
+
+        yml_file = self.yml_dir / f'{card_name}.yml'
+        if not yml_file.exists() and not self.skip_fetch:
+            watchdog = self._watchdogs[worker_id]
+            watchdog.run(process_url, url, watchdog.session, self.scope)
+        if not yml_file.exists():
+            return None
+        return index, card_name, yml_file
+
+    def _parse(self, worker_id, job):
+        index, card_name, source = job
+        # Structured records were extracted in the browser and need no parsing
+        if isinstance(source, dict):
+            return index, card_name, source
+        card = self._parsers[worker_id].parse_yml_file(source)
+        if not card:
+            return None
+        return index, source.stem, card
+
+    def _convert(self, worker_id, job):
+        index, source_file, card = job
+        # The fetch stage's store updates these hashes in memory as images land
+        item_config = convert_card(card, self.images_src_dir, self.images_dest_dir, self.image_store.hashes)
+        return index, source_file, card, item_config
+
+    def _feed(self):
+        """Queue every link, then any snapshot on disk that no link covers"""
+        # Sentinels go out even if queueing fails, or the stages never finish
+        seen = set()
+        try:
+            try:
+                for index, url in enumerate(self.links):
+                    seen.add(extract_name_from_url(url))
+                    self.url_queue.put((index, url))
+            finally:
+                for _ in range(self.fetch_workers):
+                    self.url_queue.put(_DONE)
+
+            # Leftover snapshots skip the fetch stage entirely
+            self.fetch_stage.join()
+            index = len(self.links)
+            for yml_file in sorted(self.yml_dir.glob('*.yml')):
+                if yml_file.stem not in seen:
+                    self.yml_queue.put((index, yml_file.stem, yml_file))
+                    index += 1
+        finally:
+            for _ in range(self.parse_workers):
+                self.yml_queue.put(_DONE)
+
+    def _coordinate(self, target, *args):
+        """Run a coordinator, keeping its exception for run() to re-raise"""
+        try:
+            target(*args)
+        except BaseException as e:
+            self._errors.append(e)
+
+    def run(self):
+        self.yml_dir.mkdir(exist_ok=True)
+        self.images_dest_dir.mkdir(parents=True, exist_ok=True)
+
+        for stage in (self.fetch_stage, self.parse_stage, self.convert_stage):
+            stage.start()
+
+        coordinators = [
+            threading.Thread(target=self._coordinate, args=(self._feed,), daemon=True),
+            threading.Thread(target=self._coordinate, args=(self.parse_stage.close_downstream, self.convert_workers),
+                             daemon=True),
+            threading.Thread(target=self._coordinate, args=(self.convert_stage.close_downstream, 1), daemon=True),
+        ]
+        for thread in coordinators:
+            thread.start()
+
+        results = []
+        try:
+            while True:
+                result = self.item_queue.get()
+                if result is _DONE:
+                    break
+                results.append(result)
+        finally:
+            if not self.skip_fetch:
+                for worker_id in range(self.fetch_workers):
+                    run_playwright_cli(['close'], self.session_name(worker_id))
+
+        for thread in coordinators:
+            thread.join()
+        if self._errors:
+            raise self._errors[0]
+
+        results.sort(key=lambda r: r[0])
+        for _, source_file, card, item_config in results:
+            self.source_files.append(source_file)
+            self.cards.append(card)
+            self.items_config.append(item_config)
+
+    def finalize(self, json_file='cards_data.json', db_file=None):
+        """Write the aggregate outputs once every card has been converted"""
+        if not self.cards:
+            print("✗ No cards were produced")
+            return False
+
+        with open(json_file, 'w', encoding='utf-8') as f:
+            json.dump(self.cards, f, ensure_ascii=False, indent=2)
+
+        if db_file:
+            from card_store import CardStore
+            with CardStore(db_file) as store:
+                # Drop cards whose snapshot is gone so the DB matches cards_data.json
+                store.replace_all(self.cards, self.source_files)
+
+        with open(self.output_ts_path, 'w', encoding='utf-8') as f:
+            f.write(render_items_ts(self.items_config))
+
+        return True
+
+    def print_summary(self, elapsed):
+        print(f"\n{'='*80}")
+        print("Pipeline completed!")
+        for stage in (self.fetch_stage, self.parse_stage, self.convert_stage):
+            print(f"  {stage.name:<8} workers={stage.workers} ok={stage.processed} "
+                  f"failed={stage.failed} busy={stage.busy_seconds:.1f}s")
+        if not self.skip_fetch:
+            print(f"  Session restarts: {sum(w.restarts for w in self._watchdogs)}")
+        print(f"  Cards: {len(self.cards)}")
+        print(f"  Images: {sum(1 for item in self.items_config if item.get('image'))}")
+        print(f"  Shop pools: {len(build_item_pools(self.items_config))}")
+        print(f"  Output: {self.output_ts_path}")
+        print(f"  Elapsed: {elapsed:.1f}s")
+        print(f"{'='*80}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Streaming fetch -> parse -> convert pipeline")
+    arg_parser.add_argument('--links', default='card_links.json', help="JSON list of card URLs")
+    arg_parser.add_argument('--limit', type=int, default=None, help="Only process the first N links")
+    arg_parser.add_argument('--fetch-workers', type=int, default=1, help="Browser sessions crawling in parallel")
+    arg_parser.add_argument('--parse-workers', type=int, default=2)
+    arg_parser.add_argument('--convert-workers', type=int, default=2)
+    arg_parser.add_argument('--queue-size', type=int, default=32, help="Capacity of each inter-stage queue")
+    arg_parser.add_argument('--skip-fetch', action='store_true', help="Only parse/convert snapshots already on disk")
+    arg_parser.add_argument('--scoped', action='store_true', help="Save only the card-detail subtree of each snapshot")
+    arg_parser.add_argument('--structured', action='store_true', help="Extract card fields in the browser, no snapshot parsing")
+    arg_parser.add_argument('--audit-snapshot', action='store_true', help="With --structured, still save YAML snapshots")
+    arg_parser.add_argument('--extras', action='store_true', help="Also extract deep mechanics and merchant pools")
+    arg_parser.add_argument('--db', help="Also write cards into this SQLite database")
+    arg_parser.add_argument('--recycle-pages', type=int, default=RECYCLE_AFTER_PAGES, metavar='N',
+                            help="Restart each browser session every N pages (0: never)")
+    arg_parser.add_argument('--max-browser-rss', type=int, default=MAX_BROWSER_RSS_MB, metavar='MB',
+                            help="Restart a browser session when its RSS exceeds MB (0: never)")
+    args = arg_parser.parse_args()
+
+    if not os.path.exists(args.links):
+        print(f"✗ File not found: {args.links}")
+        sys.exit(1)
+
+    with open(args.links, 'r', encoding='utf-8') as f:
+        links = json.load(f)
+    if args.limit is not None:
+        links = links[:args.limit]
+
+    print(f"Loaded {len(links)} URLs from {args.links}")
+
+    pipeline = Pipeline(
+        links,
+        fetch_workers=args.fetch_workers,
+        parse_workers=args.parse_workers,
+        convert_workers=args.convert_workers,
+        queue_size=args.queue_size,
+        extract_extras=args.extras,
+        skip_fetch=args.skip_fetch,
+        scope={'with_mechanics': args.extras, 'with_merchants': args.extras} if args.scoped else None,
+        structured=args.structured,
+        audit_snapshot=args.audit_snapshot,
+        recycle_pages=args.recycle_pages,
+        max_browser_rss=args.max_browser_rss,
+    )
+
+    start = time.perf_counter()
+    pipeline.run()
+    ok = pipeline.finalize(db_file=args.db)
+    pipeline.print_summary(time.perf_counter() - start)
+
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
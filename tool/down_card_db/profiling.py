@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Shared --profile support for fetch_page.py, parse_card_yml.py and convert_card_data.py.
+
+With --profile the run is wrapped in cProfile and tracemalloc. Output goes to
+the profile directory (default: down_card_db/profile/, whatever the cwd):
+  <tool>.pstats     raw profile, open with `python -m pstats`
+  <tool>_hot.txt    top-N functions by cumulative and own time
+  <tool>_report.txt wall time and peak memory per stage, time per instrumented step
+Without --profile every hook is a no-op.
+"""
+
+import cProfile
+import functools
+import io
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+# Next to the tools rather than the cwd, so reports land in the ignored directory
+DEFAULT_PROFILE_DIR = Path(__file__).resolve().parent / 'profile'
+
+
+def add_profile_arguments(arg_parser):
+    """Add the shared --profile / --profile-top options"""
+    arg_parser.add_argument('--profile', nargs='?', const=str(DEFAULT_PROFILE_DIR), metavar='DIR',
+                            help=f"Run under cProfile + tracemalloc and write reports to DIR (default: {DEFAULT_PROFILE_DIR})")
+    arg_parser.add_argument('--profile-top', type=int, default=30, metavar='N',
+                            help="Number of hot functions to list in the report")
+
+
+class Profiler:
+    """Collects per-stage wall time / peak memory and per-step timings"""
+
+    def __init__(self, tool, output_dir=None, top=30):
+        self.tool = tool
+        self.enabled = output_dir is not None
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.top = top
+        self.stages = []   # (name, seconds, peak bytes)
+        self.steps = {}    # name -> [calls, seconds]
+        self._profile = None
+
+    @classmethod
+    def from_args(cls, tool, args):
+        return cls(tool, getattr(args, 'profile', None), getattr(args, 'profile_top', 30))
+
+    def __enter__(self):
+        if self.enabled:
+            tracemalloc.start()
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.enabled:
+            self._profile.disable()
+            tracemalloc.stop()
+            self.write_reports()
+        return False
+
+    @contextmanager
+    def stage(self, name):
+        """Time a stage and record its peak traced memory"""
+        if not self.enabled:
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            self.stages.append((name, time.perf_counter() - start, peak))
+
+    def _record(self, name, seconds):
+        entry = self.steps.setdefault(name, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def timed(self, name, func):
+        """Wrap a callable so its calls are counted and timed under name"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._record(name, time.perf_counter() - start)
+        return wrapper
+
+    def instrument(self, target, names):
+        """
+        Replace target.<name> with timed wrappers. Works for module globals
+        (so internal calls are timed too) and for bound methods on an instance.
+        """
+        if not self.enabled:
+            return
+        for name in names:
+            setattr(target, name, self.timed(name, getattr(target, name)))
+
+    def instrument_prefix(self, target, prefix):
+        """Instrument every callable attribute of target starting with prefix"""
+        names = [n for n in dir(target) if n.startswith(prefix) and callable(getattr(target, n))]
+        self.instrument(target, names)
+
+    def hot_functions(self):
+        out = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=out)
+        stats.strip_dirs()
+        out.write(f"Top {self.top} by cumulative time\n")
+        stats.sort_stats('cumulative').print_stats(self.top)
+        out.write(f"\nTop {self.top} by own time\n")
+        stats.sort_stats('tottime').print_stats(self.top)
+        return out.getvalue()
+
+    def summary(self):
+        lines = [f"Profile: {self.tool}", "", "Stages:"]
+        for name, seconds, peak in self.stages:
+            lines.append(f"  {name:<24} {seconds:9.3f}s  peak {peak / 1024 / 1024:8.2f} MB")
+        if self.steps:
+            lines += ["", "Steps:"]
+            for name, (calls, seconds) in sorted(self.steps.items(), key=lambda kv: -kv[1][1]):
+                per_call = seconds / calls * 1000 if calls else 0.0
+                lines.append(f"  {name:<24} {seconds:9.3f}s  {calls:6d} calls  {per_call:8.3f} ms/call")
+        return '\n'.join(lines) + '\n'
+
+    def write_reports(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        pstats_path = self.output_dir / f'{self.tool}.pstats'
+        hot_path = self.output_dir / f'{self.tool}_hot.txt'
+        report_path = self.output_dir / f'{self.tool}_report.txt'
+
+        self._profile.dump_stats(str(pstats_path))
+        with open(hot_path, 'w', encoding='utf-8') as f:
+            f.write(self.hot_functions())
+        summary = self.summary()
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(summary)
+
+        print("\n" + summary)
+        print(f"Profile written to {pstats_path}")
+        print(f"Hot functions: {hot_path}")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Priority recrawl scheduling for fetch_page.py.
+
+crawl_state.json keeps, per card source name: when it was last attempted and
+last fetched successfully, consecutive failures, a fingerprint of the
+normalized card fields (the same in snapshot and structured mode), its hero,
+and when the fingerprint or the hero last changed. Each run ranks every link by
+
+    score = days since last fetch
+          + RECENT_CHANGE_BOOST_DAYS while the card changed in the last RECENT_CHANGE_DAYS
+          - FAILURE_PENALTY_DAYS per consecutive failure
+
+Cards never fetched come first. Failing cards also back off exponentially
+before they are eligible again. URLs are handed out until the link limit or
+the per-run time budget runs out, so a limited crawl window refreshes the
+cards most likely to be stale instead of the same leading slice of
+card_links.json.
+
+    scheduler = RecrawlScheduler.load('crawl_state.json', links, budget_seconds=3600)
+    for url in scheduler:
+        ok = fetch(url)
+        scheduler.record(url, ok, fingerprint, hero)
+    scheduler.save()
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+STATE_FILE = 'crawl_state.json'
+
+# Cards fetched more recently than this are not due yet
+MIN_RECRAWL_AGE_HOURS = 24
+# A card whose content or hero changed recently is likely to change again
+RECENT_CHANGE_DAYS = 14
+RECENT_CHANGE_BOOST_DAYS = 30
+FAILURE_PENALTY_DAYS = 7
+# Failed cards wait BACKOFF_BASE_HOURS * 2**(failures - 1), at most BACKOFF_MAX_HOURS
+BACKOFF_BASE_HOURS = 1
+BACKOFF_MAX_HOURS = 7 * 24
+# Per-card duration estimate before any card has been timed this run
+DEFAULT_CARD_SECONDS = 10.0
+# crawl_state.json is rewritten after this many recorded outcomes (and by save())
+SAVE_EVERY = 25
+# Card fields both fetch modes extract; anything else is ignored when fingerprinting
+FINGERPRINT_FIELDS = ('name', 'name_en', 'types', 'cooldown', 'damage', 'effect', 'tags', 'cost', 'value', 'tier')
+
+DAY = 24 * 3600
+
+
+def card_fingerprint(card):
+    """Stable hash of the normalized card fields"""
+    fields = {key: card.get(key) for key in FINGERPRINT_FIELDS}
+    payload = json.dumps(fields, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RecrawlScheduler:
+    """Ranks links by staleness, recent changes and failures; records fetch outcomes"""
+
+    def __init__(self, links, state=None, state_file=STATE_FILE, limit=None, budget_seconds=None,
+                 min_age_hours=MIN_RECRAWL_AGE_HOURS, source_name=None, known_fetch_time=None, now=None,
+                 save_every=SAVE_EVERY):
+        """
+        Args:
+            links: card URLs (duplicates are dropped)
+            state: crawl_state.json contents, source name -> entry
+            limit: maximum number of URLs to hand out
+            budget_seconds: stop handing out URLs once the estimated next card would overrun this
+            source_name: url -> source name (fetch_page.extract_name_from_url)
+            known_fetch_time: source name -> timestamp of an existing artifact
+                (e.g. the snapshot mtime), for cards fetched before state was kept
+            save_every: rewrite crawl_state.json after this many record() calls;
+                call save() once more when the run ends
+        """
+        self.state = state if state is not None else {}
+        self.state_file = Path(state_file)
+        self.limit = limit
+        self.budget_seconds = budget_seconds
+        self.min_age_hours = min_age_hours
+        self.source_name = source_name or (lambda url: url.rstrip('/').rsplit('/', 1)[-1])
+        self.known_fetch_time = known_fetch_time or (lambda source: None)
+        self.now = time.time() if now is None else now
+        self.save_every = save_every
+
+        self._lock = threading.Lock()
+        self._started = None
+        self._handed_out = 0
+        self._durations = []
+        self._attempt_started = {}
+        self._unsaved = 0
+
+        self.queue = deque(self.rank(list(dict.fromkeys(links))))
+        self.total = len(self.queue)
+
+    @classmethod
+    def load(cls, state_file=STATE_FILE, links=(), **kwargs):
+        state = {}
+        if os.path.exists(state_file):
+            with open(state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        return cls(links, state=state, state_file=state_file, **kwargs)
+
+    def save(self):
+        """Write crawl_state.json atomically"""
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        self._unsaved = 0
+        directory = self.state_file.parent
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_file)
+
+    def last_fetched(self, source):
+        entry = self.state.get(source)
+        if entry and entry.get('last_success'):
+            return entry['last_success']
+        return self.known_fetch_time(source)
+
+    def priority(self, source):
+        """Ranking score (higher first), or None when the card is not due"""
+        entry = self.state.get(source, {})
+        failures = entry.get('failures', 0)
+
+        if failures:
+            backoff = min(BACKOFF_BASE_HOURS * 2 ** (failures - 1), BACKOFF_MAX_HOURS) * 3600
+            if self.now - entry.get('last_attempt', 0) < backoff:
+                return None
+
+        fetched = self.last_fetched(source)
+        if fetched is None:
+            # Never fetched: ahead of everything else, failures still demote
+            return float('inf') if not failures else 1e9 - failures
+        age = self.now - fetched
+        if age < self.min_age_hours * 3600:
+            return None
+
+        score = age / DAY
+        changed = entry.get('changed_at')
+        if changed and self.now - changed < RECENT_CHANGE_DAYS * DAY:
+            score += RECENT_CHANGE_BOOST_DAYS
+        return score - FAILURE_PENALTY_DAYS * failures
+
+    def rank(self, links):
+        """Due links, highest priority first (ties keep card_links.json order)"""
+        scored = []
+        for position, url in enumerate(links):
+            score = self.priority(self.source_name(url))
+            if score is not None:
+                scored.append((-score, position, url))
+        scored.sort()
+        return [url for _, _, url in scored]
+
+    def estimated_card_seconds(self):
+        if not self._durations:
+            return DEFAULT_CARD_SECONDS
+        recent = self._durations[-20:]
+        return sum(recent) / len(recent)
+
+    def remaining_seconds(self):
+        if self.budget_seconds is None:
+            return None
+        elapsed = time.monotonic() - self._started if self._started is not None else 0.0
+        return self.budget_seconds - elapsed
+
+    def next_url(self):
+        """Next URL to fetch, or None when the queue, limit or time budget is exhausted"""
+        with self._lock:
+            if self._started is None:
+                self._started = time.monotonic()
+            if not self.queue:
+                return None
+            if self.limit is not None and self._handed_out >= self.limit:
+                return None
+            remaining = self.remaining_seconds()
+            if remaining is not None and remaining < self.estimated_card_seconds():
+                return None
+
+            url = self.queue.popleft()
+            self._handed_out += 1
+            self._attempt_started[url] = time.monotonic()
+            return url
+
+    def __iter__(self):
+        while True:
+            url = self.next_url()
+            if url is None:
+                return
+            yield url
+
+    def record(self, url, ok, fingerprint=None, hero=None):
+        """Record a fetch outcome; the state is persisted every save_every outcomes"""
+        source = self.source_name(url)
+        now = time.time()
+        with self._lock:
+            started = self._attempt_started.pop(url, None)
+            if started is not None:
+                self._durations.append(time.monotonic() - started)
+
+            entry = self.state.setdefault(source, {})
+            entry['url'] = url
+            entry['last_attempt'] = now
+            if not ok:
+                entry['failures'] = entry.get('failures', 0) + 1
+            else:
+                entry['failures'] = 0
+                entry['last_success'] = now
+                if fingerprint is not None:
+                    changed = 'fingerprint' in entry and entry['fingerprint'] != fingerprint
+                    if 'hero' in entry and entry['hero'] != hero:
+                        changed = True
+                    if changed:
+                        entry['changed_at'] = now
+                    entry['fingerprint'] = fingerprint
+                    entry['hero'] = hero
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self._save()
+
+    def summary(self):
+        """Counts for the end-of-run report"""
+        return {
+            'due': self.total,
+            'handed_out': self._handed_out,
+            'left': len(self.queue),
+            'avg_card_seconds': round(self.estimated_card_seconds(), 2),
+        }